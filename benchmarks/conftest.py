@@ -0,0 +1,112 @@
+import asyncio
+import json
+import random
+from pathlib import Path
+from typing import Any, Coroutine, Iterator, TypeVar
+
+import pytest
+
+from metmuseum.testing import FakeMetServer
+
+ResultT = TypeVar("ResultT")
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+CATALOG_SIZE = 20_000
+
+
+def run_sync(coro: Coroutine[Any, Any, ResultT]) -> ResultT:
+    # decoders never suspend, so driving the coroutine by hand keeps event loop
+    # overhead out of the measurement
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    coro.close()
+    raise RuntimeError("Coroutine suspended.")
+
+
+@pytest.fixture(scope="session")
+def object_data() -> bytes:
+    return (FIXTURES_PATH / "object_45734.json").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def objects_data() -> bytes:
+    ids = list(range(1, 500_001))
+    return json.dumps({"total": len(ids), "objectIDs": ids}).encode()
+
+
+@pytest.fixture(scope="session")
+def search_data() -> bytes:
+    ids = list(range(1, 5_001))
+    return json.dumps({"total": len(ids), "objectIDs": ids}).encode()
+
+
+@pytest.fixture(scope="session")
+def catalog_data(object_data: bytes) -> list[bytes]:
+    # categorical values drawn from pools roughly the size of the Met's own
+    obj = json.loads(object_data)
+    rnd = random.Random(0)
+    payloads: list[bytes] = []
+    for object_id in range(1, CATALOG_SIZE + 1):
+        artist = rnd.randrange(5_000)
+        tags = rnd.sample(range(1_000), 3)
+        payloads.append(
+            json.dumps(
+                obj
+                | {
+                    "objectID": object_id,
+                    "accessionNumber": f"{object_id}.1",
+                    "title": f"Title {object_id}",
+                    "department": f"Department {rnd.randrange(19)}",
+                    "culture": f"Culture {rnd.randrange(300)}",
+                    "classification": f"Classification {rnd.randrange(200)}",
+                    "objectName": f"Object name {rnd.randrange(1_000)}",
+                    "medium": f"Medium {rnd.randrange(3_000)}; ink and color on silk",
+                    "creditLine": f"Credit line {rnd.randrange(3_000)}, Purchase, 1936",
+                    "artistDisplayName": f"Artist {artist}",
+                    "artistDisplayBio": f"Artist {artist} bio, 1600-1700",
+                    "artistNationality": f"Nationality {artist % 100}",
+                    "constituents": [
+                        constituent | {"name": f"Artist {artist}"}
+                        for constituent in obj["constituents"]
+                    ],
+                    "tags": [
+                        {
+                            "term": f"Term {tag}",
+                            "AAT_URL": f"http://vocab.getty.edu/page/aat/{tag}",
+                            "Wikidata_URL": f"https://www.wikidata.org/wiki/Q{tag}",
+                        }
+                        for tag in tags
+                    ],
+                }
+            ).encode()
+        )
+    return payloads
+
+
+@pytest.fixture(scope="session")
+def event_loop_for_benchmarks() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def stub_server_url(
+    event_loop_for_benchmarks: asyncio.AbstractEventLoop, object_data: bytes
+) -> Iterator[str]:
+    obj = json.loads(object_data)
+    server = FakeMetServer(
+        objects=(obj | {"objectID": object_id} for object_id in range(1, 1001))
+    )
+    loop = event_loop_for_benchmarks
+    loop.run_until_complete(server.start())
+
+    yield server.url
+
+    loop.run_until_complete(server.close())
+
+
+__all__ = ("CATALOG_SIZE", "run_sync")
@@ -0,0 +1,55 @@
+import asyncio
+import statistics
+from time import perf_counter
+
+import pytest
+
+from metmuseum import AiohttpGateway, MetMuseum
+
+REQUESTS = 500
+CONCURRENCY = 20
+
+
+@pytest.mark.benchmark(group="facade")
+def test_get_object_throughput(
+    benchmark, event_loop_for_benchmarks: asyncio.AbstractEventLoop, stub_server_url
+):
+    loop = event_loop_for_benchmarks
+    gateway = AiohttpGateway(limit=CONCURRENCY)
+    loop.run_until_complete(gateway.start())
+    metmuseum = MetMuseum(gateway=gateway, base_url=stub_server_url)
+    latencies: list[float] = []
+    elapsed: list[float] = []
+
+    async def get_object(semaphore: asyncio.Semaphore, object_id: int) -> None:
+        async with semaphore:
+            started_at = perf_counter()
+            await metmuseum.get_object(object_id)
+            latencies.append(perf_counter() - started_at)
+
+    async def run() -> None:
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        started_at = perf_counter()
+        await asyncio.gather(
+            *(get_object(semaphore, object_id) for object_id in range(1, REQUESTS + 1))
+        )
+        elapsed.append(perf_counter() - started_at)
+
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(run()), rounds=5, warmup_rounds=1
+        )
+    finally:
+        loop.run_until_complete(gateway.close())
+
+    # pytest-benchmark reports the time of a whole round,
+    # per-request latency percentiles are saved next to it
+    quantiles = statistics.quantiles(latencies, n=100)
+    benchmark.extra_info.update(
+        requests=REQUESTS,
+        concurrency=CONCURRENCY,
+        requests_per_second=len(latencies) / sum(elapsed),
+        latency_p50=quantiles[49],
+        latency_p95=quantiles[94],
+        latency_p99=quantiles[98],
+    )
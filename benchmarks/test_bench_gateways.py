@@ -0,0 +1,116 @@
+import asyncio
+import socket
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from metmuseum import AiohttpGateway, MetMuseum
+from metmuseum.gateways import HttpGateway
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+hypercorn_asyncio = pytest.importorskip("hypercorn.asyncio")
+hypercorn_config = pytest.importorskip("hypercorn.config")
+
+from metmuseum.gateways.httpx_gateway import HttpxGateway  # noqa: E402
+
+REQUESTS = 500
+CONCURRENCY = 100
+CONNECTIONS = 4
+# on loopback there is no round trip to hide, so the stub adds one, otherwise the
+# per-connection limit would never be the bottleneck that multiplexing removes
+LATENCY = 0.02
+
+GATEWAYS: dict[str, Callable[[], HttpGateway]] = {
+    "aiohttp-http1": lambda: AiohttpGateway(limit=CONNECTIONS),
+    "httpx-http1": lambda: HttpxGateway(http2=False, max_connections=CONNECTIONS),
+    # prior knowledge h2c, the stub does not speak tls
+    "httpx-h2c": lambda: HttpxGateway(http1=False, max_connections=CONNECTIONS),
+}
+
+
+@pytest.fixture(scope="session")
+def h2_server_url(
+    event_loop_for_benchmarks: asyncio.AbstractEventLoop, object_data: bytes
+) -> Iterator[str]:
+    # aiohttp.web only speaks http/1.1, so the gateways are compared
+    # against a hypercorn server that serves both http/1.1 and h2c
+    async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        await asyncio.sleep(LATENCY)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": object_data})
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = hypercorn_config.Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.accesslog = None
+    config.errorlog = None
+    # by default a connection is closed after 1000 requests, which would make the
+    # multiplexed run reconnect in the middle of a round
+    config.keep_alive_max_requests = 1_000_000
+
+    async def wait_until_listening() -> None:
+        while True:
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                await asyncio.sleep(0.01)
+                continue
+            writer.close()
+            return
+
+    loop = event_loop_for_benchmarks
+    shutdown = asyncio.Event()
+    task = loop.create_task(
+        hypercorn_asyncio.serve(app, config, shutdown_trigger=shutdown.wait)
+    )
+    loop.run_until_complete(wait_until_listening())
+
+    yield f"http://127.0.0.1:{port}"
+
+    shutdown.set()
+    loop.run_until_complete(task)
+
+
+@pytest.mark.benchmark(group="gateways")
+@pytest.mark.parametrize("gateway_name", GATEWAYS)
+def test_get_object_fan_out(
+    benchmark,
+    event_loop_for_benchmarks: asyncio.AbstractEventLoop,
+    h2_server_url: str,
+    gateway_name: str,
+):
+    loop = event_loop_for_benchmarks
+    gateway = GATEWAYS[gateway_name]()
+    loop.run_until_complete(gateway.start())  # type: ignore[attr-defined]
+    metmuseum = MetMuseum(gateway=gateway, base_url=h2_server_url)
+
+    async def run() -> None:
+        async for result in metmuseum.get_objects(
+            range(1, REQUESTS + 1), concurrency=CONCURRENCY
+        ):
+            assert result.ok
+
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(run()), rounds=3, warmup_rounds=1
+        )
+    finally:
+        loop.run_until_complete(gateway.close())  # type: ignore[attr-defined]
+
+    benchmark.extra_info.update(
+        requests=REQUESTS,
+        concurrency=CONCURRENCY,
+        connections=CONNECTIONS,
+        latency=LATENCY,
+    )
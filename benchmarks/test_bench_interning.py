@@ -0,0 +1,56 @@
+import gc
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from benchmarks.conftest import CATALOG_SIZE, run_sync
+from metmuseum.decoders import Decoder, InterningDecoder, PydanticDecoder, TrustedDecoder
+from metmuseum.types import responses
+
+DECODERS: dict[str, Any] = {
+    "pydantic": PydanticDecoder,
+    "pydantic+interning": lambda: InterningDecoder(PydanticDecoder()),
+    "trusted": TrustedDecoder,
+    "trusted+interning": lambda: InterningDecoder(TrustedDecoder()),
+}
+
+
+def _decode_all(decoder: Decoder, payloads: list[bytes]) -> list[Any]:
+    return [
+        run_sync(decoder.decode(data, responses.ObjectResponse)) for data in payloads
+    ]
+
+
+def _measure_retained_memory(decoder: Decoder, payloads: list[bytes]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objs = _decode_all(decoder, payloads)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(objs) == len(payloads)
+    return retained
+
+
+@pytest.mark.benchmark(group="interning")
+@pytest.mark.parametrize("decoder_name", DECODERS)
+def test_catalog_decode(benchmark, catalog_data: list[bytes], decoder_name: str):
+    # the retained size includes the string table of the interning decoders
+    retained = _measure_retained_memory(DECODERS[decoder_name](), catalog_data)
+
+    objs = benchmark.pedantic(
+        lambda: _decode_all(DECODERS[decoder_name](), catalog_data),
+        rounds=3,
+        warmup_rounds=1,
+    )
+
+    assert len(objs) == CATALOG_SIZE
+    benchmark.extra_info.update(
+        objects=CATALOG_SIZE,
+        retained_bytes=retained,
+        retained_bytes_per_object=retained / CATALOG_SIZE,
+    )
@@ -0,0 +1,64 @@
+import pytest
+
+from benchmarks.conftest import run_sync
+from metmuseum.decoders import Decoder, PydanticDecoder, TrustedDecoder
+from metmuseum.types import responses
+
+DECODERS: dict[str, Decoder] = {
+    "pydantic": PydanticDecoder(),
+    "trusted": TrustedDecoder(),
+}
+
+
+@pytest.mark.benchmark(group="object")
+def test_object_response_validate_json(benchmark, object_data: bytes):
+    obj = benchmark(responses.ObjectResponse.model_validate_json, object_data)
+
+    assert obj.id == 45734
+
+
+@pytest.mark.benchmark(group="objects")
+def test_objects_response_validate_json(benchmark, objects_data: bytes):
+    objects_response = benchmark(
+        responses.ObjectsResponse.model_validate_json, objects_data
+    )
+
+    assert objects_response.total == 500_000
+
+
+@pytest.mark.benchmark(group="objects")
+def test_compact_objects_response_validate_json(benchmark, objects_data: bytes):
+    objects_response = benchmark(
+        responses.CompactObjectsResponse.model_validate_json, objects_data
+    )
+
+    assert len(objects_response.ids) == 500_000
+
+
+@pytest.mark.benchmark(group="search")
+def test_search_response_validate_json(benchmark, search_data: bytes):
+    search_response = benchmark(
+        responses.SearchResponse.model_validate_json, search_data
+    )
+
+    assert search_response.total == 5_000
+
+
+@pytest.mark.benchmark(group="decoders")
+@pytest.mark.parametrize("decoder_name", DECODERS)
+@pytest.mark.parametrize(
+    "type_, payload",
+    [
+        (responses.ObjectResponse, "object_data"),
+        (responses.ObjectsResponse, "objects_data"),
+        (responses.CompactObjectsResponse, "objects_data"),
+    ],
+    ids=("object", "objects", "compact-objects"),
+)
+def test_decoder(benchmark, request, decoder_name: str, type_, payload: str):
+    decoder = DECODERS[decoder_name]
+    data = request.getfixturevalue(payload)
+
+    result = benchmark(lambda: run_sync(decoder.decode(data, type_)))
+
+    assert isinstance(result, type_)
@@ -0,0 +1,56 @@
+import asyncio
+import os
+from time import process_time
+
+import pytest
+
+from metmuseum.decoders import Decoder, ProcessPoolDecoder, PydanticDecoder
+from metmuseum.types import responses
+
+
+@pytest.mark.benchmark(group="process-pool")
+@pytest.mark.parametrize("decoder_name", ("pydantic", "process-pool"))
+@pytest.mark.parametrize(
+    "type_, payload, count",
+    [
+        (responses.CompactObjectsResponse, "objects_data", 8),
+        (responses.ObjectResponse, "object_data", 500),
+    ],
+    ids=("compact-objects", "object"),
+)
+def test_bulk_decode(
+    benchmark,
+    request,
+    event_loop_for_benchmarks: asyncio.AbstractEventLoop,
+    decoder_name: str,
+    type_,
+    payload: str,
+    count: int,
+):
+    loop = event_loop_for_benchmarks
+    data = request.getfixturevalue(payload)
+    decoder: Decoder = (
+        PydanticDecoder()
+        if decoder_name == "pydantic"
+        else ProcessPoolDecoder(max_workers=os.cpu_count(), min_size=0)
+    )
+    cpu_times: list[float] = []
+
+    async def run() -> None:
+        started_at = process_time()
+        await asyncio.gather(*(decoder.decode(data, type_) for _ in range(count)))
+        cpu_times.append(process_time() - started_at)
+
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(run()), rounds=5, warmup_rounds=1
+        )
+    finally:
+        if isinstance(decoder, ProcessPoolDecoder):
+            loop.run_until_complete(decoder.close())
+
+    # the cpu time of this process only, i.e. how long the event loop was busy,
+    # the workers are not included
+    benchmark.extra_info.update(
+        payloads=count, loop_cpu_time_per_payload=min(cpu_times) / count
+    )
@@ -0,0 +1,67 @@
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+from benchmarks.conftest import CATALOG_SIZE
+from metmuseum.types import records, responses
+
+CONVERTERS: dict[str, Callable[[responses.ObjectResponse], Any]] = {
+    "model": lambda obj: obj,
+    "record": records.ObjectRecord.from_response,
+}
+
+
+@pytest.fixture(scope="module")
+def catalog(catalog_data: list[bytes]) -> list[responses.ObjectResponse]:
+    return [responses.ObjectResponse.model_validate_json(data) for data in catalog_data]
+
+
+def _measure_retained_memory(
+    convert: Callable[[responses.ObjectResponse], Any], catalog_data: list[bytes]
+) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objs = [
+            convert(responses.ObjectResponse.model_validate_json(data))
+            for data in catalog_data
+        ]
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(objs) == len(catalog_data)
+    return retained
+
+
+@pytest.mark.benchmark(group="records")
+@pytest.mark.parametrize("converter_name", CONVERTERS)
+def test_catalog_memory(
+    benchmark,
+    catalog_data: list[bytes],
+    catalog: list[responses.ObjectResponse],
+    converter_name: str,
+):
+    convert = CONVERTERS[converter_name]
+    retained = _measure_retained_memory(convert, catalog_data)
+
+    objs = benchmark(lambda: [convert(obj) for obj in catalog])
+
+    assert len(objs) == CATALOG_SIZE
+    benchmark.extra_info.update(
+        objects=CATALOG_SIZE,
+        retained_bytes=retained,
+        retained_bytes_per_object=retained / CATALOG_SIZE,
+    )
+
+
+@pytest.mark.benchmark(group="records")
+def test_record_to_response(benchmark, catalog: list[responses.ObjectResponse]):
+    catalog_records = [records.ObjectRecord.from_response(obj) for obj in catalog]
+
+    objs = benchmark(lambda: [record.to_response() for record in catalog_records])
+
+    assert objs == catalog
@@ -0,0 +1,77 @@
+import asyncio
+import json
+import statistics
+from time import perf_counter
+from typing import Iterator
+
+import pytest
+
+from metmuseum import AiohttpGateway, MetMuseum
+from metmuseum.testing import FakeMetServer, constant_latency
+
+OBJECTS = 200
+PAGE_SIZE = 20
+# time a gallery view spends rendering a page before it asks for the next one
+RENDER_TIME = 0.02
+
+
+@pytest.fixture(scope="module")
+def slow_server_url(
+    event_loop_for_benchmarks: asyncio.AbstractEventLoop, object_data: bytes
+) -> Iterator[str]:
+    obj = json.loads(object_data)
+    server = FakeMetServer(
+        objects=(obj | {"objectID": object_id} for object_id in range(1, OBJECTS + 1)),
+        latency=constant_latency(0.01),
+    )
+    loop = event_loop_for_benchmarks
+    loop.run_until_complete(server.start())
+
+    yield server.url
+
+    loop.run_until_complete(server.close())
+
+
+@pytest.mark.benchmark(group="search-pages")
+@pytest.mark.parametrize("prefetch", (0, 1, 2))
+def test_scroll_search_results(
+    benchmark,
+    event_loop_for_benchmarks: asyncio.AbstractEventLoop,
+    slow_server_url: str,
+    prefetch: int,
+):
+    loop = event_loop_for_benchmarks
+    gateway = AiohttpGateway()
+    loop.run_until_complete(gateway.start())
+    metmuseum = MetMuseum(gateway=gateway, base_url=slow_server_url)
+    first_page_times: list[float] = []
+    page_waits: list[float] = []
+
+    async def scroll() -> None:
+        started_at = perf_counter()
+        async with await metmuseum.search_objects(
+            "quail", page_size=PAGE_SIZE, prefetch=prefetch, use_store=False
+        ) as pages:
+            for number in range(len(pages)):
+                requested_at = perf_counter()
+                page = await pages.get_page(number)
+                page_waits.append(perf_counter() - requested_at)
+                if number == 0:
+                    first_page_times.append(perf_counter() - started_at)
+                assert len(page.objects) == PAGE_SIZE
+                await asyncio.sleep(RENDER_TIME)
+
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(scroll()), rounds=3, warmup_rounds=1
+        )
+    finally:
+        loop.run_until_complete(gateway.close())
+
+    # how long a scrolling user waits for each page after the previous one
+    benchmark.extra_info.update(
+        pages=OBJECTS // PAGE_SIZE,
+        time_to_first_page=min(first_page_times),
+        page_wait_p50=statistics.median(page_waits),
+        page_wait_max=max(page_waits),
+    )
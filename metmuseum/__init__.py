@@ -1,4 +1,6 @@
 from metmuseum.gateways import AiohttpGateway
 from metmuseum.metmuseum import MetMuseum
+from metmuseum.search_pages import SearchPages
+from metmuseum.sync_metmuseum import SyncMetMuseum
 
-__all__ = "MetMuseum", "AiohttpGateway"
+__all__ = "MetMuseum", "SearchPages", "SyncMetMuseum", "AiohttpGateway"
@@ -1,3 +1,15 @@
+from typing import Any
+
 from metmuseum.adapters.aiohttp_response_adapter import AiohttpResponseAdapter
 
+
+def __getattr__(name: str) -> Any:
+    # httpx is an optional dependency, so its adapter is imported on first use
+    if name == "HttpxResponseAdapter":
+        from metmuseum.adapters.httpx_response_adapter import HttpxResponseAdapter
+
+        return HttpxResponseAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ("AiohttpResponseAdapter",)
@@ -1,16 +1,22 @@
 from http import HTTPStatus
-from typing import Mapping
+from typing import AsyncIterator, Callable, Mapping
 
 from aiohttp import ClientResponse
 
 from metmuseum.responses.response import Response
+from metmuseum.types.exceptions import ResponseTooLargeException
 
 
 class AiohttpResponseAdapter(Response):
-    __slots__ = ("__response",)
+    __slots__ = ("__response", "__on_chunk_received")
 
-    def __init__(self, raw_response: ClientResponse):
+    def __init__(
+        self,
+        raw_response: ClientResponse,
+        on_chunk_received: Callable[[int], None] | None = None,
+    ):
         self.__response = raw_response
+        self.__on_chunk_received = on_chunk_received
 
     @property
     def raw_response(self) -> ClientResponse:
@@ -28,8 +34,29 @@ class AiohttpResponseAdapter(Response):
     def headers(self) -> Mapping[str, str]:
         return self.raw_response.headers
 
-    async def read(self) -> bytes:
-        return await self.raw_response.read()
+    async def read(self, max_size: int | None = None) -> bytes:
+        if max_size is None:
+            data = await self.raw_response.read()
+            if self.__on_chunk_received is not None:
+                self.__on_chunk_received(len(data))
+            return data
+
+        content_length = self.raw_response.content_length
+        if content_length is not None and content_length > max_size:
+            raise ResponseTooLargeException(self.url, max_size)
+
+        data = bytearray()
+        async for chunk in self.iter_chunks():
+            data += chunk
+            if len(data) > max_size:
+                raise ResponseTooLargeException(self.url, max_size)
+        return bytes(data)
+
+    async def iter_chunks(self, size: int = 65536) -> AsyncIterator[bytes]:
+        async for chunk in self.raw_response.content.iter_chunked(size):
+            if self.__on_chunk_received is not None:
+                self.__on_chunk_received(len(chunk))
+            yield chunk
 
 
 __all__ = ("AiohttpResponseAdapter",)
@@ -0,0 +1,52 @@
+from http import HTTPStatus
+from typing import AsyncIterator, Mapping
+
+from httpx import Response as HttpxResponse
+
+from metmuseum.responses.response import Response
+from metmuseum.types.exceptions import ResponseTooLargeException
+
+
+class HttpxResponseAdapter(Response):
+    __slots__ = ("__response",)
+
+    def __init__(self, raw_response: HttpxResponse):
+        self.__response = raw_response
+
+    @property
+    def raw_response(self) -> HttpxResponse:
+        return self.__response
+
+    @property
+    def url(self) -> str:
+        return str(self.raw_response.url)
+
+    @property
+    def status_code(self) -> HTTPStatus:
+        return HTTPStatus(self.raw_response.status_code)
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self.raw_response.headers
+
+    async def read(self, max_size: int | None = None) -> bytes:
+        if max_size is None:
+            return await self.raw_response.aread()
+
+        content_length = self.raw_response.headers.get("Content-Length")
+        if content_length is not None and int(content_length) > max_size:
+            raise ResponseTooLargeException(self.url, max_size)
+
+        data = bytearray()
+        async for chunk in self.iter_chunks():
+            data += chunk
+            if len(data) > max_size:
+                raise ResponseTooLargeException(self.url, max_size)
+        return bytes(data)
+
+    async def iter_chunks(self, size: int = 65536) -> AsyncIterator[bytes]:
+        async for chunk in self.raw_response.aiter_bytes(size):
+            yield chunk
+
+
+__all__ = ("HttpxResponseAdapter",)
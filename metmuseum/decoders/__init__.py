@@ -0,0 +1,16 @@
+from metmuseum.decoders.decoder import Decoder
+from metmuseum.decoders.interning_decoder import INTERNED_FIELDS, InterningDecoder
+from metmuseum.decoders.object_ids_stream_decoder import ObjectIdsStreamDecoder
+from metmuseum.decoders.process_pool_decoder import ProcessPoolDecoder
+from metmuseum.decoders.pydantic_decoder import PydanticDecoder
+from metmuseum.decoders.trusted_decoder import TrustedDecoder
+
+__all__ = (
+    "Decoder",
+    "INTERNED_FIELDS",
+    "InterningDecoder",
+    "ObjectIdsStreamDecoder",
+    "ProcessPoolDecoder",
+    "PydanticDecoder",
+    "TrustedDecoder",
+)
@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from typing import Protocol, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class Decoder(Protocol):
+    @abstractmethod
+    async def decode(self, data: bytes, type_: type[ModelT]) -> ModelT: ...
+
+
+__all__ = ("Decoder",)
@@ -0,0 +1,127 @@
+import types
+from typing import Any, Iterable, Mapping, get_args, get_origin
+
+from pydantic import BaseModel
+
+from metmuseum.decoders.decoder import Decoder, ModelT
+from metmuseum.decoders.pydantic_decoder import PydanticDecoder
+from metmuseum.types import models, responses
+from metmuseum.utils import StringTable
+
+PlanT = tuple[tuple[str, ...], tuple[str, ...]]
+
+# categorical fields that repeat across objects; unique values such as titles
+# or urls of the object itself would only grow the table
+INTERNED_FIELDS: Mapping[type[BaseModel], frozenset[str]] = {
+    responses.ObjectResponse: frozenset(
+        (
+            "department",
+            "repository",
+            "culture",
+            "period",
+            "dynasty",
+            "reign",
+            "classification",
+            "name",
+            "medium",
+            "credit_line",
+            "artist_role",
+            "artist_display_name",
+            "artist_display_bio",
+            "artist_nationality",
+            "artist_gender",
+            "geography_type",
+            "city",
+            "state",
+            "county",
+            "country",
+            "region",
+            "subregion",
+            "rights_and_reproduction",
+        )
+    ),
+    models.ObjectTag: frozenset(("term", "aat", "wikidata")),
+    models.ObjectConstituent: frozenset(("role", "name", "gender", "ulan", "wikidata")),
+    models.ObjectDimensions: frozenset(("element", "dimension_type")),
+    models.ObjectMeasurementsElement: frozenset(("name", "description")),
+}
+
+
+def _get_model_types(annotation: Any) -> Iterable[type[BaseModel]]:
+    origin = get_origin(annotation)
+    if origin is not None or isinstance(annotation, types.UnionType):
+        for arg in get_args(annotation):
+            yield from _get_model_types(arg)
+        return
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+
+
+class InterningDecoder(Decoder):
+    # Replaces repeated strings of decoded models with a single shared instance,
+    # so a large in-memory catalog keeps one copy of every department, culture,
+    # tag term, etc. Models are updated in place after the wrapped decoder runs.
+    __slots__ = ("__decoder", "__table", "__fields", "__plans")
+
+    def __init__(
+        self,
+        decoder: Decoder | None = None,
+        table: StringTable | None = None,
+        fields: Mapping[type[BaseModel], Iterable[str]] | None = None,
+    ):
+        self.__decoder = decoder or PydanticDecoder()
+        self.__table = StringTable() if table is None else table
+        self.__fields = {
+            type_: frozenset(names)
+            for type_, names in (INTERNED_FIELDS if fields is None else fields).items()
+        }
+        self.__plans: dict[type[BaseModel], PlanT] = dict()
+
+    @property
+    def table(self) -> StringTable:
+        return self.__table
+
+    def __get_plan(self, type_: type[BaseModel]) -> PlanT:
+        plan = self.__plans.get(type_)
+        if plan is not None:
+            return plan
+
+        names = self.__fields.get(type_, frozenset())
+        interned: list[str] = []
+        nested: list[str] = []
+        for name, field in type_.model_fields.items():
+            if name in names:
+                interned.append(name)
+            elif any(
+                any(self.__get_plan(model_type))
+                for model_type in _get_model_types(field.annotation)
+            ):
+                nested.append(name)
+
+        plan = self.__plans[type_] = (tuple(interned), tuple(nested))
+        return plan
+
+    def __intern_value(self, value: Any) -> None:
+        if isinstance(value, BaseModel):
+            self.intern(value)
+        elif isinstance(value, tuple):
+            for item in value:
+                self.__intern_value(item)
+
+    def intern(self, obj: ModelT) -> ModelT:
+        interned, nested = self.__get_plan(type(obj))
+        values = obj.__dict__
+        intern = self.__table.intern
+        for name in interned:
+            value = values[name]
+            if type(value) is str:
+                values[name] = intern(value)
+        for name in nested:
+            self.__intern_value(values[name])
+        return obj
+
+    async def decode(self, data: bytes, type_: type[ModelT]) -> ModelT:
+        return self.intern(await self.__decoder.decode(data, type_))
+
+
+__all__ = ("INTERNED_FIELDS", "InterningDecoder")
@@ -0,0 +1,95 @@
+from enum import Enum, auto
+
+from metmuseum.types import models
+
+
+class _State(Enum):
+    SEEK_KEY = auto()
+    SEEK_VALUE = auto()
+    IN_ARRAY = auto()
+    DONE = auto()
+
+
+class ObjectIdsStreamDecoder:
+    # Incrementally extracts "objectIDs" from a {"total": ..., "objectIDs": [...]}
+    # body, so ids can be used before the whole multi-megabyte body is received.
+    __slots__ = "__buffer", "__state"
+
+    KEY = b'"objectIDs"'
+    SEPARATORS = b" \t\r\n:"
+
+    def __init__(self):
+        self.__buffer = bytearray()
+        self.__state = _State.SEEK_KEY
+
+    @property
+    def is_done(self) -> bool:
+        return self.__state is _State.DONE
+
+    @staticmethod
+    def __parse_ids(data: bytes | bytearray) -> models.ObjectIds:
+        if not data.strip():
+            return models.ObjectIds()
+        try:
+            return models.ObjectIds(map(int, data.split(b",")))
+        except ValueError as e:
+            raise ValueError(f"Invalid objectIDs element: {e}") from e
+
+    def feed(self, chunk: bytes) -> models.ObjectIds:
+        buffer = self.__buffer
+        buffer += chunk
+
+        if self.__state is _State.SEEK_KEY:
+            index = buffer.find(self.KEY)
+            if index < 0:
+                # keep a possible prefix of the key that was split by the chunk
+                del buffer[: max(0, len(buffer) - len(self.KEY) + 1)]
+                return models.ObjectIds()
+            del buffer[: index + len(self.KEY)]
+            self.__state = _State.SEEK_VALUE
+
+        if self.__state is _State.SEEK_VALUE:
+            index = 0
+            while index < len(buffer) and buffer[index] in self.SEPARATORS:
+                index += 1
+            del buffer[:index]
+            if not buffer:
+                return models.ObjectIds()
+
+            if buffer[0:1] == b"[":
+                del buffer[:1]
+                self.__state = _State.IN_ARRAY
+            elif len(buffer) < 4 and b"null".startswith(buffer):
+                return models.ObjectIds()
+            elif buffer.startswith(b"null"):
+                buffer.clear()
+                self.__state = _State.DONE
+                return models.ObjectIds()
+            else:
+                raise ValueError("objectIDs must be an array or null.")
+
+        if self.__state is _State.IN_ARRAY:
+            end = buffer.find(b"]")
+            if end >= 0:
+                ids = self.__parse_ids(buffer[:end])
+                buffer.clear()
+                self.__state = _State.DONE
+                return ids
+
+            # the last element may be incomplete, so only parse up to the last comma
+            end = buffer.rfind(b",")
+            if end < 0:
+                return models.ObjectIds()
+            ids = self.__parse_ids(buffer[:end])
+            del buffer[: end + 1]
+            return ids
+
+        buffer.clear()
+        return models.ObjectIds()
+
+    def close(self) -> None:
+        if self.__state is not _State.DONE:
+            raise ValueError("Response ended before objectIDs was complete.")
+
+
+__all__ = ("ObjectIdsStreamDecoder",)
@@ -0,0 +1,138 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from types import TracebackType
+from typing import Any, Self
+
+from pydantic import BaseModel, ValidationError
+
+from metmuseum.decoders.decoder import Decoder, ModelT
+
+BatchT = list[tuple[bytes, type[BaseModel]]]
+
+
+def _decode_batch(batch: BatchT) -> list[BaseModel | None]:
+    results: list[BaseModel | None] = []
+    for data, type_ in batch:
+        try:
+            results.append(type_.model_validate_json(data))
+        except ValidationError:
+            # the caller decodes the payload again to raise the error itself,
+            # so nothing depends on exceptions surviving pickling
+            results.append(None)
+    return results
+
+
+class ProcessPoolDecoder(Decoder):
+    __slots__ = (
+        "__max_workers",
+        "__batch_size",
+        "__batch_delay",
+        "__min_size",
+        "__executor",
+        "__pending",
+        "__flush_handle",
+        "__batches",
+    )
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        batch_size: int = 16,
+        batch_delay: float = 0.001,
+        min_size: int = 64 * 1024,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero.")
+
+        self.__max_workers = max_workers
+        self.__batch_size = batch_size
+        self.__batch_delay = batch_delay
+        self.__min_size = min_size
+
+        self.__executor: Executor | None = None
+        self.__pending: list[tuple[bytes, type[BaseModel], asyncio.Future[Any]]] = []
+        self.__flush_handle: asyncio.TimerHandle | None = None
+        self.__batches = 0
+
+    @property
+    def batches(self) -> int:
+        return self.__batches
+
+    def __get_executor(self) -> Executor:
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.__max_workers)
+        return self.__executor
+
+    async def decode(self, data: bytes, type_: type[ModelT]) -> ModelT:
+        # for small bodies the round trip to a worker, and unpickling the model
+        # here, costs more than validating in place
+        if len(data) < self.__min_size:
+            return type_.model_validate_json(data)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self.__pending.append((data, type_, future))
+        if len(self.__pending) >= self.__batch_size:
+            self.__flush()
+        elif self.__flush_handle is None:
+            self.__flush_handle = loop.call_later(self.__batch_delay, self.__flush)
+
+        result = await future
+        if result is None:
+            return type_.model_validate_json(data)
+        return result
+
+    def __flush(self) -> None:
+        if self.__flush_handle is not None:
+            self.__flush_handle.cancel()
+            self.__flush_handle = None
+
+        pending, self.__pending = self.__pending, []
+        if not pending:
+            return
+
+        batch: BatchT = [(data, type_) for data, type_, _ in pending]
+        futures = [future for _, _, future in pending]
+        self.__batches += 1
+
+        loop = asyncio.get_running_loop()
+        decoded = loop.run_in_executor(self.__get_executor(), _decode_batch, batch)
+        decoded.add_done_callback(lambda done: self.__resolve(futures, done))
+
+    @staticmethod
+    def __resolve(
+        futures: list[asyncio.Future[Any]], done: asyncio.Future[list[Any]]
+    ) -> None:
+        exception = None if done.cancelled() else done.exception()
+        for index, future in enumerate(futures):
+            # the caller may have been cancelled while the batch was decoded
+            if future.done():
+                continue
+            if done.cancelled():
+                future.cancel()
+            elif exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(done.result()[index])
+
+    async def close(self) -> None:
+        if self.__flush_handle is not None:
+            self.__flush()
+
+        executor, self.__executor = self.__executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+__all__ = ("ProcessPoolDecoder",)
@@ -0,0 +1,11 @@
+from metmuseum.decoders.decoder import Decoder, ModelT
+
+
+class PydanticDecoder(Decoder):
+    __slots__ = ()
+
+    async def decode(self, data: bytes, type_: type[ModelT]) -> ModelT:
+        return type_.model_validate_json(data)
+
+
+__all__ = ("PydanticDecoder",)
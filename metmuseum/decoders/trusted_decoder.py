@@ -0,0 +1,154 @@
+import json
+import types
+from datetime import datetime
+from typing import Annotated, Any, Callable, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from metmuseum.decoders.decoder import Decoder, ModelT
+from metmuseum.types import models
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+ConverterT = Callable[[Any], Any]
+FieldPlanT = tuple[str, str, ConverterT | None, bool, Any]
+
+_MISSING = object()
+_object_setattr = object.__setattr__
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _nullable(converter: ConverterT) -> ConverterT:
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        return converter(value)
+
+    return convert
+
+
+class TrustedDecoder(Decoder):
+    # Builds models with model_construct-like speed: "before" field validators
+    # still run, so empty strings and ints are normalized as usual, but values
+    # are not type-checked and constraints are not enforced. Use it only for
+    # payloads that are known to be valid, e.g. from the Met API or a local store.
+    __slots__ = ("__plans",)
+
+    def __init__(self):
+        self.__plans: dict[type[BaseModel], tuple[FieldPlanT, ...]] = dict()
+
+    def __get_plan(self, type_: type[BaseModel]) -> tuple[FieldPlanT, ...]:
+        plan = self.__plans.get(type_)
+        if plan is not None:
+            return plan
+
+        validators: dict[str, list[ConverterT]] = dict()
+        decorators = type_.__pydantic_decorators__.field_validators.values()
+        for decorator in reversed(tuple(decorators)):
+            if decorator.info.mode != "before":
+                continue
+            for field_name in decorator.info.fields:
+                validators.setdefault(field_name, []).append(decorator.func)
+
+        plan_items: list[FieldPlanT] = []
+        for name, field in type_.model_fields.items():
+            converter = self.__get_converter(field.annotation)
+            field_validators = validators.get(name)
+            if field_validators:
+                converter = self.__chain(field_validators, converter)
+
+            default = _MISSING
+            if not field.is_required():
+                default = field.get_default(call_default_factory=True)
+            plan_items.append(
+                (name, field.alias or name, converter, field.is_required(), default)
+            )
+
+        plan = self.__plans[type_] = tuple(plan_items)
+        return plan
+
+    @staticmethod
+    def __chain(
+        validators: list[ConverterT], converter: ConverterT | None
+    ) -> ConverterT:
+        if len(validators) == 1 and converter is None:
+            return validators[0]
+
+        def convert(value: Any) -> Any:
+            for validator in validators:
+                value = validator(value)
+            if converter is not None:
+                return converter(value)
+            return value
+
+        return convert
+
+    def __get_converter(self, annotation: Any) -> ConverterT | None:
+        origin = get_origin(annotation)
+
+        if origin is Annotated:
+            return self.__get_converter(get_args(annotation)[0])
+
+        if origin is Union or origin is types.UnionType:
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(args) != 1:
+                return None
+            converter = self.__get_converter(args[0])
+            return None if converter is None else _nullable(converter)
+
+        if origin is tuple:
+            item_converter = self.__get_converter(get_args(annotation)[0])
+            if item_converter is None:
+                return tuple
+            return lambda value: tuple(map(item_converter, value))
+
+        if isinstance(annotation, type):
+            if issubclass(annotation, BaseModel):
+                return lambda value: self.construct(value, annotation)
+            if issubclass(annotation, models.ObjectIds):
+                return models.ObjectIds
+            if issubclass(annotation, datetime):
+                return datetime.fromisoformat
+
+        return None
+
+    def construct(self, values: dict[str, Any], type_: type[ModelT]) -> ModelT:
+        fields: dict[str, Any] = dict()
+        fields_set: set[str] = set()
+
+        for name, alias, converter, required, default in self.__get_plan(type_):
+            value = values.get(alias, _MISSING)
+            if value is _MISSING:
+                if required:
+                    raise ValueError(f"{type_.__name__}: missing field {alias!r}")
+                fields[name] = default
+                continue
+
+            fields[name] = value if converter is None else converter(value)
+            fields_set.add(name)
+
+        if type_.__private_attributes__:
+            return type_.model_construct(_fields_set=fields_set, **fields)
+
+        # the same state that model_construct sets up, without its per-call
+        # bookkeeping for extras, private attributes and aliases
+        obj = type_.__new__(type_)
+        _object_setattr(obj, "__dict__", fields)
+        _object_setattr(obj, "__pydantic_fields_set__", fields_set)
+        _object_setattr(obj, "__pydantic_extra__", None)
+        _object_setattr(obj, "__pydantic_private__", None)
+        return obj
+
+    async def decode(self, data: bytes, type_: type[ModelT]) -> ModelT:
+        return self.construct(_loads(data), type_)
+
+
+__all__ = ("TrustedDecoder",)
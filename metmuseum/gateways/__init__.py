@@ -1,4 +1,36 @@
+from typing import Any
+
 from metmuseum.gateways.aiohttp_gateway import AiohttpGateway
+from metmuseum.gateways.aiohttp_request_trace import AiohttpRequestTrace
+from metmuseum.gateways.caching_gateway import CachingGateway
+from metmuseum.gateways.circuit_breaker import CircuitBreaker, CircuitState
+from metmuseum.gateways.circuit_breaker_gateway import CircuitBreakerGateway
 from metmuseum.gateways.http_gateway import HttpGateway
+from metmuseum.gateways.rate_limited_gateway import RateLimitedGateway
+from metmuseum.gateways.rate_limiter import RateLimiter
+from metmuseum.gateways.retry_policy import RetryPolicy
+from metmuseum.gateways.retrying_gateway import RetryingGateway
+
+
+def __getattr__(name: str) -> Any:
+    # httpx is an optional dependency, so its gateway is imported on first use
+    if name == "HttpxGateway":
+        from metmuseum.gateways.httpx_gateway import HttpxGateway
+
+        return HttpxGateway
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = "HttpGateway", "AiohttpGateway"
+__all__ = (
+    "HttpGateway",
+    "AiohttpGateway",
+    "AiohttpRequestTrace",
+    "CachingGateway",
+    "CircuitBreaker",
+    "CircuitBreakerGateway",
+    "CircuitState",
+    "RateLimitedGateway",
+    "RateLimiter",
+    "RetryingGateway",
+    "RetryPolicy",
+)
@@ -1,25 +1,104 @@
 from contextlib import asynccontextmanager
 from http import HTTPMethod
 from logging import getLogger
-from typing import AsyncIterator, Mapping
+from types import TracebackType
+from typing import AsyncIterator, Mapping, Self
 from uuid import uuid4
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from metmuseum.adapters import AiohttpResponseAdapter
+from metmuseum.gateways.aiohttp_request_trace import AiohttpRequestTrace
 from metmuseum.gateways.http_gateway import HttpGateway
+from metmuseum.metrics import MetricsSink
 from metmuseum.responses import Response
 
 
 class AiohttpGateway(HttpGateway):
-    __slots__ = ("__logger",)
+    __slots__ = (
+        "__logger",
+        "__session",
+        "__limit",
+        "__limit_per_host",
+        "__keepalive_timeout",
+        "__ttl_dns_cache",
+        "__timeout",
+        "__metrics",
+    )
 
-    def __init__(self):
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: int | None = 10,
+        timeout: ClientTimeout | None = None,
+        metrics: MetricsSink | None = None,
+    ):
         self.__logger = getLogger("metmuseum:aiohttp-gateway")
+        self.__session: ClientSession | None = None
+
+        self.__limit = limit
+        self.__limit_per_host = limit_per_host
+        self.__keepalive_timeout = keepalive_timeout
+        self.__ttl_dns_cache = ttl_dns_cache
+        self.__timeout = timeout
+        self.__metrics = metrics
+
+    @property
+    def is_started(self) -> bool:
+        return self.__session is not None and not self.__session.closed
+
+    def __create_session(self) -> ClientSession:
+        connector = TCPConnector(
+            limit=self.__limit,
+            limit_per_host=self.__limit_per_host,
+            keepalive_timeout=self.__keepalive_timeout,
+            use_dns_cache=self.__ttl_dns_cache is not None,
+            ttl_dns_cache=self.__ttl_dns_cache,
+        )
+        trace_configs = (
+            None
+            if self.__metrics is None
+            else [AiohttpRequestTrace.create_trace_config()]
+        )
+        if self.__timeout is None:
+            return ClientSession(connector=connector, trace_configs=trace_configs)
+        return ClientSession(
+            connector=connector, timeout=self.__timeout, trace_configs=trace_configs
+        )
+
+    async def start(self) -> None:
+        if self.is_started:
+            return
+        self.__session = self.__create_session()
+
+    async def close(self) -> None:
+        session, self.__session = self.__session, None
+        if session is not None:
+            await session.close()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
 
     @asynccontextmanager
     async def get_session(self) -> AsyncIterator[ClientSession]:
-        async with ClientSession() as session:
+        if self.__session is not None and not self.__session.closed:
+            yield self.__session
+            return
+
+        # the gateway was not started, so fall back to a short-lived session
+        # that is closed together with the request
+        async with self.__create_session() as session:
             yield session
 
     @asynccontextmanager
@@ -35,13 +114,26 @@ class AiohttpGateway(HttpGateway):
             req_id = uuid4()
             self.__logger.debug(f"Request: {req_id} {method.value} {url}")
 
-            async with session.request(
-                method.value, url, params=query, data=data, headers=headers
-            ) as raw_response:
-                response = AiohttpResponseAdapter(raw_response)
-                self.__logger.debug(f"Response: {req_id} {response.status_code}")
+            trace = None if self.__metrics is None else AiohttpRequestTrace()
+            try:
+                async with session.request(
+                    method.value,
+                    url,
+                    params=query,
+                    data=data,
+                    headers=headers,
+                    trace_request_ctx=trace,
+                ) as raw_response:
+                    response = AiohttpResponseAdapter(
+                        raw_response,
+                        None if trace is None else trace.on_chunk_received,
+                    )
+                    self.__logger.debug(f"Response: {req_id} {response.status_code}")
 
-                yield response
+                    yield response
+            finally:
+                if trace is not None and self.__metrics is not None:
+                    trace.report(self.__metrics)
 
 
 __all__ = ("AiohttpGateway",)
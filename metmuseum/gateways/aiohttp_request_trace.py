@@ -0,0 +1,149 @@
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, TraceConfig
+
+from metmuseum.metrics import MetricsSink
+
+
+class AiohttpRequestTrace:
+    __slots__ = (
+        "started_at",
+        "dns_started_at",
+        "dns",
+        "queued_started_at",
+        "queued",
+        "connect_started_at",
+        "connect",
+        "connection_reused",
+        "headers_received_at",
+        "last_chunk_at",
+        "bytes_sent",
+        "bytes_received",
+    )
+
+    def __init__(self) -> None:
+        self.started_at: float | None = None
+        self.dns_started_at: float | None = None
+        self.dns: float | None = None
+        self.queued_started_at: float | None = None
+        self.queued: float | None = None
+        self.connect_started_at: float | None = None
+        self.connect: float | None = None
+        self.connection_reused = False
+        self.headers_received_at: float | None = None
+        self.last_chunk_at: float | None = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    @property
+    def ttfb(self) -> float | None:
+        if self.started_at is None or self.headers_received_at is None:
+            return None
+        return self.headers_received_at - self.started_at
+
+    @property
+    def body(self) -> float | None:
+        if self.headers_received_at is None or self.last_chunk_at is None:
+            return None
+        return self.last_chunk_at - self.headers_received_at
+
+    @property
+    def total(self) -> float | None:
+        if self.started_at is None or self.headers_received_at is None:
+            return None
+        return (self.last_chunk_at or self.headers_received_at) - self.started_at
+
+    def on_chunk_received(self, size: int) -> None:
+        self.last_chunk_at = perf_counter()
+        self.bytes_received += size
+
+    def report(self, metrics: MetricsSink) -> None:
+        for name, value in (
+            ("http.queued", self.queued),
+            ("http.dns", self.dns),
+            ("http.connect", self.connect),
+            ("http.ttfb", self.ttfb),
+            ("http.body", self.body),
+            ("http.total", self.total),
+        ):
+            if value is not None:
+                metrics.observe(name, value)
+
+        if self.started_at is not None:
+            # the mean of a 0/1 series is the connection reuse ratio
+            metrics.observe("http.connection_reused", float(self.connection_reused))
+            metrics.observe("http.bytes_sent", self.bytes_sent)
+            metrics.observe("http.bytes_received", self.bytes_received)
+
+    @classmethod
+    def create_trace_config(cls) -> TraceConfig:
+        trace_config = TraceConfig()
+
+        def on(signal: Any):
+            def register(func: Any) -> Any:
+                async def handler(
+                    session: ClientSession, ctx: SimpleNamespace, params: Any
+                ) -> None:
+                    # requests made without a trace, e.g. by another gateway
+                    # sharing the session, are ignored
+                    if isinstance(ctx.trace_request_ctx, cls):
+                        func(ctx.trace_request_ctx, params)
+
+                signal.append(handler)
+                return func
+
+            return register
+
+        @on(trace_config.on_request_start)
+        def on_request_start(trace: AiohttpRequestTrace, params: Any) -> None:
+            trace.started_at = perf_counter()
+
+        @on(trace_config.on_connection_queued_start)
+        def on_queued_start(trace: AiohttpRequestTrace, params: Any) -> None:
+            trace.queued_started_at = perf_counter()
+
+        @on(trace_config.on_connection_queued_end)
+        def on_queued_end(trace: AiohttpRequestTrace, params: Any) -> None:
+            if trace.queued_started_at is not None:
+                trace.queued = perf_counter() - trace.queued_started_at
+
+        @on(trace_config.on_dns_resolvehost_start)
+        def on_dns_start(trace: AiohttpRequestTrace, params: Any) -> None:
+            trace.dns_started_at = perf_counter()
+
+        @on(trace_config.on_dns_resolvehost_end)
+        def on_dns_end(trace: AiohttpRequestTrace, params: Any) -> None:
+            if trace.dns_started_at is not None:
+                trace.dns = perf_counter() - trace.dns_started_at
+
+        # aiohttp reports tcp connect and tls handshake as one step
+        @on(trace_config.on_connection_create_start)
+        def on_connect_start(trace: AiohttpRequestTrace, params: Any) -> None:
+            trace.connect_started_at = perf_counter()
+
+        @on(trace_config.on_connection_create_end)
+        def on_connect_end(trace: AiohttpRequestTrace, params: Any) -> None:
+            if trace.connect_started_at is not None:
+                trace.connect = perf_counter() - trace.connect_started_at
+
+        @on(trace_config.on_connection_reuseconn)
+        def on_reuse(trace: AiohttpRequestTrace, params: Any) -> None:
+            trace.connection_reused = True
+
+        @on(trace_config.on_request_chunk_sent)
+        def on_chunk_sent(trace: AiohttpRequestTrace, params: Any) -> None:
+            trace.bytes_sent += len(params.chunk)
+
+        @on(trace_config.on_request_end)
+        def on_request_end(trace: AiohttpRequestTrace, params: Any) -> None:
+            trace.headers_received_at = perf_counter()
+
+        # aiohttp only signals received chunks from ClientResponse.read(), so the
+        # body is counted by the response adapter through on_chunk_received()
+
+        return trace_config
+
+
+__all__ = ("AiohttpRequestTrace",)
@@ -0,0 +1,176 @@
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from http import HTTPMethod, HTTPStatus
+from time import monotonic
+from typing import AsyncIterator, Mapping
+from urllib.parse import urlsplit
+
+from metmuseum.gateways.http_gateway import HttpGateway
+from metmuseum.responses import BufferedResponse, Response, buffer_response
+
+CacheKeyT = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+class CachingGateway(HttpGateway):
+    __slots__ = (
+        "__gateway",
+        "__max_entries",
+        "__max_bytes",
+        "__max_entry_size",
+        "__ttl",
+        "__ttls",
+        "__entries",
+        "__nbytes",
+        "__hits",
+        "__misses",
+    )
+
+    def __init__(
+        self,
+        gateway: HttpGateway,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float | None = 300.0,
+        ttls: Mapping[str, float | None] | None = None,
+        max_entry_size: int | None = None,
+    ):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be greater than zero.")
+        if max_entry_size is not None and max_entry_size < 1:
+            raise ValueError("max_entry_size must be greater than zero.")
+
+        self.__gateway = gateway
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        # a body that could never be stored is not buffered either
+        self.__max_entry_size = (
+            max_bytes if max_entry_size is None else min(max_entry_size, max_bytes)
+        )
+        self.__ttl = ttl
+
+        # path patterns are checked in order, the first match wins
+        self.__ttls = tuple(
+            (re.compile(pattern), pattern_ttl)
+            for pattern, pattern_ttl in (ttls or {}).items()
+        )
+
+        self.__entries: OrderedDict[CacheKeyT, tuple[float, BufferedResponse]] = (
+            OrderedDict()
+        )
+        self.__nbytes = 0
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def gateway(self) -> HttpGateway:
+        return self.__gateway
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    @property
+    def nbytes(self) -> int:
+        return self.__nbytes
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get_ttl(self, url: str) -> float | None:
+        path = urlsplit(url).path
+        for pattern, ttl in self.__ttls:
+            if pattern.search(path):
+                return ttl
+        return self.__ttl
+
+    @staticmethod
+    def get_key(
+        method: HTTPMethod, url: str, query: Mapping[str, str] | None
+    ) -> CacheKeyT:
+        return method.value, url, tuple(sorted((query or {}).items()))
+
+    def __get(self, key: CacheKeyT) -> BufferedResponse | None:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at <= monotonic():
+            self.__delete(key)
+            return None
+
+        self.__entries.move_to_end(key)
+        return response
+
+    def __put(self, key: CacheKeyT, response: BufferedResponse, ttl: float) -> None:
+        size = len(response.data)
+        if size > self.__max_bytes:
+            return
+
+        self.__delete(key)
+        self.__entries[key] = monotonic() + ttl, response
+        self.__nbytes += size
+
+        while (
+            len(self.__entries) > self.__max_entries or self.__nbytes > self.__max_bytes
+        ):
+            self.__delete(next(iter(self.__entries)))
+
+    def __delete(self, key: CacheKeyT) -> None:
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__nbytes -= len(entry[1].data)
+
+    def invalidate(self, url: str) -> int:
+        keys = [key for key in self.__entries if key[1] == url]
+        for key in keys:
+            self.__delete(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__nbytes = 0
+
+    @asynccontextmanager
+    async def make_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        query: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> AsyncIterator[Response]:
+        ttl = self.get_ttl(url)
+        if method != HTTPMethod.GET or data is not None or ttl == 0:
+            async with self.__gateway.make_request(
+                method=method, url=url, query=query, headers=headers, data=data
+            ) as response:
+                yield response
+            return
+
+        key = self.get_key(method, url, query)
+        cached = self.__get(key)
+        if cached is not None:
+            self.__hits += 1
+            yield cached
+            return
+
+        self.__misses += 1
+        async with self.__gateway.make_request(
+            method=method, url=url, query=query, headers=headers, data=data
+        ) as response:
+            buffered = await buffer_response(response, self.__max_entry_size)
+            if (
+                isinstance(buffered, BufferedResponse)
+                and buffered.status_code == HTTPStatus.OK
+            ):
+                self.__put(key, buffered, float("inf") if ttl is None else ttl)
+            yield buffered
+
+
+__all__ = ("CachingGateway",)
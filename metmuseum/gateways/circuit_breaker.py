@@ -0,0 +1,112 @@
+from enum import StrEnum
+from time import monotonic
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    __slots__ = (
+        "__failure_threshold",
+        "__recovery_timeout",
+        "__half_open_max_requests",
+        "__state",
+        "__failures",
+        "__opened_at",
+        "__trials",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_requests: int = 1,
+    ):
+        if failure_threshold < 1 or half_open_max_requests < 1:
+            raise ValueError(
+                "failure_threshold and half_open_max_requests must be greater than zero."
+            )
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout must not be negative.")
+
+        self.__failure_threshold = failure_threshold
+        self.__recovery_timeout = recovery_timeout
+        self.__half_open_max_requests = half_open_max_requests
+
+        self.__state = CircuitState.CLOSED
+        self.__failures = 0
+        self.__opened_at = 0.0
+        self.__trials = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self.__state is CircuitState.OPEN and self.retry_after == 0:
+            return CircuitState.HALF_OPEN
+        return self.__state
+
+    @property
+    def failures(self) -> int:
+        return self.__failures
+
+    @property
+    def retry_after(self) -> float:
+        if self.__state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.__opened_at + self.__recovery_timeout - monotonic())
+
+    def __open(self) -> None:
+        self.__state = CircuitState.OPEN
+        self.__opened_at = monotonic()
+        self.__trials = 0
+
+    def acquire(self) -> CircuitState | None:
+        # returns the state the request was let through in, or None to fail fast
+        state = self.state
+        if state is CircuitState.OPEN:
+            return None
+        if state is CircuitState.HALF_OPEN:
+            if self.__trials >= self.__half_open_max_requests:
+                return None
+            self.__state = CircuitState.HALF_OPEN
+            self.__trials += 1
+        return state
+
+    def release(self, acquired_in: CircuitState, ok: bool | None) -> None:
+        # ok is None when the outcome says nothing about the upstream,
+        # e.g. the request was cancelled
+        if acquired_in is CircuitState.HALF_OPEN:
+            self.__trials = max(0, self.__trials - 1)
+
+        if ok is None:
+            return
+
+        if ok:
+            if self.__state is CircuitState.CLOSED or (
+                self.__state is CircuitState.HALF_OPEN
+                and acquired_in is CircuitState.HALF_OPEN
+            ):
+                self.__state = CircuitState.CLOSED
+                self.__failures = 0
+            return
+
+        if acquired_in is CircuitState.HALF_OPEN:
+            if self.__state is CircuitState.HALF_OPEN:
+                self.__open()
+            return
+
+        # failures of requests sent before the circuit opened are not counted again
+        if self.__state is CircuitState.CLOSED:
+            self.__failures += 1
+            if self.__failures >= self.__failure_threshold:
+                self.__open()
+
+    def reset(self) -> None:
+        self.__state = CircuitState.CLOSED
+        self.__failures = 0
+        self.__trials = 0
+
+
+__all__ = ("CircuitBreaker", "CircuitState")
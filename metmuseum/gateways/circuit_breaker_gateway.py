@@ -0,0 +1,152 @@
+import re
+from contextlib import asynccontextmanager
+from http import HTTPMethod, HTTPStatus
+from logging import getLogger
+from typing import AsyncIterator, Callable, Iterable, Mapping
+from urllib.parse import urlsplit
+
+from metmuseum.gateways.circuit_breaker import CircuitBreaker, CircuitState
+from metmuseum.gateways.http_gateway import HttpGateway
+from metmuseum.gateways.transport_exceptions import get_transport_exceptions
+from metmuseum.responses import Response
+from metmuseum.types.exceptions import CircuitOpenException
+
+_ID_PATTERN = re.compile(r"/\d+(?=/|$)")
+
+
+def get_endpoint(url: str) -> str:
+    # /objects/1 and /objects/2 share a circuit, /objects and /search do not
+    parts = urlsplit(url)
+    # files, such as images, share one circuit per host
+    if "." in parts.path.rsplit("/", 1)[-1]:
+        return parts.netloc
+    return parts.netloc + _ID_PATTERN.sub("/{id}", parts.path)
+
+
+class CircuitBreakerGateway(HttpGateway):
+    __slots__ = (
+        "__logger",
+        "__gateway",
+        "__failure_threshold",
+        "__recovery_timeout",
+        "__half_open_max_requests",
+        "__failure_statuses",
+        "__failure_exceptions",
+        "__get_endpoint",
+        "__max_endpoints",
+        "__breakers",
+    )
+
+    def __init__(
+        self,
+        gateway: HttpGateway,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_requests: int = 1,
+        failure_statuses: Iterable[int] = (
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        ),
+        failure_exceptions: tuple[type[BaseException], ...] | None = None,
+        endpoint: Callable[[str], str] = get_endpoint,
+        max_endpoints: int = 1024,
+    ):
+        # fail early on invalid settings instead of on the first request
+        CircuitBreaker(failure_threshold, recovery_timeout, half_open_max_requests)
+        if max_endpoints < 1:
+            raise ValueError("max_endpoints must be greater than zero.")
+
+        self.__logger = getLogger("metmuseum:circuit-breaker-gateway")
+        self.__gateway = gateway
+        self.__failure_threshold = failure_threshold
+        self.__recovery_timeout = recovery_timeout
+        self.__half_open_max_requests = half_open_max_requests
+        self.__failure_statuses = frozenset(map(int, failure_statuses))
+        self.__failure_exceptions = failure_exceptions
+        self.__get_endpoint = endpoint
+        self.__max_endpoints = max_endpoints
+        self.__breakers: dict[str, CircuitBreaker] = {}
+
+    @property
+    def gateway(self) -> HttpGateway:
+        return self.__gateway
+
+    @property
+    def failure_exceptions(self) -> tuple[type[BaseException], ...]:
+        # by default the transport errors of the aiohttp and httpx gateways
+        if self.__failure_exceptions is None:
+            return get_transport_exceptions()
+        return self.__failure_exceptions
+
+    @property
+    def breakers(self) -> Mapping[str, CircuitBreaker]:
+        return self.__breakers
+
+    def get_state(self, url: str) -> CircuitState:
+        breaker = self.__breakers.get(self.__get_endpoint(url))
+        return CircuitState.CLOSED if breaker is None else breaker.state
+
+    def reset(self) -> None:
+        self.__breakers.clear()
+
+    def __evict(self) -> None:
+        # a closed circuit without failures holds no state, so it can be dropped
+        for endpoint in [
+            endpoint
+            for endpoint, breaker in self.__breakers.items()
+            if breaker.state is CircuitState.CLOSED and breaker.failures == 0
+        ]:
+            del self.__breakers[endpoint]
+
+    def __get_breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self.__breakers.get(endpoint)
+        if breaker is None:
+            if len(self.__breakers) >= self.__max_endpoints:
+                self.__evict()
+            breaker = self.__breakers[endpoint] = CircuitBreaker(
+                self.__failure_threshold,
+                self.__recovery_timeout,
+                self.__half_open_max_requests,
+            )
+        return breaker
+
+    @asynccontextmanager
+    async def make_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        query: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> AsyncIterator[Response]:
+        endpoint = self.__get_endpoint(url)
+        breaker = self.__get_breaker(endpoint)
+
+        acquired_in = breaker.acquire()
+        if acquired_in is None:
+            raise CircuitOpenException(url, endpoint, breaker.retry_after)
+
+        ok: bool | None = None
+        try:
+            try:
+                async with self.__gateway.make_request(
+                    method=method, url=url, query=query, headers=headers, data=data
+                ) as response:
+                    ok = response.status_code not in self.__failure_statuses
+                    yield response
+            except self.failure_exceptions:
+                # a body that breaks off while it is being read is a failure too
+                ok = False
+                raise
+        finally:
+            state = breaker.state
+            breaker.release(acquired_in, ok)
+            if breaker.state is not state:
+                self.__logger.debug(
+                    f"Circuit: {endpoint} {state.value} -> {breaker.state.value}"
+                )
+
+
+__all__ = ("CircuitBreakerGateway", "get_endpoint")
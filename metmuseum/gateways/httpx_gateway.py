@@ -0,0 +1,125 @@
+from contextlib import asynccontextmanager
+from http import HTTPMethod
+from logging import getLogger
+from types import TracebackType
+from typing import AsyncIterator, Mapping, Self
+from uuid import uuid4
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "HttpxGateway requires httpx, install metmuseum[httpx] to use it."
+    ) from e
+
+from metmuseum.adapters.httpx_response_adapter import HttpxResponseAdapter
+from metmuseum.gateways.http_gateway import HttpGateway
+from metmuseum.responses import Response
+
+
+class HttpxGateway(HttpGateway):
+    __slots__ = (
+        "__logger",
+        "__client",
+        "__http1",
+        "__http2",
+        "__max_connections",
+        "__keepalive_expiry",
+        "__timeout",
+    )
+
+    def __init__(
+        self,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: int = 10,
+        keepalive_expiry: float = 15.0,
+        timeout: httpx.Timeout | float | None = 30.0,
+    ):
+        self.__logger = getLogger("metmuseum:httpx-gateway")
+        self.__client: httpx.AsyncClient | None = None
+
+        # with http1=False the gateway speaks http/2 with prior knowledge,
+        # which is the only way to use it over plain http (h2c)
+        self.__http1 = http1
+        self.__http2 = http2
+        self.__max_connections = max_connections
+        self.__keepalive_expiry = keepalive_expiry
+        self.__timeout = timeout
+
+    @property
+    def is_started(self) -> bool:
+        return self.__client is not None and not self.__client.is_closed
+
+    def __create_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=self.__max_connections,
+            max_keepalive_connections=self.__max_connections,
+            keepalive_expiry=self.__keepalive_expiry,
+        )
+        return httpx.AsyncClient(
+            http1=self.__http1,
+            http2=self.__http2,
+            limits=limits,
+            timeout=self.__timeout,
+        )
+
+    async def start(self) -> None:
+        if self.is_started:
+            return
+        self.__client = self.__create_client()
+
+    async def close(self) -> None:
+        client, self.__client = self.__client, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @asynccontextmanager
+    async def get_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self.__client is not None and not self.__client.is_closed:
+            yield self.__client
+            return
+
+        # the gateway was not started, so fall back to a short-lived client
+        # that is closed together with the request
+        async with self.__create_client() as client:
+            yield client
+
+    @asynccontextmanager
+    async def make_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        query: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> AsyncIterator[Response]:
+        async with self.get_client() as client:
+            req_id = uuid4()
+            self.__logger.debug(f"Request: {req_id} {method.value} {url}")
+
+            async with client.stream(
+                method.value, url, params=query, headers=headers, content=data
+            ) as raw_response:
+                response = HttpxResponseAdapter(raw_response)
+                self.__logger.debug(
+                    f"Response: {req_id} {response.status_code} "
+                    f"{raw_response.http_version}"
+                )
+
+                yield response
+
+
+__all__ = ("HttpxGateway",)
@@ -0,0 +1,42 @@
+from contextlib import asynccontextmanager
+from http import HTTPMethod
+from typing import AsyncIterator, Mapping
+
+from metmuseum.gateways.http_gateway import HttpGateway
+from metmuseum.gateways.rate_limiter import RateLimiter
+from metmuseum.responses import Response
+
+
+class RateLimitedGateway(HttpGateway):
+    __slots__ = "__gateway", "__limiter"
+
+    def __init__(self, gateway: HttpGateway, limiter: RateLimiter):
+        self.__gateway = gateway
+        self.__limiter = limiter
+
+    @property
+    def gateway(self) -> HttpGateway:
+        return self.__gateway
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self.__limiter
+
+    @asynccontextmanager
+    async def make_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        query: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> AsyncIterator[Response]:
+        await self.__limiter.acquire()
+
+        async with self.__gateway.make_request(
+            method=method, url=url, query=query, headers=headers, data=data
+        ) as response:
+            yield response
+
+
+__all__ = ("RateLimitedGateway",)
@@ -0,0 +1,89 @@
+import asyncio
+from time import monotonic
+
+
+class RateLimiter:
+    __slots__ = (
+        "__rate",
+        "__burst",
+        "__tokens",
+        "__updated_at",
+        "__tickets",
+        "__acquired",
+        "__delayed",
+        "__total_wait_time",
+    )
+
+    def __init__(self, rate: float = 80.0, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero.")
+        if burst < 1:
+            raise ValueError("burst must be greater than zero.")
+
+        self.__rate = rate
+        self.__burst = burst
+        self.__tokens = float(burst)
+        self.__updated_at = monotonic()
+        self.__tickets = 0
+
+        self.__acquired = 0
+        self.__delayed = 0
+        self.__total_wait_time = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    @property
+    def burst(self) -> int:
+        return self.__burst
+
+    @property
+    def acquired(self) -> int:
+        return self.__acquired
+
+    @property
+    def delayed(self) -> int:
+        return self.__delayed
+
+    @property
+    def total_wait_time(self) -> float:
+        return self.__total_wait_time
+
+    def __refill(self) -> None:
+        now = monotonic()
+        self.__tokens = min(
+            self.__burst, self.__tokens + (now - self.__updated_at) * self.__rate
+        )
+        self.__updated_at = now
+
+    async def acquire(self) -> float:
+        # the token is reserved synchronously, so concurrent tasks queue up
+        # behind each other without a lock: a negative balance is the debt
+        # that the waiting tasks are sleeping off
+        self.__refill()
+        self.__tokens -= 1
+        self.__tickets += 1
+        ticket = self.__tickets
+
+        delay = 0.0 if self.__tokens >= 0 else -self.__tokens / self.__rate
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # only the last caller in the queue gives its token back: the
+                # ones behind it keep their wake-up times, so refunding an earlier
+                # slot would let a new caller share one with them
+                if ticket == self.__tickets:
+                    self.__tickets -= 1
+                    self.__refill()
+                    self.__tokens = min(self.__burst, self.__tokens + 1)
+                raise
+            self.__delayed += 1
+            self.__total_wait_time += delay
+
+        self.__acquired += 1
+        return delay
+
+
+__all__ = ("RateLimiter",)
@@ -0,0 +1,100 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Iterable, Mapping
+
+from metmuseum.gateways.transport_exceptions import get_transport_exceptions
+
+
+class RetryPolicy:
+    __slots__ = (
+        "__max_attempts",
+        "__base_delay",
+        "__max_delay",
+        "__jitter",
+        "__retry_statuses",
+        "__retry_exceptions",
+        "__respect_retry_after",
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        ),
+        retry_exceptions: tuple[type[BaseException], ...] | None = None,
+        respect_retry_after: bool = True,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be greater than zero.")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("base_delay and max_delay must not be negative.")
+
+        self.__max_attempts = max_attempts
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        self.__jitter = jitter
+        self.__retry_statuses = frozenset(map(int, retry_statuses))
+        self.__retry_exceptions = retry_exceptions
+        self.__respect_retry_after = respect_retry_after
+
+    @property
+    def max_attempts(self) -> int:
+        return self.__max_attempts
+
+    @property
+    def retry_exceptions(self) -> tuple[type[BaseException], ...]:
+        # by default the transport errors of the aiohttp and httpx gateways
+        if self.__retry_exceptions is None:
+            return get_transport_exceptions()
+        return self.__retry_exceptions
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.__retry_statuses
+
+    def is_retryable_exception(self, exception: BaseException) -> bool:
+        return isinstance(exception, self.retry_exceptions)
+
+    @staticmethod
+    def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+        value = headers.get("Retry-After")
+        if value is None:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get_delay(self, attempt: int, headers: Mapping[str, str] | None = None) -> float:
+        if self.__respect_retry_after and headers is not None:
+            retry_after = self.parse_retry_after(headers)
+            # a server asking for a day-long pause must not stall the caller
+            if retry_after is not None:
+                return min(retry_after, self.__max_delay)
+
+        # exponential backoff with "full jitter", so that clients that failed
+        # together do not retry together
+        delay = min(self.__max_delay, self.__base_delay * 2 ** (attempt - 1))
+        if self.__jitter:
+            return random.uniform(0, delay)
+        return delay
+
+
+__all__ = ("RetryPolicy",)
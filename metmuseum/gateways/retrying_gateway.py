@@ -0,0 +1,96 @@
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from http import HTTPMethod
+from logging import getLogger
+from typing import AsyncIterator, Mapping
+
+from metmuseum.gateways.http_gateway import HttpGateway
+from metmuseum.gateways.retry_policy import RetryPolicy
+from metmuseum.responses import Response, buffer_response
+
+
+class RetryingGateway(HttpGateway):
+    __slots__ = "__logger", "__gateway", "__policy", "__max_buffer_size"
+
+    def __init__(
+        self,
+        gateway: HttpGateway,
+        policy: RetryPolicy | None = None,
+        max_buffer_size: int = 1024 * 1024,
+    ):
+        if max_buffer_size < 0:
+            raise ValueError("max_buffer_size must not be negative.")
+
+        self.__logger = getLogger("metmuseum:retrying-gateway")
+        self.__gateway = gateway
+        self.__policy = policy or RetryPolicy()
+        self.__max_buffer_size = max_buffer_size
+
+    @property
+    def gateway(self) -> HttpGateway:
+        return self.__gateway
+
+    @property
+    def policy(self) -> RetryPolicy:
+        return self.__policy
+
+    @property
+    def max_buffer_size(self) -> int:
+        return self.__max_buffer_size
+
+    @asynccontextmanager
+    async def make_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        query: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> AsyncIterator[Response]:
+        attempt = 1
+        while True:
+            async with AsyncExitStack() as stack:
+                try:
+                    response = await stack.enter_async_context(
+                        self.__gateway.make_request(
+                            method=method,
+                            url=url,
+                            query=query,
+                            headers=headers,
+                            data=data,
+                        )
+                    )
+                    # a body that breaks off is only retried while it is read
+                    # within the attempt, so bodies up to max_buffer_size are
+                    # buffered here; larger ones stream and their errors are raised
+                    if attempt < self.__policy.max_attempts and (
+                        not self.__policy.is_retryable_status(response.status_code)
+                    ):
+                        response = await buffer_response(
+                            response, self.__max_buffer_size
+                        )
+                except self.__policy.retry_exceptions as e:
+                    if attempt >= self.__policy.max_attempts:
+                        raise
+                    delay = self.__policy.get_delay(attempt)
+                    self.__logger.debug(
+                        f"Retry: {method.value} {url} attempt {attempt} failed "
+                        f"with {e!r}, retrying in {delay:.3f}s"
+                    )
+                else:
+                    if attempt >= self.__policy.max_attempts or (
+                        not self.__policy.is_retryable_status(response.status_code)
+                    ):
+                        yield response
+                        return
+                    delay = self.__policy.get_delay(attempt, response.headers)
+                    self.__logger.debug(
+                        f"Retry: {method.value} {url} attempt {attempt} failed "
+                        f"with {response.status_code}, retrying in {delay:.3f}s"
+                    )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+__all__ = ("RetryingGateway",)
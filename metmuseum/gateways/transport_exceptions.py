@@ -0,0 +1,25 @@
+import sys
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+_AIOHTTP_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    ClientConnectionError,
+    ClientPayloadError,
+    TimeoutError,
+)
+
+
+def get_transport_exceptions() -> tuple[type[BaseException], ...]:
+    # httpx is optional and only imported along with HttpxGateway, so its errors
+    # are included once it is loaded instead of importing it here
+    httpx = sys.modules.get("httpx")
+    if httpx is None:
+        return _AIOHTTP_EXCEPTIONS
+    return _AIOHTTP_EXCEPTIONS + (
+        httpx.NetworkError,
+        httpx.TimeoutException,
+        httpx.RemoteProtocolError,
+    )
+
+
+__all__ = ("get_transport_exceptions",)
@@ -0,0 +1,4 @@
+from metmuseum.indexes.department_catalog import DepartmentCatalog
+from metmuseum.indexes.local_search_index import LocalSearchIndex
+
+__all__ = ("DepartmentCatalog", "LocalSearchIndex")
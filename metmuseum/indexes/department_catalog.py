@@ -0,0 +1,114 @@
+from time import monotonic
+from typing import Awaitable, Callable
+
+from metmuseum.types import models, responses
+from metmuseum.utils import SingleFlight
+
+LoaderT = Callable[[], Awaitable[responses.DepartmentsResponse]]
+IndexT = tuple[dict[int, models.DepartmentElement], dict[str, models.DepartmentElement]]
+
+
+class DepartmentCatalog:
+    __slots__ = (
+        "__load",
+        "__ttl",
+        "__single_flight",
+        "__response",
+        "__by_id",
+        "__by_name",
+        "__loaded_at",
+        "__loads",
+        "__generation",
+    )
+
+    def __init__(self, load: LoaderT, ttl: float | None = 3600.0):
+        self.__load = load
+        self.__ttl = ttl
+        self.__single_flight: SingleFlight[int, responses.DepartmentsResponse] = (
+            SingleFlight()
+        )
+
+        self.__response: responses.DepartmentsResponse | None = None
+        self.__by_id: dict[int, models.DepartmentElement] = {}
+        self.__by_name: dict[str, models.DepartmentElement] = {}
+        self.__loaded_at = 0.0
+        self.__loads = 0
+        self.__generation = 0
+
+    @property
+    def ttl(self) -> float | None:
+        return self.__ttl
+
+    @property
+    def loads(self) -> int:
+        return self.__loads
+
+    @property
+    def is_fresh(self) -> bool:
+        if self.__response is None:
+            return False
+        return self.__ttl is None or monotonic() - self.__loaded_at < self.__ttl
+
+    @staticmethod
+    def __index(response: responses.DepartmentsResponse) -> IndexT:
+        # names are matched case-insensitively, like the Met API matches queries
+        by_id = {department.id: department for department in response.departments}
+        by_name = {
+            department.display_name.casefold(): department
+            for department in response.departments
+        }
+        return by_id, by_name
+
+    async def __get_index(self) -> IndexT:
+        if self.is_fresh:
+            return self.__by_id, self.__by_name
+        response = await self.refresh()
+        # a load that overlapped invalidate() was not stored, so the lookup is
+        # answered from the response it returned instead of the stored index
+        if response is not self.__response:
+            return self.__index(response)
+        return self.__by_id, self.__by_name
+
+    async def __load_departments(self, generation: int) -> responses.DepartmentsResponse:
+        response = await self.__load()
+        # the catalog was invalidated while loading, so the result may be stale
+        if generation != self.__generation:
+            return response
+
+        self.__by_id, self.__by_name = self.__index(response)
+        self.__response = response
+        self.__loaded_at = monotonic()
+        self.__loads += 1
+        return response
+
+    async def refresh(self) -> responses.DepartmentsResponse:
+        # concurrent callers share one request while the departments are loading,
+        # a load started before invalidate() is not shared with later callers
+        generation = self.__generation
+        return await self.__single_flight.do(
+            generation, lambda: self.__load_departments(generation)
+        )
+
+    def invalidate(self) -> None:
+        self.__response = None
+        self.__generation += 1
+
+    async def get_departments(self) -> responses.DepartmentsResponse:
+        if self.__response is not None and self.is_fresh:
+            return self.__response
+        return await self.refresh()
+
+    async def get(self, department_id: int) -> models.DepartmentElement | None:
+        by_id, _ = await self.__get_index()
+        return by_id.get(department_id)
+
+    async def get_by_name(self, name: str) -> models.DepartmentElement | None:
+        _, by_name = await self.__get_index()
+        return by_name.get(name.casefold())
+
+    async def get_id(self, name: str) -> int | None:
+        department = await self.get_by_name(name)
+        return None if department is None else department.id
+
+
+__all__ = ("DepartmentCatalog",)
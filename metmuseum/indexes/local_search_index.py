@@ -0,0 +1,250 @@
+import re
+from functools import reduce
+from typing import Iterable, NamedTuple, Sequence
+
+from metmuseum.types import models, responses
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+_FIELDS = "any", "title", "tags", "artist_or_culture", "medium", "geo_location"
+
+
+def _tokenize(*texts: str | None) -> set[str]:
+    return {
+        token
+        for text in texts
+        if text is not None
+        for token in _TOKEN_PATTERN.findall(text.casefold())
+    }
+
+
+def _parse_year(value: str | None) -> int | None:
+    try:
+        return None if value is None else int(value)
+    except ValueError:
+        return None
+
+
+class _Entry(NamedTuple):
+    terms: tuple[tuple[str, str], ...]
+    department: str
+    begin_date: int | None
+    end_date: int | None
+
+
+class LocalSearchIndex:
+    __slots__ = (
+        "__entries",
+        "__postings",
+        "__highlights",
+        "__on_view",
+        "__with_images",
+        "__departments",
+        "__department_names",
+    )
+
+    def __init__(self, departments: Iterable[models.DepartmentElement] | None = None):
+        self.__entries: dict[int, _Entry] = {}
+        self.__postings: dict[str, dict[str, set[int]]] = {
+            field: {} for field in _FIELDS
+        }
+        self.__highlights: set[int] = set()
+        self.__on_view: set[int] = set()
+        self.__with_images: set[int] = set()
+        self.__departments: dict[str, set[int]] = {}
+        self.__department_names: dict[int, str] | None = (
+            None
+            if departments is None
+            else {department.id: department.display_name for department in departments}
+        )
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, object_id: object) -> bool:
+        return object_id in self.__entries
+
+    @staticmethod
+    def __get_terms(obj: responses.ObjectResponse) -> Iterable[tuple[str, str]]:
+        title = _tokenize(obj.title)
+        tags = _tokenize(*(tag.term for tag in obj.tags or ()))
+        artist_or_culture = _tokenize(
+            obj.artist_display_name,
+            obj.artist_alpha_sort,
+            obj.culture,
+            *(constituent.name for constituent in obj.constituents or ()),
+        )
+        medium = _tokenize(obj.medium, obj.classification, obj.name)
+        geo_location = _tokenize(
+            obj.city,
+            obj.state,
+            obj.county,
+            obj.country,
+            obj.region,
+            obj.subregion,
+            obj.locale,
+        )
+        every = (
+            title
+            | tags
+            | artist_or_culture
+            | medium
+            | geo_location
+            | _tokenize(
+                obj.period,
+                obj.dynasty,
+                obj.reign,
+                obj.portfolio,
+                obj.artist_nationality,
+                obj.credit_line,
+                obj.accession_number,
+            )
+        )
+        for field, tokens in (
+            ("any", every),
+            ("title", title),
+            ("tags", tags),
+            ("artist_or_culture", artist_or_culture),
+            ("medium", medium),
+            ("geo_location", geo_location),
+        ):
+            for token in tokens:
+                yield field, token
+
+    def add(self, obj: responses.ObjectResponse) -> None:
+        if obj.id in self.__entries:
+            self.remove(obj.id)
+
+        entry = _Entry(
+            terms=tuple(self.__get_terms(obj)),
+            department=obj.department,
+            begin_date=_parse_year(obj.begin_date),
+            end_date=_parse_year(obj.end_date),
+        )
+        for field, token in entry.terms:
+            self.__postings[field].setdefault(token, set()).add(obj.id)
+        self.__departments.setdefault(entry.department, set()).add(obj.id)
+        if obj.is_highlight:
+            self.__highlights.add(obj.id)
+        if obj.gallery_number is not None:
+            self.__on_view.add(obj.id)
+        if obj.primary_image is not None or obj.additional_images:
+            self.__with_images.add(obj.id)
+        self.__entries[obj.id] = entry
+
+    def add_many(self, objs: Iterable[responses.ObjectResponse]) -> None:
+        for obj in objs:
+            self.add(obj)
+
+    def remove(self, object_id: int) -> bool:
+        entry = self.__entries.pop(object_id, None)
+        if entry is None:
+            return False
+
+        for field, token in entry.terms:
+            postings = self.__postings[field]
+            postings[token].discard(object_id)
+            if not postings[token]:
+                del postings[token]
+        self.__departments[entry.department].discard(object_id)
+        if not self.__departments[entry.department]:
+            del self.__departments[entry.department]
+        self.__highlights.discard(object_id)
+        self.__on_view.discard(object_id)
+        self.__with_images.discard(object_id)
+        return True
+
+    def __match(self, fields: Sequence[str], text: str) -> set[int] | None:
+        # every token has to match in at least one of the fields,
+        # None stands for "no constraint" so that an empty text matches everything
+        tokens = _tokenize(text)
+        if not tokens:
+            return None
+
+        matches = sorted(
+            (
+                reduce(
+                    set.union,
+                    (self.__postings[field].get(token, set()) for field in fields),
+                )
+                for token in tokens
+            ),
+            key=len,
+        )
+        return matches[0].intersection(*matches[1:])
+
+    def __match_any(self, field: str, values: Sequence[str]) -> set[int]:
+        result: set[int] = set()
+        for value in values:
+            matches = self.__match((field,), value)
+            result |= set(self.__entries) if matches is None else matches
+        return result
+
+    @staticmethod
+    def __filter_flag(candidates: set[int], ids: set[int], flag: bool) -> set[int]:
+        return candidates & ids if flag else candidates - ids
+
+    def search(
+        self,
+        query: str,
+        is_highlight: bool | None = None,
+        title: bool | None = None,
+        tags: bool | None = None,
+        department_id: int | None = None,
+        is_on_view: bool | None = None,
+        artist_or_culture: bool | None = None,
+        medium: Sequence[str] | None = None,
+        has_images: bool | None = None,
+        geo_location: Sequence[str] | None = None,
+        date_begin: int | None = None,
+        date_end: int | None = None,
+    ) -> responses.SearchResponse:
+        if (date_begin is None and date_end is not None) or (
+            date_begin is not None and date_end is None
+        ):
+            raise ValueError("Both date_begin and date_end must be provided.")
+
+        fields = [
+            field
+            for field, enabled in (
+                ("title", title),
+                ("tags", tags),
+                ("artist_or_culture", artist_or_culture),
+            )
+            if enabled
+        ] or ["any"]
+        matches = self.__match(fields, "" if query == "*" else query)
+        candidates = set(self.__entries) if matches is None else matches
+
+        if department_id is not None:
+            if self.__department_names is None:
+                raise ValueError("Searching by department_id requires departments.")
+            department = self.__department_names.get(department_id, "")
+            candidates &= self.__departments.get(department, set())
+        if is_highlight is not None:
+            candidates = self.__filter_flag(candidates, self.__highlights, is_highlight)
+        if is_on_view is not None:
+            candidates = self.__filter_flag(candidates, self.__on_view, is_on_view)
+        if has_images is not None:
+            candidates = self.__filter_flag(candidates, self.__with_images, has_images)
+        if medium is not None:
+            candidates &= self.__match_any("medium", medium)
+        if geo_location is not None:
+            candidates &= self.__match_any("geo_location", geo_location)
+        if date_begin is not None and date_end is not None:
+            candidates = {
+                object_id
+                for object_id in candidates
+                if (entry := self.__entries[object_id]).begin_date is not None
+                and entry.end_date is not None
+                and entry.begin_date >= date_begin
+                and entry.end_date <= date_end
+            }
+
+        # the api returns null instead of an empty list
+        return responses.SearchResponse.model_construct(
+            total=len(candidates), ids=tuple(sorted(candidates)) or None
+        )
+
+
+__all__ = ("LocalSearchIndex",)
@@ -1,29 +1,70 @@
 from datetime import date
 from http import HTTPMethod
-from typing import Sequence, TypeVar
+from time import perf_counter
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Hashable,
+    Iterable,
+    Literal,
+    Sequence,
+    TypeVar,
+    overload,
+)
+
+from pydantic import BaseModel
 
+from metmuseum.decoders import Decoder, ObjectIdsStreamDecoder, PydanticDecoder
 from metmuseum.gateways.http_gateway import HttpGateway
-from metmuseum.types import exceptions, responses
-
-AnyResponseT = TypeVar(
-    "AnyResponseT",
-    bound=responses.ObjectsResponse
-    | responses.ObjectResponse
-    | responses.SearchResponse
-    | responses.DepartmentsResponse,
-)
+from metmuseum.gateways.transport_exceptions import get_transport_exceptions
+from metmuseum.indexes import DepartmentCatalog
+from metmuseum.metrics import MetricsSink
+from metmuseum.responses import Response
+from metmuseum.search_pages import SearchPages
+from metmuseum.stores.object_store import ObjectStore
+from metmuseum.types import exceptions, models, records, responses, results
+from metmuseum.utils import SingleFlight, bounded_map
+
+# any response model, including the slim models of get_object_projection
+AnyResponseT = TypeVar("AnyResponseT", bound=BaseModel)
 
 
 class MetMuseum:
-    __slots__ = "gateway", "base_url"
+    __slots__ = (
+        "gateway",
+        "base_url",
+        "object_store",
+        "decoder",
+        "max_response_size",
+        "metrics",
+        "departments",
+        "__single_flight",
+    )
 
     def __init__(
         self,
         gateway: HttpGateway,
         base_url: str = "https://collectionapi.metmuseum.org/public/collection/v1",
+        object_store: ObjectStore | None = None,
+        coalesce_requests: bool = False,
+        decoder: Decoder | None = None,
+        max_response_size: int | None = None,
+        metrics: MetricsSink | None = None,
+        departments_ttl: float | None = 3600.0,
     ):
         self.gateway = gateway
         self.base_url = base_url.rstrip("/")
+        self.object_store = object_store
+        self.decoder = decoder or PydanticDecoder()
+        self.max_response_size = max_response_size
+        self.metrics = metrics
+        self.departments = DepartmentCatalog(self.list_departments, ttl=departments_ttl)
+
+        self.__single_flight: SingleFlight[Hashable, Any] | None = (
+            SingleFlight() if coalesce_requests else None
+        )
 
     async def __make_request(
         self,
@@ -33,6 +74,57 @@ class MetMuseum:
         query: dict[str, str] | None = None,
         headers: dict[str, str] | None = None,
         data: bytes | None = None,
+    ) -> AnyResponseT:
+        if self.__single_flight is None or method != HTTPMethod.GET or data is not None:
+            return await self.__send_request(method, path, resp, query, headers, data)
+
+        # concurrent identical requests share one response and one parsed model
+        key = (
+            path,
+            resp,
+            tuple(sorted((query or {}).items())),
+            tuple(sorted((headers or {}).items())),
+        )
+        return await self.__single_flight.do(
+            key, lambda: self.__send_request(method, path, resp, query, headers)
+        )
+
+    async def __read_error(self, response: Response) -> bytes:
+        # an error body is only informative, so an oversized one is truncated
+        # instead of failing with ResponseTooLargeException
+        max_size = self.max_response_size
+        if max_size is None:
+            return await response.read()
+
+        data = bytearray()
+        async for chunk in response.iter_chunks():
+            data += chunk
+            if len(data) >= max_size:
+                break
+        return bytes(data[:max_size])
+
+    async def __raise_for_status(self, response: Response) -> None:
+        if 400 <= response.status_code <= 499:
+            raise exceptions.ClientException(
+                status_code=response.status_code,
+                headers=response.headers,
+                data=await self.__read_error(response),
+            )
+        if 500 <= response.status_code <= 599:
+            raise exceptions.ServerException(
+                status_code=response.status_code,
+                headers=response.headers,
+                data=await self.__read_error(response),
+            )
+
+    async def __send_request(
+        self,
+        method: HTTPMethod,
+        path: str,
+        resp: type[AnyResponseT],
+        query: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        data: bytes | None = None,
     ) -> AnyResponseT:
         async with self.gateway.make_request(
             method=method,
@@ -41,22 +133,41 @@ class MetMuseum:
             headers=headers,
             data=data,
         ) as response:
-            data = await response.read()
-            if 400 <= response.status_code <= 499:
-                raise exceptions.ClientException(
-                    status_code=response.status_code, headers=response.headers, data=data
-                )
-            if 500 <= response.status_code <= 599:
-                raise exceptions.ServerException(
-                    status_code=response.status_code, headers=response.headers, data=data
-                )
-            return resp.model_validate_json(data)
+            await self.__raise_for_status(response)
+            data = await response.read(max_size=self.max_response_size)
+
+        # the connection is already released, so a slow decoder does not hold it
+        if self.metrics is None:
+            return await self.decoder.decode(data, resp)
+
+        started_at = perf_counter()
+        result = await self.decoder.decode(data, resp)
+        self.metrics.observe("decode", perf_counter() - started_at)
+        return result
+
+    @overload
+    async def list_objects(
+        self,
+        metadata_date: date | None = None,
+        department_ids: Sequence[int] | None = None,
+        compact: Literal[False] = False,
+    ) -> responses.ObjectsResponse: ...
+
+    @overload
+    async def list_objects(
+        self,
+        metadata_date: date | None = None,
+        department_ids: Sequence[int] | None = None,
+        *,
+        compact: Literal[True],
+    ) -> responses.CompactObjectsResponse: ...
 
     async def list_objects(
         self,
         metadata_date: date | None = None,
         department_ids: Sequence[int] | None = None,
-    ) -> responses.ObjectsResponse:
+        compact: bool = False,
+    ) -> responses.ObjectsResponse | responses.CompactObjectsResponse:
         query: dict[str, str] = dict()
         if metadata_date is not None:
             query["metadataDate"] = metadata_date.strftime("%Y-%m-%d")
@@ -66,16 +177,224 @@ class MetMuseum:
             method=HTTPMethod.GET,
             path="/objects",
             query=query or None,
-            resp=responses.ObjectsResponse,
+            resp=(
+                responses.CompactObjectsResponse
+                if compact
+                else responses.ObjectsResponse
+            ),
         )
 
-    async def get_object(self, object_id: int) -> responses.ObjectResponse:
-        return await self.__make_request(
+    async def iter_object_id_chunks(
+        self,
+        metadata_date: date | None = None,
+        department_ids: Sequence[int] | None = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[models.ObjectIds]:
+        query: dict[str, str] = dict()
+        if metadata_date is not None:
+            query["metadataDate"] = metadata_date.strftime("%Y-%m-%d")
+        if department_ids is not None:
+            query["departmentIds"] = "|".join(map(str, department_ids))
+
+        async with self.gateway.make_request(
+            method=HTTPMethod.GET,
+            url=self.base_url + "/objects",
+            query=query or None,
+        ) as response:
+            await self.__raise_for_status(response)
+
+            decoder = ObjectIdsStreamDecoder()
+            async for chunk in response.iter_chunks(chunk_size):
+                ids = decoder.feed(chunk)
+                if ids:
+                    yield ids
+            decoder.close()
+
+    async def iter_object_ids(
+        self,
+        metadata_date: date | None = None,
+        department_ids: Sequence[int] | None = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[int]:
+        async for ids in self.iter_object_id_chunks(
+            metadata_date=metadata_date,
+            department_ids=department_ids,
+            chunk_size=chunk_size,
+        ):
+            for object_id in ids:
+                yield object_id
+
+    @overload
+    async def get_object(
+        self, object_id: int, use_store: bool = True, fields: None = None
+    ) -> responses.ObjectResponse: ...
+
+    @overload
+    async def get_object(
+        self, object_id: int, use_store: bool = True, *, fields: Iterable[str]
+    ) -> BaseModel: ...
+
+    async def get_object(
+        self,
+        object_id: int,
+        use_store: bool = True,
+        fields: Iterable[str] | None = None,
+    ) -> BaseModel:
+        if fields is not None:
+            return await self.__get_projected_object(object_id, use_store, fields)
+
+        object_store = self.object_store if use_store else None
+        if object_store is not None:
+            stored = await object_store.get(object_id)
+            if stored is not None:
+                return stored
+
+        object_response = await self.__make_request(
             method=HTTPMethod.GET,
             path=f"/objects/{object_id}",
             resp=responses.ObjectResponse,
         )
 
+        if object_store is not None:
+            await object_store.put(object_response)
+        return object_response
+
+    async def __get_projected_object(
+        self, object_id: int, use_store: bool, fields: Iterable[str]
+    ) -> BaseModel:
+        projection = responses.get_object_projection(fields)
+
+        # a projected object is never written to the store, because the store
+        # holds complete objects only
+        object_store = self.object_store if use_store else None
+        if object_store is not None:
+            stored = await object_store.get(object_id)
+            if stored is not None:
+                names = projection.model_fields
+                return projection.model_construct(
+                    **{name: getattr(stored, name) for name in names}
+                )
+
+        return await self.__make_request(
+            method=HTTPMethod.GET, path=f"/objects/{object_id}", resp=projection
+        )
+
+    async def invalidate_changed_objects(
+        self,
+        metadata_date: date,
+        department_ids: Sequence[int] | None = None,
+    ) -> int:
+        if self.object_store is None:
+            raise ValueError("MetMuseum has no object_store to invalidate.")
+
+        objects_response = await self.list_objects(
+            metadata_date=metadata_date, department_ids=department_ids, compact=True
+        )
+        return await self.object_store.delete(objects_response.ids)
+
+    async def __get_object_result(
+        self,
+        object_id: int,
+        use_store: bool,
+        fields: Iterable[str] | None,
+        as_records: bool,
+    ) -> results.ObjectResult[Any]:
+        try:
+            if fields is None:
+                response = await self.get_object(object_id, use_store=use_store)
+            else:
+                response = await self.get_object(
+                    object_id, use_store=use_store, fields=fields
+                )
+        except (
+            exceptions.ClientException,
+            exceptions.ServerException,
+            exceptions.CircuitOpenException,
+        ) as e:
+            return results.ObjectResult(id=object_id, exception=e)
+        except (ValueError, exceptions.ResponseTooLargeException) as e:
+            # a payload that does not decode (ValidationError is a ValueError)
+            # fails its own object instead of the whole stream
+            return results.ObjectResult(id=object_id, exception=e)
+        except get_transport_exceptions() as e:
+            # so does a connection error or timeout that outlasted any retries
+            return results.ObjectResult(id=object_id, exception=e)
+        if as_records:
+            return results.ObjectResult(
+                id=object_id, response=records.ObjectRecord.from_response(response)
+            )
+        return results.ObjectResult(id=object_id, response=response)
+
+    @overload
+    def get_objects(
+        self,
+        ids: Iterable[int] | AsyncIterable[int],
+        concurrency: int = 10,
+        ordered: bool = False,
+        use_store: bool = True,
+        fields: None = None,
+        as_records: Literal[False] = False,
+    ) -> AsyncIterator[results.ObjectResult[responses.ObjectResponse]]: ...
+
+    @overload
+    def get_objects(
+        self,
+        ids: Iterable[int] | AsyncIterable[int],
+        concurrency: int = 10,
+        ordered: bool = False,
+        use_store: bool = True,
+        *,
+        fields: Iterable[str],
+        as_records: Literal[False] = False,
+    ) -> AsyncIterator[results.ObjectResult[BaseModel]]: ...
+
+    @overload
+    def get_objects(
+        self,
+        ids: Iterable[int] | AsyncIterable[int],
+        concurrency: int = 10,
+        ordered: bool = False,
+        use_store: bool = True,
+        fields: None = None,
+        *,
+        as_records: Literal[True],
+    ) -> AsyncIterator[results.ObjectResult[records.ObjectRecord]]: ...
+
+    def get_objects(
+        self,
+        ids: Iterable[int] | AsyncIterable[int],
+        concurrency: int = 10,
+        ordered: bool = False,
+        use_store: bool = True,
+        fields: Iterable[str] | None = None,
+        as_records: bool = False,
+    ) -> AsyncIterator[results.ObjectResult[Any]]:
+        if fields is not None and as_records:
+            raise ValueError("fields and as_records cannot be used together.")
+
+        # a one-shot iterable of fields would be used up by the first object
+        fields = None if fields is None else tuple(fields)
+        return bounded_map(
+            lambda object_id: self.__get_object_result(
+                object_id, use_store, fields, as_records
+            ),
+            ids,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    async def download(
+        self,
+        url: str,
+        max_memory_size: int = 1024 * 1024,
+        max_size: int | None = None,
+    ) -> IO[bytes]:
+        async with self.gateway.make_request(method=HTTPMethod.GET, url=url) as response:
+            await self.__raise_for_status(response)
+            return await response.spool(
+                max_memory_size=max_memory_size, max_size=max_size
+            )
+
     async def list_departments(self) -> responses.DepartmentsResponse:
         return await self.__make_request(
             method=HTTPMethod.GET,
@@ -83,6 +402,7 @@ class MetMuseum:
             resp=responses.DepartmentsResponse,
         )
 
+    @overload
     async def search(
         self,
         query: str,
@@ -97,7 +417,44 @@ class MetMuseum:
         geo_location: Sequence[str] | None = None,
         date_begin: int | None = None,
         date_end: int | None = None,
-    ) -> responses.SearchResponse:
+        compact: Literal[False] = False,
+    ) -> responses.SearchResponse: ...
+
+    @overload
+    async def search(
+        self,
+        query: str,
+        is_highlight: bool | None = None,
+        title: bool | None = None,
+        tags: bool | None = None,
+        department_id: int | None = None,
+        is_on_view: bool | None = None,
+        artist_or_culture: bool | None = None,
+        medium: Sequence[str] | None = None,
+        has_images: bool | None = None,
+        geo_location: Sequence[str] | None = None,
+        date_begin: int | None = None,
+        date_end: int | None = None,
+        *,
+        compact: Literal[True],
+    ) -> responses.CompactSearchResponse: ...
+
+    async def search(
+        self,
+        query: str,
+        is_highlight: bool | None = None,
+        title: bool | None = None,
+        tags: bool | None = None,
+        department_id: int | None = None,
+        is_on_view: bool | None = None,
+        artist_or_culture: bool | None = None,
+        medium: Sequence[str] | None = None,
+        has_images: bool | None = None,
+        geo_location: Sequence[str] | None = None,
+        date_begin: int | None = None,
+        date_end: int | None = None,
+        compact: bool = False,
+    ) -> responses.SearchResponse | responses.CompactSearchResponse:
         if (date_begin is None and date_end is not None) or (
             date_begin is not None and date_end is None
         ):
@@ -131,7 +488,70 @@ class MetMuseum:
             method=HTTPMethod.GET,
             path="/search",
             query=query_params or None,
-            resp=responses.SearchResponse,
+            resp=(
+                responses.CompactSearchResponse if compact else responses.SearchResponse
+            ),
+        )
+
+    async def search_objects(
+        self,
+        query: str,
+        is_highlight: bool | None = None,
+        title: bool | None = None,
+        tags: bool | None = None,
+        department_id: int | None = None,
+        is_on_view: bool | None = None,
+        artist_or_culture: bool | None = None,
+        medium: Sequence[str] | None = None,
+        has_images: bool | None = None,
+        geo_location: Sequence[str] | None = None,
+        date_begin: int | None = None,
+        date_end: int | None = None,
+        page_size: int = 20,
+        prefetch: int = 1,
+        concurrency: int = 10,
+        use_store: bool = True,
+        fields: Iterable[str] | None = None,
+    ) -> SearchPages[Any]:
+        search_response = await self.search(
+            query,
+            is_highlight=is_highlight,
+            title=title,
+            tags=tags,
+            department_id=department_id,
+            is_on_view=is_on_view,
+            artist_or_culture=artist_or_culture,
+            medium=medium,
+            has_images=has_images,
+            geo_location=geo_location,
+            date_begin=date_begin,
+            date_end=date_end,
+            compact=True,
+        )
+        # a one-shot iterable of fields would be used up by the first page
+        fields = None if fields is None else tuple(fields)
+
+        async def hydrate(ids: Sequence[int]) -> tuple[results.ObjectResult[Any], ...]:
+            if fields is None:
+                object_results = self.get_objects(
+                    ids, concurrency=concurrency, ordered=True, use_store=use_store
+                )
+            else:
+                object_results = self.get_objects(
+                    ids,
+                    concurrency=concurrency,
+                    ordered=True,
+                    use_store=use_store,
+                    fields=fields,
+                )
+            return tuple([result async for result in object_results])
+
+        return SearchPages(
+            search_response.ids or (),
+            hydrate,
+            page_size=page_size,
+            prefetch=prefetch,
+            total=search_response.total,
         )
 
 
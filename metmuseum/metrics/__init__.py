@@ -0,0 +1,5 @@
+from metmuseum.metrics.histogram import Histogram, HistogramSummary
+from metmuseum.metrics.metrics_collector import MetricsCollector
+from metmuseum.metrics.metrics_sink import MetricsSink
+
+__all__ = "Histogram", "HistogramSummary", "MetricsCollector", "MetricsSink"
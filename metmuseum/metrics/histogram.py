@@ -0,0 +1,85 @@
+import math
+from array import array
+from random import Random
+from typing import NamedTuple
+
+
+class HistogramSummary(NamedTuple):
+    count: int
+    total: float
+    min: float
+    max: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+
+
+class Histogram:
+    __slots__ = "__samples", "__max_samples", "__random", "__count", "__total"
+
+    def __init__(self, max_samples: int = 10_000):
+        if max_samples < 1:
+            raise ValueError("max_samples must be greater than zero.")
+
+        self.__samples = array("d")
+        self.__max_samples = max_samples
+        self.__random = Random()
+        self.__count = 0
+        self.__total = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def total(self) -> float:
+        return self.__total
+
+    def observe(self, value: float) -> None:
+        self.__count += 1
+        self.__total += value
+
+        # reservoir sampling keeps memory bounded while every observation
+        # has the same chance to be part of the percentile estimate
+        if len(self.__samples) < self.__max_samples:
+            self.__samples.append(value)
+            return
+        index = self.__random.randrange(self.__count)
+        if index < self.__max_samples:
+            self.__samples[index] = value
+
+    @staticmethod
+    def __pick(samples: list[float], q: float) -> float:
+        return samples[min(len(samples) - 1, int(len(samples) * q / 100))]
+
+    def percentile(self, q: float) -> float:
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100.")
+        if not self.__samples:
+            return math.nan
+        return self.__pick(sorted(self.__samples), q)
+
+    def summary(self) -> HistogramSummary:
+        if not self.__samples:
+            return HistogramSummary(self.__count, self.__total, *(math.nan,) * 6)
+
+        samples = sorted(self.__samples)
+        return HistogramSummary(
+            count=self.__count,
+            total=self.__total,
+            min=samples[0],
+            max=samples[-1],
+            mean=self.__total / self.__count,
+            p50=self.__pick(samples, 50),
+            p90=self.__pick(samples, 90),
+            p99=self.__pick(samples, 99),
+        )
+
+    def clear(self) -> None:
+        del self.__samples[:]
+        self.__count = 0
+        self.__total = 0.0
+
+
+__all__ = "Histogram", "HistogramSummary"
@@ -0,0 +1,34 @@
+from typing import Mapping
+
+from metmuseum.metrics.histogram import Histogram, HistogramSummary
+from metmuseum.metrics.metrics_sink import MetricsSink
+
+
+class MetricsCollector(MetricsSink):
+    __slots__ = "__histograms", "__max_samples"
+
+    def __init__(self, max_samples: int = 10_000):
+        self.__histograms: dict[str, Histogram] = {}
+        self.__max_samples = max_samples
+
+    @property
+    def histograms(self) -> Mapping[str, Histogram]:
+        return self.__histograms
+
+    def observe(self, name: str, value: float) -> None:
+        histogram = self.__histograms.get(name)
+        if histogram is None:
+            histogram = self.__histograms[name] = Histogram(self.__max_samples)
+        histogram.observe(value)
+
+    def summary(self) -> dict[str, HistogramSummary]:
+        return {
+            name: histogram.summary()
+            for name, histogram in sorted(self.__histograms.items())
+        }
+
+    def clear(self) -> None:
+        self.__histograms.clear()
+
+
+__all__ = ("MetricsCollector",)
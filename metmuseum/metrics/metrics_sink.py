@@ -0,0 +1,10 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class MetricsSink(Protocol):
+    @abstractmethod
+    def observe(self, name: str, value: float) -> None: ...
+
+
+__all__ = ("MetricsSink",)
@@ -0,0 +1,6 @@
+from metmuseum.mirror.collection_mirror import CollectionMirror
+from metmuseum.mirror.mirror_report import MirrorReport
+from metmuseum.mirror.mirror_state import MirrorState
+from metmuseum.mirror.sqlite_mirror_state import SqliteMirrorState
+
+__all__ = "CollectionMirror", "MirrorReport", "MirrorState", "SqliteMirrorState"
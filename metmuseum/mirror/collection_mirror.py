@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from logging import getLogger
+from time import monotonic
+from typing import Callable, Sequence
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.mirror.mirror_report import MirrorReport
+from metmuseum.mirror.mirror_state import MirrorState
+from metmuseum.stores.object_store import ObjectStore
+from metmuseum.types import exceptions, responses
+
+
+class CollectionMirror:
+    __slots__ = (
+        "__logger",
+        "__metmuseum",
+        "__store",
+        "__state",
+        "__concurrency",
+        "__batch_size",
+        "__department_ids",
+        "__on_progress",
+    )
+
+    def __init__(
+        self,
+        metmuseum: MetMuseum,
+        store: ObjectStore,
+        state: MirrorState,
+        concurrency: int = 10,
+        batch_size: int = 100,
+        department_ids: Sequence[int] | None = None,
+        on_progress: Callable[[MirrorReport], None] | None = None,
+    ):
+        self.__logger = getLogger("metmuseum:collection-mirror")
+        self.__metmuseum = metmuseum
+        self.__store = store
+        self.__state = state
+        self.__concurrency = concurrency
+        self.__batch_size = batch_size
+        self.__department_ids = department_ids
+        self.__on_progress = on_progress
+
+    async def sync(self) -> MirrorReport:
+        started_at = monotonic()
+
+        run = await self.__state.get_run()
+        resumed = run is not None
+        if run is None:
+            # metadataDate has a one day resolution, so the next run starts one day
+            # before this one to not miss objects changed while it was running
+            started_on = datetime.now(timezone.utc).date() - timedelta(days=1)
+            since = await self.__state.get_checkpoint()
+            objects_response = await self.__metmuseum.list_objects(
+                metadata_date=since, department_ids=self.__department_ids, compact=True
+            )
+            await self.__state.begin_run(started_on, since, objects_response.ids)
+        else:
+            started_on, since = run
+
+        ids = await self.__state.get_pending_ids()
+        self.__logger.info(
+            f"Sync: {len(ids)} objects changed since {since}"
+            f"{' (resumed)' if resumed else ''}"
+        )
+
+        checkpoint = await self.__state.get_checkpoint()
+        fetched = removed = failed = 0
+        objs: list[responses.ObjectResponse] = []
+        gone: list[int] = []
+        done: list[int] = []
+        failed_ids: list[int] = []
+
+        def report() -> MirrorReport:
+            return MirrorReport(
+                since=since,
+                checkpoint=checkpoint,
+                resumed=resumed,
+                total=len(ids),
+                fetched=fetched,
+                removed=removed,
+                failed=failed,
+                elapsed=monotonic() - started_at,
+            )
+
+        async def flush() -> None:
+            if objs:
+                await self.__store.put_many(objs)
+            if gone:
+                await self.__store.delete(gone)
+            # completion is recorded only after the store has the objects,
+            # so a crash in between only causes them to be fetched again
+            await self.__state.complete(done)
+            objs.clear()
+            gone.clear()
+            done.clear()
+            if self.__on_progress is not None:
+                self.__on_progress(report())
+
+        async for result in self.__metmuseum.get_objects(
+            ids, concurrency=self.__concurrency, use_store=False
+        ):
+            if result.response is not None:
+                objs.append(result.response)
+                done.append(result.id)
+                fetched += 1
+            elif (
+                isinstance(result.exception, exceptions.ClientException)
+                and result.exception.status_code == HTTPStatus.NOT_FOUND
+            ):
+                gone.append(result.id)
+                done.append(result.id)
+                removed += 1
+            else:
+                # stays pending and is retried by the next sync
+                self.__logger.warning(f"Sync: object {result.id} failed: {result}")
+                failed_ids.append(result.id)
+                failed += 1
+
+            if len(done) >= self.__batch_size:
+                await flush()
+        await flush()
+
+        # a run is resumed once; objects that still fail are carried into the next
+        # listing, so one broken object does not hold the checkpoint back forever
+        if failed == 0 or resumed:
+            await self.__state.finish_run(started_on, failed_ids)
+            checkpoint = started_on
+
+        final_report = report()
+        self.__logger.info(
+            f"Sync: {final_report.processed} objects in {final_report.elapsed:.1f}s "
+            f"({final_report.throughput:.1f}/s), checkpoint {checkpoint}"
+        )
+        return final_report
+
+
+__all__ = ("CollectionMirror",)
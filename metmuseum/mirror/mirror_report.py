@@ -0,0 +1,40 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import NamedTuple
+
+
+class MirrorReport(NamedTuple):
+    since: date | None
+    checkpoint: date | None
+    resumed: bool
+    total: int
+    fetched: int
+    removed: int
+    failed: int
+    elapsed: float
+
+    @property
+    def processed(self) -> int:
+        return self.fetched + self.removed + self.failed
+
+    @property
+    def pending(self) -> int:
+        return self.total - self.fetched - self.removed
+
+    @property
+    def is_complete(self) -> bool:
+        return self.pending == 0
+
+    @property
+    def throughput(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.processed / self.elapsed
+
+    @property
+    def lag(self) -> timedelta | None:
+        if self.checkpoint is None:
+            return None
+        return datetime.now(timezone.utc).date() - self.checkpoint
+
+
+__all__ = ("MirrorReport",)
@@ -0,0 +1,30 @@
+from abc import abstractmethod
+from datetime import date
+from typing import Iterable, Protocol
+
+from metmuseum.types import models
+
+
+class MirrorState(Protocol):
+    @abstractmethod
+    async def get_checkpoint(self) -> date | None: ...
+
+    @abstractmethod
+    async def get_run(self) -> tuple[date, date | None] | None: ...
+
+    @abstractmethod
+    async def begin_run(
+        self, started_on: date, since: date | None, ids: Iterable[int]
+    ) -> None: ...
+
+    @abstractmethod
+    async def get_pending_ids(self) -> models.ObjectIds: ...
+
+    @abstractmethod
+    async def complete(self, ids: Iterable[int]) -> None: ...
+
+    @abstractmethod
+    async def finish_run(self, checkpoint: date, failed: Iterable[int] = ()) -> None: ...
+
+
+__all__ = ("MirrorState",)
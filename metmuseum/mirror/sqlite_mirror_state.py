@@ -0,0 +1,123 @@
+import sqlite3
+from datetime import date
+from os import PathLike
+from types import TracebackType
+from typing import Iterable, Self
+
+from metmuseum.mirror.mirror_state import MirrorState
+from metmuseum.stores.sqlite_executor import SqliteExecutor
+from metmuseum.types import models
+
+
+class SqliteMirrorState(MirrorState):
+    __slots__ = ("__executor",)
+
+    def __init__(self, path: str | PathLike[str]):
+        self.__executor = SqliteExecutor(
+            path,
+            schema=(
+                "CREATE TABLE IF NOT EXISTS mirror_meta ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT)",
+                "CREATE TABLE IF NOT EXISTS mirror_pending (id INTEGER PRIMARY KEY)",
+            ),
+        )
+
+    @property
+    def path(self) -> str | PathLike[str]:
+        return self.__executor.path
+
+    async def __get_meta(self, key: str) -> str | None:
+        row = await self.__executor.run(
+            lambda c: c.execute(
+                "SELECT value FROM mirror_meta WHERE key = ?", (key,)
+            ).fetchone()
+        )
+        return None if row is None else row[0]
+
+    @staticmethod
+    def __parse_date(value: str | None) -> date | None:
+        return None if value is None else date.fromisoformat(value)
+
+    async def get_checkpoint(self) -> date | None:
+        return self.__parse_date(await self.__get_meta("checkpoint"))
+
+    async def get_run(self) -> tuple[date, date | None] | None:
+        started_on = self.__parse_date(await self.__get_meta("run_started_on"))
+        if started_on is None:
+            return None
+        return started_on, self.__parse_date(await self.__get_meta("run_since"))
+
+    async def begin_run(
+        self, started_on: date, since: date | None, ids: Iterable[int]
+    ) -> None:
+        rows = [(object_id,) for object_id in ids]
+
+        def begin(connection: sqlite3.Connection) -> None:
+            with connection:
+                # ids that failed in the previous run are still pending
+                connection.executemany(
+                    "INSERT OR IGNORE INTO mirror_pending (id) VALUES (?)", rows
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO mirror_meta (key, value) VALUES (?, ?)",
+                    (
+                        ("run_started_on", started_on.isoformat()),
+                        ("run_since", None if since is None else since.isoformat()),
+                    ),
+                )
+
+        await self.__executor.run(begin)
+
+    async def get_pending_ids(self) -> models.ObjectIds:
+        rows = await self.__executor.run(
+            lambda c: c.execute("SELECT id FROM mirror_pending ORDER BY id").fetchall()
+        )
+        return models.ObjectIds(row[0] for row in rows)
+
+    async def complete(self, ids: Iterable[int]) -> None:
+        rows = [(object_id,) for object_id in ids]
+
+        def complete_rows(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.executemany("DELETE FROM mirror_pending WHERE id = ?", rows)
+
+        await self.__executor.run(complete_rows)
+
+    async def finish_run(self, checkpoint: date, failed: Iterable[int] = ()) -> None:
+        rows = [(object_id,) for object_id in failed]
+
+        def finish(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.execute("DELETE FROM mirror_pending")
+                connection.executemany(
+                    "INSERT OR IGNORE INTO mirror_pending (id) VALUES (?)", rows
+                )
+                connection.execute(
+                    "DELETE FROM mirror_meta "
+                    "WHERE key IN ('run_started_on', 'run_since')"
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO mirror_meta (key, value) "
+                    "VALUES ('checkpoint', ?)",
+                    (checkpoint.isoformat(),),
+                )
+
+        await self.__executor.run(finish)
+
+    async def close(self) -> None:
+        await self.__executor.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+__all__ = ("SqliteMirrorState",)
@@ -1,3 +1,6 @@
+from metmuseum.responses.buffer_response import buffer_response
+from metmuseum.responses.buffered_response import BufferedResponse
+from metmuseum.responses.prefixed_response import PrefixedResponse
 from metmuseum.responses.response import Response
 
-__all__ = ("Response",)
+__all__ = "Response", "BufferedResponse", "PrefixedResponse", "buffer_response"
@@ -0,0 +1,29 @@
+from metmuseum.responses.buffered_response import BufferedResponse
+from metmuseum.responses.prefixed_response import PrefixedResponse
+from metmuseum.responses.response import Response
+
+
+async def buffer_response(response: Response, max_size: int) -> Response:
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and content_length.isdigit():
+        if int(content_length) > max_size:
+            return response
+
+    # bodies larger than max_size are streamed to the caller as they arrive
+    # instead of being held in memory in full
+    data = bytearray()
+    chunks = aiter(response.iter_chunks())
+    async for chunk in chunks:
+        data += chunk
+        if len(data) > max_size:
+            return PrefixedResponse(response, bytes(data), chunks)
+
+    return BufferedResponse(
+        url=response.url,
+        status_code=response.status_code,
+        headers=response.headers,
+        data=bytes(data),
+    )
+
+
+__all__ = ("buffer_response",)
@@ -0,0 +1,59 @@
+from http import HTTPStatus
+from typing import AsyncIterator, Mapping
+
+from metmuseum.responses.response import Response
+from metmuseum.types.exceptions import ResponseTooLargeException
+
+
+class BufferedResponse(Response):
+    __slots__ = "__url", "__status_code", "__headers", "__data"
+
+    def __init__(
+        self,
+        url: str,
+        status_code: HTTPStatus,
+        headers: Mapping[str, str],
+        data: bytes,
+    ):
+        self.__url = url
+        self.__status_code = status_code
+        self.__headers = headers
+        self.__data = data
+
+    @classmethod
+    async def from_response(cls, response: Response) -> "BufferedResponse":
+        data = await response.read()
+        return cls(
+            url=response.url,
+            status_code=response.status_code,
+            headers=response.headers,
+            data=data,
+        )
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def status_code(self) -> HTTPStatus:
+        return self.__status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self.__headers
+
+    @property
+    def data(self) -> bytes:
+        return self.__data
+
+    async def read(self, max_size: int | None = None) -> bytes:
+        if max_size is not None and len(self.__data) > max_size:
+            raise ResponseTooLargeException(self.url, max_size)
+        return self.__data
+
+    async def iter_chunks(self, size: int = 65536) -> AsyncIterator[bytes]:
+        for offset in range(0, len(self.__data), size):
+            yield self.__data[offset : offset + size]
+
+
+__all__ = ("BufferedResponse",)
@@ -0,0 +1,46 @@
+from http import HTTPStatus
+from typing import AsyncIterator, Mapping
+
+from metmuseum.responses.response import Response
+from metmuseum.types.exceptions import ResponseTooLargeException
+
+
+class PrefixedResponse(Response):
+    # a response whose body was partly read already: the prefix is replayed
+    # first, then the rest of the body streams from the remaining chunks
+    __slots__ = "__response", "__prefix", "__chunks"
+
+    def __init__(self, response: Response, prefix: bytes, chunks: AsyncIterator[bytes]):
+        self.__response = response
+        self.__prefix = prefix
+        self.__chunks = chunks
+
+    @property
+    def url(self) -> str:
+        return self.__response.url
+
+    @property
+    def status_code(self) -> HTTPStatus:
+        return self.__response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self.__response.headers
+
+    async def read(self, max_size: int | None = None) -> bytes:
+        data = bytearray()
+        async for chunk in self.iter_chunks():
+            data += chunk
+            if max_size is not None and len(data) > max_size:
+                raise ResponseTooLargeException(self.url, max_size)
+        return bytes(data)
+
+    async def iter_chunks(self, size: int = 65536) -> AsyncIterator[bytes]:
+        prefix, self.__prefix = self.__prefix, b""
+        if prefix:
+            yield prefix
+        async for chunk in self.__chunks:
+            yield chunk
+
+
+__all__ = ("PrefixedResponse",)
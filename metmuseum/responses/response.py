@@ -1,6 +1,9 @@
 from abc import abstractmethod
 from http import HTTPStatus
-from typing import Mapping, Protocol
+from tempfile import SpooledTemporaryFile
+from typing import IO, AsyncIterator, Mapping, Protocol
+
+from metmuseum.types.exceptions import ResponseTooLargeException
 
 
 class Response(Protocol):
@@ -17,7 +20,32 @@ class Response(Protocol):
     def headers(self) -> Mapping[str, str]: ...
 
     @abstractmethod
-    async def read(self) -> bytes: ...
+    async def read(self, max_size: int | None = None) -> bytes: ...
+
+    @abstractmethod
+    def iter_chunks(self, size: int = 65536) -> AsyncIterator[bytes]: ...
+
+    async def spool(
+        self,
+        max_memory_size: int = 1024 * 1024,
+        max_size: int | None = None,
+        chunk_size: int = 65536,
+    ) -> IO[bytes]:
+        # the body stays in memory up to max_memory_size and is moved to
+        # a temporary file once it grows larger
+        file = SpooledTemporaryFile(max_size=max_memory_size)
+        try:
+            size = 0
+            async for chunk in self.iter_chunks(chunk_size):
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise ResponseTooLargeException(self.url, max_size)
+                file.write(chunk)
+            file.seek(0)
+        except BaseException:
+            file.close()
+            raise
+        return file
 
 
 __all__ = ("Response",)
@@ -0,0 +1,150 @@
+import asyncio
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Self,
+    Sequence,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from metmuseum.types import results
+
+ObjectT = TypeVar("ObjectT", bound=BaseModel)
+
+HydrateT = Callable[[Sequence[int]], Awaitable[tuple[results.ObjectResult[Any], ...]]]
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    # a prefetched page may fail or be dropped before anyone awaits it
+    if not task.cancelled():
+        task.exception()
+
+
+class SearchPages(Generic[ObjectT]):
+    __slots__ = (
+        "__ids",
+        "__total",
+        "__hydrate",
+        "__page_size",
+        "__prefetch",
+        "__pages",
+        "__waiters",
+    )
+
+    def __init__(
+        self,
+        ids: Sequence[int],
+        hydrate: HydrateT,
+        page_size: int = 20,
+        prefetch: int = 1,
+        total: int | None = None,
+    ):
+        if page_size < 1:
+            raise ValueError("page_size must be greater than zero.")
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative.")
+
+        self.__ids = ids
+        self.__total = len(ids) if total is None else total
+        self.__hydrate = hydrate
+        self.__page_size = page_size
+        self.__prefetch = prefetch
+        self.__pages: dict[int, asyncio.Task[results.SearchPage[ObjectT]]] = {}
+        # number of get_page() calls waiting for each task
+        self.__waiters: dict[asyncio.Task[results.SearchPage[ObjectT]], int] = {}
+
+    @property
+    def ids(self) -> Sequence[int]:
+        return self.__ids
+
+    @property
+    def total(self) -> int:
+        return self.__total
+
+    @property
+    def page_size(self) -> int:
+        return self.__page_size
+
+    @property
+    def prefetch(self) -> int:
+        return self.__prefetch
+
+    def __len__(self) -> int:
+        return -(-len(self.__ids) // self.__page_size)
+
+    async def __load_page(self, number: int) -> results.SearchPage[ObjectT]:
+        start = number * self.__page_size
+        ids = self.__ids[start : start + self.__page_size]
+        return results.SearchPage(
+            number=number, ids=ids, results=await self.__hydrate(ids)
+        )
+
+    def __get_task(self, number: int) -> asyncio.Task[results.SearchPage[ObjectT]]:
+        task = self.__pages.get(number)
+        # a failed or cancelled page is loaded again on the next request
+        if task is None or (task.done() and (task.cancelled() or task.exception())):
+            task = asyncio.create_task(self.__load_page(number))
+            task.add_done_callback(_retrieve_exception)
+            self.__pages[number] = task
+        return task
+
+    async def get_page(self, number: int) -> results.SearchPage[ObjectT]:
+        if not 0 <= number < len(self):
+            raise IndexError("Page number out of range.")
+
+        # only the requested page and the prefetch window after it are kept, so
+        # a long scroll does not keep every hydrated page in memory
+        last = min(number + self.__prefetch, len(self) - 1)
+        for stale in [page for page in self.__pages if not number <= page <= last]:
+            task = self.__pages.pop(stale)
+            # a page another caller is waiting for is only dropped, it finishes
+            # for that caller
+            if task not in self.__waiters:
+                task.cancel()
+
+        task = self.__get_task(number)
+        self.__waiters[task] = self.__waiters.get(task, 0) + 1
+        try:
+            # a cancelled caller must not cancel the page for the next one
+            page = await asyncio.shield(task)
+        finally:
+            if self.__waiters[task] == 1:
+                del self.__waiters[task]
+            else:
+                self.__waiters[task] -= 1
+
+        # the window is loaded once the requested page is ready, so it does not
+        # compete with the page the caller is waiting for
+        for ahead in range(number + 1, last + 1):
+            self.__get_task(ahead)
+        return page
+
+    async def __aiter__(self) -> AsyncIterator[results.SearchPage[ObjectT]]:
+        for number in range(len(self)):
+            yield await self.get_page(number)
+
+    async def close(self) -> None:
+        pages, self.__pages = self.__pages, {}
+        for task in pages.values():
+            task.cancel()
+        await asyncio.gather(*pages.values(), return_exceptions=True)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+__all__ = ("SearchPages",)
@@ -0,0 +1,5 @@
+from metmuseum.stores.object_store import ObjectStore
+from metmuseum.stores.sqlite_executor import SqliteExecutor
+from metmuseum.stores.sqlite_object_store import SqliteObjectStore
+
+__all__ = "ObjectStore", "SqliteExecutor", "SqliteObjectStore"
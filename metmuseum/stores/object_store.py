@@ -0,0 +1,25 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Iterable, Protocol
+
+from metmuseum.types import responses
+
+
+class ObjectStore(Protocol):
+    @abstractmethod
+    async def get(self, object_id: int) -> responses.ObjectResponse | None: ...
+
+    @abstractmethod
+    async def get_metadata_date(self, object_id: int) -> datetime | None: ...
+
+    @abstractmethod
+    async def put(self, obj: responses.ObjectResponse) -> None: ...
+
+    @abstractmethod
+    async def put_many(self, objs: Iterable[responses.ObjectResponse]) -> None: ...
+
+    @abstractmethod
+    async def delete(self, object_ids: Iterable[int]) -> int: ...
+
+
+__all__ = ("ObjectStore",)
@@ -0,0 +1,54 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
+from typing import Callable, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+
+class SqliteExecutor:
+    __slots__ = "__path", "__schema", "__executor", "__connection"
+
+    def __init__(self, path: str | PathLike[str], schema: tuple[str, ...] = ()):
+        self.__path = path
+        self.__schema = schema
+        # sqlite connections must not be used from several threads at once,
+        # so every query runs on the same single worker thread
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="metmuseum-sqlite"
+        )
+        self.__connection: sqlite3.Connection | None = None
+
+    @property
+    def path(self) -> str | PathLike[str]:
+        return self.__path
+
+    def __connect(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            connection = sqlite3.connect(self.__path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.__schema:
+                connection.execute(statement)
+            connection.commit()
+            self.__connection = connection
+        return self.__connection
+
+    async def run(self, func: Callable[[sqlite3.Connection], ResultT]) -> ResultT:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor, lambda: func(self.__connect())
+        )
+
+    async def close(self) -> None:
+        def close_connection(connection: sqlite3.Connection) -> None:
+            connection.close()
+            self.__connection = None
+
+        if self.__connection is not None:
+            await self.run(close_connection)
+        self.__executor.shutdown(wait=True)
+
+
+__all__ = ("SqliteExecutor",)
@@ -0,0 +1,124 @@
+import sqlite3
+from datetime import datetime
+from os import PathLike
+from types import TracebackType
+from typing import AsyncIterator, Iterable, Self
+
+from metmuseum.stores.object_store import ObjectStore
+from metmuseum.stores.sqlite_executor import SqliteExecutor
+from metmuseum.types import responses
+
+
+class SqliteObjectStore(ObjectStore):
+    __slots__ = ("__executor",)
+
+    def __init__(self, path: str | PathLike[str]):
+        self.__executor = SqliteExecutor(
+            path,
+            schema=(
+                "CREATE TABLE IF NOT EXISTS objects ("
+                "id INTEGER PRIMARY KEY, "
+                "metadata_date TEXT NOT NULL, "
+                "data BLOB NOT NULL)",
+            ),
+        )
+
+    @property
+    def path(self) -> str | PathLike[str]:
+        return self.__executor.path
+
+    @staticmethod
+    def __dump(obj: responses.ObjectResponse) -> tuple[int, str, bytes]:
+        return (
+            obj.id,
+            obj.metadata_date.isoformat(),
+            obj.model_dump_json(by_alias=True).encode(),
+        )
+
+    async def get(self, object_id: int) -> responses.ObjectResponse | None:
+        row = await self.__executor.run(
+            lambda c: c.execute(
+                "SELECT data FROM objects WHERE id = ?", (object_id,)
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        return responses.ObjectResponse.model_validate_json(row[0])
+
+    async def get_metadata_date(self, object_id: int) -> datetime | None:
+        row = await self.__executor.run(
+            lambda c: c.execute(
+                "SELECT metadata_date FROM objects WHERE id = ?", (object_id,)
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        return datetime.fromisoformat(row[0])
+
+    async def put(self, obj: responses.ObjectResponse) -> None:
+        await self.put_many((obj,))
+
+    async def put_many(self, objs: Iterable[responses.ObjectResponse]) -> None:
+        rows = [self.__dump(obj) for obj in objs]
+
+        def put_rows(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO objects (id, metadata_date, data) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+
+        await self.__executor.run(put_rows)
+
+    async def delete(self, object_ids: Iterable[int]) -> int:
+        rows = [(object_id,) for object_id in object_ids]
+
+        def delete_rows(connection: sqlite3.Connection) -> int:
+            with connection:
+                return connection.executemany(
+                    "DELETE FROM objects WHERE id = ?", rows
+                ).rowcount
+
+        return await self.__executor.run(delete_rows)
+
+    async def count(self) -> int:
+        row = await self.__executor.run(
+            lambda c: c.execute("SELECT COUNT(*) FROM objects").fetchone()
+        )
+        return row[0]
+
+    async def iter_objects(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[responses.ObjectResponse]:
+        last_id = 0
+        while True:
+            params = (last_id, batch_size)
+            rows = await self.__executor.run(
+                lambda c, params=params: c.execute(
+                    "SELECT id, data FROM objects WHERE id > ? ORDER BY id LIMIT ?",
+                    params,
+                ).fetchall()
+            )
+            for _, data in rows:
+                yield responses.ObjectResponse.model_validate_json(data)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    async def close(self) -> None:
+        await self.__executor.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+__all__ = ("SqliteObjectStore",)
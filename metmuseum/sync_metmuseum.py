@@ -0,0 +1,268 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Future
+from datetime import date
+from logging import getLogger
+from types import TracebackType
+from typing import IO, Any, Coroutine, Iterable, Self, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from metmuseum.decoders import Decoder
+from metmuseum.gateways import AiohttpGateway, HttpGateway
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.metrics import MetricsSink
+from metmuseum.stores.object_store import ObjectStore
+from metmuseum.types import responses, results
+
+ResultT = TypeVar("ResultT")
+
+
+class SyncMetMuseum:
+    __slots__ = (
+        "__logger",
+        "__metmuseum",
+        "__owned_gateway",
+        "__timeout",
+        "__lock",
+        "__loop",
+        "__thread",
+        "__pid",
+    )
+
+    def __init__(
+        self,
+        gateway: HttpGateway | None = None,
+        base_url: str = "https://collectionapi.metmuseum.org/public/collection/v1",
+        object_store: ObjectStore | None = None,
+        coalesce_requests: bool = False,
+        decoder: Decoder | None = None,
+        max_response_size: int | None = None,
+        metrics: MetricsSink | None = None,
+        timeout: float | None = None,
+        departments_ttl: float | None = 3600.0,
+    ):
+        self.__logger = getLogger("metmuseum:sync-metmuseum")
+        # a gateway passed in is owned by the caller, who can start and close it
+        # on the client's loop with run()
+        self.__owned_gateway: AiohttpGateway | None = None
+        if gateway is None:
+            gateway = self.__owned_gateway = AiohttpGateway()
+        self.__metmuseum = MetMuseum(
+            gateway=gateway,
+            base_url=base_url,
+            object_store=object_store,
+            coalesce_requests=coalesce_requests,
+            decoder=decoder,
+            max_response_size=max_response_size,
+            metrics=metrics,
+            departments_ttl=departments_ttl,
+        )
+        self.__timeout = timeout
+
+        self.__lock = threading.Lock()
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__thread: threading.Thread | None = None
+        self.__pid = os.getpid()
+
+    @property
+    def metmuseum(self) -> MetMuseum:
+        return self.__metmuseum
+
+    @property
+    def is_started(self) -> bool:
+        return self.__loop is not None
+
+    def start(self) -> None:
+        with self.__lock:
+            if self.__loop is not None:
+                return
+
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="metmuseum-loop", daemon=True
+            )
+            thread.start()
+            self.__loop, self.__thread = loop, thread
+            self.__pid = os.getpid()
+
+        if self.__owned_gateway is not None:
+            self.run(self.__owned_gateway.start())
+        self.__logger.debug("Started the event loop thread")
+
+    def close(self) -> None:
+        with self.__lock:
+            loop, thread = self.__loop, self.__thread
+            if loop is None or thread is None:
+                return
+            self.__loop = self.__thread = None
+            # a forked child has a copy of the loop but not its thread, and the
+            # gateway's connections belong to the parent
+            if os.getpid() != self.__pid:
+                return
+
+        try:
+            if self.__owned_gateway is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self.__owned_gateway.close(), loop
+                ).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+        self.__logger.debug("Stopped the event loop thread")
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def submit(self, coro: Coroutine[Any, Any, ResultT]) -> Future[ResultT]:
+        if self.__loop is None:
+            self.start()
+        loop = self.__loop
+        assert loop is not None
+
+        if os.getpid() != self.__pid:
+            coro.close()
+            # the loop thread was not copied by fork, so the call would never return
+            raise RuntimeError(
+                "SyncMetMuseum cannot be used after fork(), create a new client."
+            )
+        if threading.current_thread() is self.__thread:
+            coro.close()
+            # waiting for the loop from the loop itself would never return
+            raise RuntimeError("SyncMetMuseum cannot be called from its own loop.")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Coroutine[Any, Any, ResultT]) -> ResultT:
+        future = self.submit(coro)
+        try:
+            return future.result(self.__timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def list_objects(
+        self,
+        metadata_date: date | None = None,
+        department_ids: Sequence[int] | None = None,
+        compact: bool = False,
+    ) -> responses.ObjectsResponse | responses.CompactObjectsResponse:
+        if compact:
+            return self.run(
+                self.__metmuseum.list_objects(
+                    metadata_date=metadata_date,
+                    department_ids=department_ids,
+                    compact=True,
+                )
+            )
+        return self.run(
+            self.__metmuseum.list_objects(
+                metadata_date=metadata_date, department_ids=department_ids
+            )
+        )
+
+    def get_object(
+        self,
+        object_id: int,
+        use_store: bool = True,
+        fields: Iterable[str] | None = None,
+    ) -> responses.ObjectResponse | BaseModel:
+        if fields is None:
+            return self.run(self.__metmuseum.get_object(object_id, use_store=use_store))
+        return self.run(
+            self.__metmuseum.get_object(object_id, use_store=use_store, fields=fields)
+        )
+
+    def get_objects(
+        self,
+        ids: Iterable[int],
+        concurrency: int = 10,
+        ordered: bool = True,
+        use_store: bool = True,
+        fields: Iterable[str] | None = None,
+        as_records: bool = False,
+    ) -> list[results.ObjectResult[Any]]:
+        if fields is not None and as_records:
+            raise ValueError("fields and as_records cannot be used together.")
+
+        async def collect() -> list[results.ObjectResult[Any]]:
+            if fields is None:
+                object_results = self.__metmuseum.get_objects(
+                    ids,
+                    concurrency=concurrency,
+                    ordered=ordered,
+                    use_store=use_store,
+                    as_records=as_records,
+                )
+            else:
+                object_results = self.__metmuseum.get_objects(
+                    ids,
+                    concurrency=concurrency,
+                    ordered=ordered,
+                    use_store=use_store,
+                    fields=fields,
+                )
+            return [result async for result in object_results]
+
+        return self.run(collect())
+
+    def download(
+        self,
+        url: str,
+        max_memory_size: int = 1024 * 1024,
+        max_size: int | None = None,
+    ) -> IO[bytes]:
+        return self.run(
+            self.__metmuseum.download(
+                url, max_memory_size=max_memory_size, max_size=max_size
+            )
+        )
+
+    def list_departments(self) -> responses.DepartmentsResponse:
+        return self.run(self.__metmuseum.list_departments())
+
+    def search(
+        self,
+        query: str,
+        is_highlight: bool | None = None,
+        title: bool | None = None,
+        tags: bool | None = None,
+        department_id: int | None = None,
+        is_on_view: bool | None = None,
+        artist_or_culture: bool | None = None,
+        medium: Sequence[str] | None = None,
+        has_images: bool | None = None,
+        geo_location: Sequence[str] | None = None,
+        date_begin: int | None = None,
+        date_end: int | None = None,
+        compact: bool = False,
+    ) -> responses.SearchResponse | responses.CompactSearchResponse:
+        kwargs: dict[str, Any] = dict(
+            is_highlight=is_highlight,
+            title=title,
+            tags=tags,
+            department_id=department_id,
+            is_on_view=is_on_view,
+            artist_or_culture=artist_or_culture,
+            medium=medium,
+            has_images=has_images,
+            geo_location=geo_location,
+            date_begin=date_begin,
+            date_end=date_end,
+        )
+        if compact:
+            return self.run(self.__metmuseum.search(query, compact=True, **kwargs))
+        return self.run(self.__metmuseum.search(query, **kwargs))
+
+
+__all__ = ("SyncMetMuseum",)
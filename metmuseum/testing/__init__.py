@@ -0,0 +1,15 @@
+from metmuseum.testing.fake_met_server import FakeMetServer
+from metmuseum.testing.latency import (
+    Latency,
+    constant_latency,
+    lognormal_latency,
+    uniform_latency,
+)
+
+__all__ = (
+    "FakeMetServer",
+    "Latency",
+    "constant_latency",
+    "lognormal_latency",
+    "uniform_latency",
+)
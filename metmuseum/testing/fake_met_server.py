@@ -0,0 +1,310 @@
+import asyncio
+import json
+from datetime import date
+from http import HTTPStatus
+from logging import getLogger
+from random import Random
+from time import monotonic
+from types import TracebackType
+from typing import Any, Iterable, Mapping, Self, Sequence
+
+from aiohttp import web
+
+from metmuseum.indexes import LocalSearchIndex
+from metmuseum.testing.latency import Latency
+from metmuseum.types import models, responses
+
+
+def _json_response(
+    body: Any, status: int = HTTPStatus.OK, headers: Mapping[str, str] | None = None
+) -> web.Response:
+    return web.Response(
+        body=body if isinstance(body, bytes) else json.dumps(body).encode(),
+        status=status,
+        headers=headers,
+        content_type="application/json",
+    )
+
+
+def _parse_bool(value: str | None) -> bool | None:
+    return None if value is None else value.lower() == "true"
+
+
+def _parse_int(value: str | None) -> int | None:
+    return None if value is None else int(value)
+
+
+def _parse_list(value: str | None) -> list[str] | None:
+    return None if value is None else value.split("|")
+
+
+class FakeMetServer:
+    __slots__ = (
+        "__logger",
+        "__host",
+        "__port",
+        "__objects",
+        "__metadata_dates",
+        "__object_departments",
+        "__departments",
+        "__index",
+        "__latency",
+        "__error_rate",
+        "__error_statuses",
+        "__throttle_rate",
+        "__rate_limit",
+        "__burst",
+        "__retry_after",
+        "__random",
+        "__tokens",
+        "__updated_at",
+        "__runner",
+        "__url",
+        "__requests",
+        "__failed",
+        "__throttled",
+        "__in_flight",
+        "__max_in_flight",
+    )
+
+    def __init__(
+        self,
+        objects: Iterable[Mapping[str, Any]] = (),
+        departments: Iterable[Mapping[str, Any]] = (),
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Latency | None = None,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 502, 503),
+        throttle_rate: float = 0.0,
+        rate_limit: float | None = None,
+        burst: int = 1,
+        retry_after: float | None = 1.0,
+        seed: int | None = None,
+    ):
+        if not 0 <= error_rate <= 1 or not 0 <= throttle_rate <= 1:
+            raise ValueError("error_rate and throttle_rate must be between 0 and 1.")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be greater than zero.")
+
+        self.__logger = getLogger("metmuseum:fake-met-server")
+        self.__host = host
+        self.__port = port
+
+        objs = [responses.ObjectResponse.model_validate(obj) for obj in objects]
+        self.__objects = {
+            obj.id: obj.model_dump_json(by_alias=True).encode() for obj in objs
+        }
+        self.__metadata_dates = {obj.id: obj.metadata_date.date() for obj in objs}
+        self.__object_departments = {obj.id: obj.department for obj in objs}
+        self.__departments = tuple(
+            models.DepartmentElement.model_validate(department)
+            for department in departments
+        )
+        self.__index = LocalSearchIndex(departments=self.__departments)
+        self.__index.add_many(objs)
+
+        self.__latency = latency
+        self.__error_rate = error_rate
+        self.__error_statuses = tuple(error_statuses)
+        self.__throttle_rate = throttle_rate
+        self.__rate_limit = rate_limit
+        self.__burst = burst
+        self.__retry_after = retry_after
+        # a seeded generator makes latencies and injected failures repeatable
+        self.__random = Random(seed)
+        self.__tokens = float(burst)
+        self.__updated_at = monotonic()
+
+        self.__runner: web.AppRunner | None = None
+        self.__url: str | None = None
+
+        self.__requests = 0
+        self.__failed = 0
+        self.__throttled = 0
+        self.__in_flight = 0
+        self.__max_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        if self.__url is None:
+            raise RuntimeError("The server is not started.")
+        return self.__url
+
+    @property
+    def is_started(self) -> bool:
+        return self.__runner is not None
+
+    @property
+    def requests(self) -> int:
+        return self.__requests
+
+    @property
+    def failed(self) -> int:
+        return self.__failed
+
+    @property
+    def throttled(self) -> int:
+        return self.__throttled
+
+    @property
+    def in_flight(self) -> int:
+        return self.__in_flight
+
+    @property
+    def max_in_flight(self) -> int:
+        return self.__max_in_flight
+
+    def __try_acquire(self) -> bool:
+        if self.__rate_limit is None:
+            return True
+
+        now = monotonic()
+        self.__tokens = min(
+            self.__burst, self.__tokens + (now - self.__updated_at) * self.__rate_limit
+        )
+        self.__updated_at = now
+        if self.__tokens < 1:
+            return False
+        self.__tokens -= 1
+        return True
+
+    def __throttled_response(self) -> web.Response:
+        self.__throttled += 1
+        headers = (
+            None
+            if self.__retry_after is None
+            else {"Retry-After": f"{self.__retry_after:g}"}
+        )
+        return _json_response(
+            {"message": "Too Many Requests"},
+            status=HTTPStatus.TOO_MANY_REQUESTS,
+            headers=headers,
+        )
+
+    @web.middleware
+    async def __inject_faults(
+        self, request: web.Request, handler: web.RequestHandler
+    ) -> web.StreamResponse:
+        self.__requests += 1
+        self.__in_flight += 1
+        self.__max_in_flight = max(self.__max_in_flight, self.__in_flight)
+        try:
+            if self.__latency is not None:
+                await asyncio.sleep(max(0.0, self.__latency(self.__random)))
+
+            if not self.__try_acquire():
+                return self.__throttled_response()
+            if self.__random.random() < self.__throttle_rate:
+                return self.__throttled_response()
+            if self.__random.random() < self.__error_rate:
+                self.__failed += 1
+                return _json_response(
+                    {"message": "Injected failure"},
+                    status=self.__random.choice(self.__error_statuses),
+                )
+
+            return await handler(request)
+        finally:
+            self.__in_flight -= 1
+
+    async def __list_objects(self, request: web.Request) -> web.Response:
+        ids: Iterable[int] = self.__objects
+        if (metadata_date := request.query.get("metadataDate")) is not None:
+            since = date.fromisoformat(metadata_date)
+            ids = [i for i in ids if self.__metadata_dates[i] >= since]
+        department_ids = _parse_list(request.query.get("departmentIds"))
+        if department_ids is not None:
+            names = {
+                department.display_name
+                for department in self.__departments
+                if str(department.id) in department_ids
+            }
+            ids = [i for i in ids if self.__object_departments[i] in names]
+
+        object_ids = sorted(ids)
+        return _json_response({"total": len(object_ids), "objectIDs": object_ids})
+
+    async def __get_object(self, request: web.Request) -> web.Response:
+        try:
+            data = self.__objects.get(int(request.match_info["object_id"]))
+        except ValueError:
+            data = None
+        if data is None:
+            return _json_response(
+                {"message": "ObjectID not found"}, status=HTTPStatus.NOT_FOUND
+            )
+        return _json_response(data)
+
+    async def __list_departments(self, request: web.Request) -> web.Response:
+        return _json_response(
+            {
+                "departments": [
+                    department.model_dump(by_alias=True)
+                    for department in self.__departments
+                ]
+            }
+        )
+
+    async def __search(self, request: web.Request) -> web.Response:
+        query = request.query
+        try:
+            search_response = self.__index.search(
+                query.get("q", ""),
+                is_highlight=_parse_bool(query.get("isHighlight")),
+                title=_parse_bool(query.get("title")),
+                tags=_parse_bool(query.get("tags")),
+                department_id=_parse_int(query.get("departmentId")),
+                is_on_view=_parse_bool(query.get("isOnView")),
+                artist_or_culture=_parse_bool(query.get("artistOrCulture")),
+                medium=_parse_list(query.get("medium")),
+                has_images=_parse_bool(query.get("hasImages")),
+                geo_location=_parse_list(query.get("geoLocation")),
+                date_begin=_parse_int(query.get("dateBegin")),
+                date_end=_parse_int(query.get("dateEnd")),
+            )
+        except ValueError as e:
+            return _json_response({"message": str(e)}, status=HTTPStatus.BAD_REQUEST)
+        return _json_response(search_response.model_dump_json(by_alias=True).encode())
+
+    def create_app(self) -> web.Application:
+        app = web.Application(middlewares=(self.__inject_faults,))
+        app.router.add_get("/objects", self.__list_objects)
+        app.router.add_get("/objects/{object_id}", self.__get_object)
+        app.router.add_get("/departments", self.__list_departments)
+        app.router.add_get("/search", self.__search)
+        return app
+
+    async def start(self) -> None:
+        if self.__runner is not None:
+            return
+
+        runner = web.AppRunner(self.create_app(), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, self.__host, self.__port)
+        await site.start()
+        host, port = runner.addresses[0][:2]
+        self.__runner = runner
+        self.__url = f"http://{host}:{port}"
+        self.__logger.debug(f"Listening on {self.__url}")
+
+    async def close(self) -> None:
+        runner, self.__runner = self.__runner, None
+        self.__url = None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+__all__ = ("FakeMetServer",)
@@ -0,0 +1,20 @@
+from random import Random
+from typing import Callable
+
+Latency = Callable[[Random], float]
+
+
+def constant_latency(seconds: float) -> Latency:
+    return lambda _: seconds
+
+
+def uniform_latency(low: float, high: float) -> Latency:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> Latency:
+    # a long right tail, close to what real api latencies look like
+    return lambda rng: median * rng.lognormvariate(0.0, sigma)
+
+
+__all__ = "Latency", "constant_latency", "uniform_latency", "lognormal_latency"
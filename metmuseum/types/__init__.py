@@ -1,3 +1,3 @@
-from metmuseum.types import exceptions, models, responses
+from metmuseum.types import exceptions, models, records, responses, results
 
-__all__ = "models", "responses", "exceptions"
+__all__ = "models", "records", "responses", "results", "exceptions"
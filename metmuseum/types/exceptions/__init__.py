@@ -1,4 +1,13 @@
+from metmuseum.types.exceptions.circuit_open_exception import CircuitOpenException
 from metmuseum.types.exceptions.client_exception import ClientException
+from metmuseum.types.exceptions.response_too_large_exception import (
+    ResponseTooLargeException,
+)
 from metmuseum.types.exceptions.server_exception import ServerException
 
-__all__ = "ClientException", "ServerException"
+__all__ = (
+    "ClientException",
+    "ServerException",
+    "ResponseTooLargeException",
+    "CircuitOpenException",
+)
@@ -34,15 +34,19 @@ class ApiException(Exception):
         if content_type is not None:
             content_type_parsed = content_type.split("; ")
 
-            if "text/plain" in content_type_parsed:
-                text = self.data.decode("utf-8")
-                return f"{self.status_code.phrase}: {text}"
-
-            elif "application/json" in content_type_parsed:
-                text = json.loads(self.data.decode("utf-8"))
-                if isinstance(text, str):
+            # a truncated or malformed body falls back to the status description
+            try:
+                if "text/plain" in content_type_parsed:
+                    text = self.data.decode("utf-8")
                     return f"{self.status_code.phrase}: {text}"
 
+                elif "application/json" in content_type_parsed:
+                    text = json.loads(self.data.decode("utf-8"))
+                    if isinstance(text, str):
+                        return f"{self.status_code.phrase}: {text}"
+            except ValueError:
+                pass
+
         if self.status_code.description:
             return f"{self.status_code.phrase}: {self.status_code.description}"
         else:
@@ -0,0 +1,27 @@
+class CircuitOpenException(Exception):
+    __slots__ = "__url", "__endpoint", "__retry_after"
+
+    def __init__(self, url: str, endpoint: str, retry_after: float):
+        self.__url = url
+        self.__endpoint = endpoint
+        self.__retry_after = retry_after
+
+        super(Exception, self).__init__(
+            f"Circuit for {endpoint} is open, {url} is not requested "
+            f"for another {retry_after:.3f}s"
+        )
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def endpoint(self) -> str:
+        return self.__endpoint
+
+    @property
+    def retry_after(self) -> float:
+        return self.__retry_after
+
+
+__all__ = ("CircuitOpenException",)
@@ -0,0 +1,21 @@
+class ResponseTooLargeException(Exception):
+    __slots__ = "__url", "__max_size"
+
+    def __init__(self, url: str, max_size: int):
+        self.__url = url
+        self.__max_size = max_size
+
+        super(Exception, self).__init__(
+            f"Response body of {url} exceeds {max_size} bytes"
+        )
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+
+__all__ = ("ResponseTooLargeException",)
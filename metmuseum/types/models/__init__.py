@@ -1,6 +1,7 @@
 from metmuseum.types.models.department_element import DepartmentElement
 from metmuseum.types.models.object_constituent import ObjectConstituent
 from metmuseum.types.models.object_dimensions import ObjectDimensions
+from metmuseum.types.models.object_ids import ObjectIds
 from metmuseum.types.models.object_measurements import ObjectMeasurements
 from metmuseum.types.models.object_measurements_element import ObjectMeasurementsElement
 from metmuseum.types.models.object_tag import ObjectTag
@@ -9,6 +10,7 @@ __all__ = (
     "DepartmentElement",
     "ObjectConstituent",
     "ObjectDimensions",
+    "ObjectIds",
     "ObjectMeasurementsElement",
     "ObjectMeasurements",
     "ObjectTag",
@@ -0,0 +1,100 @@
+from array import array
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+
+class ObjectIds(Sequence[int]):
+    # ids are stored as unsigned 32-bit ints in one contiguous buffer instead of
+    # a tuple of boxed python ints, which is ~9x smaller for the whole collection
+    __slots__ = ("__array",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        try:
+            ids_array = array("I", ids)
+        except (TypeError, OverflowError) as e:
+            raise ValueError(f"Object ids must be positive 32-bit integers: {e}") from e
+        if ids_array and min(ids_array) == 0:
+            raise ValueError("Object ids must be greater than 0.")
+
+        self.__array = ids_array
+
+    @classmethod
+    def __from_array(cls, ids_array: array) -> "ObjectIds":
+        ids = cls.__new__(cls)
+        ids.__array = ids_array
+        return ids
+
+    @property
+    def buffer(self) -> memoryview:
+        return memoryview(self.__array).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        return self.__array.itemsize * len(self.__array)
+
+    def __len__(self) -> int:
+        return len(self.__array)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.__array)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.__array
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ObjectIds": ...
+
+    def __getitem__(self, index: int | slice) -> "int | ObjectIds":
+        if isinstance(index, slice):
+            return self.__from_array(self.__array[index])
+        return self.__array[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ObjectIds):
+            return self.__array == other.__array
+        if isinstance(other, array):
+            return self.__array == other
+        if isinstance(other, list):
+            return self.__array.tolist() == other
+        if isinstance(other, tuple):
+            return tuple(self.__array) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__array.tolist()!r})"
+
+    @classmethod
+    def validate(cls, value: Any) -> "ObjectIds":
+        if isinstance(value, ObjectIds):
+            return value
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            raise ValueError("Object ids must be a sequence of integers.")
+        return cls(value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda ids: ids.__array.tolist()
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "array", "items": {"type": "integer", "exclusiveMinimum": 0}}
+
+
+__all__ = ("ObjectIds",)
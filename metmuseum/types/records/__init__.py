@@ -0,0 +1,19 @@
+from metmuseum.types.records.object_constituent_record import ObjectConstituentRecord
+from metmuseum.types.records.object_dimensions_record import ObjectDimensionsRecord
+from metmuseum.types.records.object_measurements_element_record import (
+    ObjectMeasurementsElementRecord,
+)
+from metmuseum.types.records.object_measurements_record import (
+    ObjectMeasurementsRecord,
+)
+from metmuseum.types.records.object_record import ObjectRecord
+from metmuseum.types.records.object_tag_record import ObjectTagRecord
+
+__all__ = (
+    "ObjectConstituentRecord",
+    "ObjectDimensionsRecord",
+    "ObjectMeasurementsElementRecord",
+    "ObjectMeasurementsRecord",
+    "ObjectRecord",
+    "ObjectTagRecord",
+)
@@ -0,0 +1,22 @@
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_object_setattr = object.__setattr__
+
+
+def construct(type_: type[ModelT], values: dict[str, Any]) -> ModelT:
+    # the state model_construct sets up for a complete set of fields, without
+    # its per-call handling of aliases, defaults and extras; records always
+    # carry every field, so none of it applies
+    obj = type_.__new__(type_)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(obj, "__pydantic_fields_set__", set(values))
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+__all__ = ("construct",)
@@ -0,0 +1,25 @@
+from typing import NamedTuple
+
+from metmuseum.types import models
+from metmuseum.types.records.construct import construct
+
+
+class ObjectConstituentRecord(NamedTuple):
+    id: int
+    role: str
+    name: str
+    ulan: str | None
+    wikidata: str | None
+    gender: str
+
+    @classmethod
+    def from_model(
+        cls, constituent: models.ObjectConstituent
+    ) -> "ObjectConstituentRecord":
+        return cls._make(map(constituent.__dict__.__getitem__, cls._fields))
+
+    def to_model(self) -> models.ObjectConstituent:
+        return construct(models.ObjectConstituent, self._asdict())
+
+
+__all__ = ("ObjectConstituentRecord",)
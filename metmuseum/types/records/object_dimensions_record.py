@@ -0,0 +1,20 @@
+from typing import NamedTuple
+
+from metmuseum.types import models
+from metmuseum.types.records.construct import construct
+
+
+class ObjectDimensionsRecord(NamedTuple):
+    element: str
+    dimension_type: str
+    dimension: float
+
+    @classmethod
+    def from_model(cls, dimensions: models.ObjectDimensions) -> "ObjectDimensionsRecord":
+        return cls._make(map(dimensions.__dict__.__getitem__, cls._fields))
+
+    def to_model(self) -> models.ObjectDimensions:
+        return construct(models.ObjectDimensions, self._asdict())
+
+
+__all__ = ("ObjectDimensionsRecord",)
@@ -0,0 +1,36 @@
+from typing import NamedTuple
+
+from metmuseum.types import models
+from metmuseum.types.records.construct import construct
+from metmuseum.types.records.object_measurements_record import (
+    ObjectMeasurementsRecord,
+)
+
+
+class ObjectMeasurementsElementRecord(NamedTuple):
+    name: str
+    description: str | None
+    measurements: ObjectMeasurementsRecord
+
+    @classmethod
+    def from_model(
+        cls, element: models.ObjectMeasurementsElement
+    ) -> "ObjectMeasurementsElementRecord":
+        return cls(
+            element.name,
+            element.description,
+            ObjectMeasurementsRecord.from_model(element.measurements),
+        )
+
+    def to_model(self) -> models.ObjectMeasurementsElement:
+        return construct(
+            models.ObjectMeasurementsElement,
+            dict(
+                name=self.name,
+                description=self.description,
+                measurements=self.measurements.to_model(),
+            ),
+        )
+
+
+__all__ = ("ObjectMeasurementsElementRecord",)
@@ -0,0 +1,22 @@
+from typing import NamedTuple
+
+from metmuseum.types import models
+from metmuseum.types.records.construct import construct
+
+
+class ObjectMeasurementsRecord(NamedTuple):
+    heigth: float | None = None
+    width: float | None = None
+    diameter: float | None = None
+
+    @classmethod
+    def from_model(
+        cls, measurements: models.ObjectMeasurements
+    ) -> "ObjectMeasurementsRecord":
+        return cls._make(map(measurements.__dict__.__getitem__, cls._fields))
+
+    def to_model(self) -> models.ObjectMeasurements:
+        return construct(models.ObjectMeasurements, self._asdict())
+
+
+__all__ = ("ObjectMeasurementsRecord",)
@@ -0,0 +1,113 @@
+from datetime import datetime
+from typing import Any, Callable, NamedTuple
+
+from metmuseum.types import responses
+from metmuseum.types.records.construct import construct
+from metmuseum.types.records.object_constituent_record import ObjectConstituentRecord
+from metmuseum.types.records.object_dimensions_record import ObjectDimensionsRecord
+from metmuseum.types.records.object_measurements_element_record import (
+    ObjectMeasurementsElementRecord,
+)
+from metmuseum.types.records.object_tag_record import ObjectTagRecord
+
+
+def _map_items(
+    items: tuple[Any, ...] | None, func: Callable[[Any], Any]
+) -> tuple[Any, ...] | None:
+    return None if items is None else tuple(map(func, items))
+
+
+class ObjectRecord(NamedTuple):
+    # An immutable tuple with the fields of ObjectResponse, for catalogs that keep
+    # many objects in memory: no per-instance __dict__, fields set or private
+    # state, and nested models become records as well.
+    id: int
+    is_highlight: bool
+    accession_number: str
+    accession_year: str | None
+    is_public_domain: bool
+    primary_image: str | None
+    primary_image_small: str | None
+    additional_images: tuple[str, ...]
+    constituents: tuple[ObjectConstituentRecord, ...] | None
+    department: str
+    name: str | None
+    title: str | None
+    culture: str | None
+    period: str | None
+    dynasty: str | None
+    reign: str | None
+    portfolio: str | None
+    artist_role: str | None
+    artist_prefix: str | None
+    artist_display_name: str | None
+    artist_display_bio: str | None
+    artist_suffix: str | None
+    artist_alpha_sort: str | None
+    artist_nationality: str | None
+    artist_begin_date: str | None
+    artist_end_date: str | None
+    artist_gender: str | None
+    artist_wikidata: str | None
+    artist_ulan: str | None
+    date: str | None
+    begin_date: str
+    end_date: str
+    medium: str | None
+    dimensions: str | None
+    dimensions_parsed: tuple[ObjectDimensionsRecord, ...]
+    measurements: tuple[ObjectMeasurementsElementRecord, ...] | None
+    credit_line: str | None
+    geography_type: str | None
+    city: str | None
+    state: str | None
+    county: str | None
+    country: str | None
+    region: str | None
+    subregion: str | None
+    locale: str | None
+    locus: str | None
+    excavation: str | None
+    river: str | None
+    classification: str | None
+    rights_and_reproduction: str | None
+    link_resource: str | None
+    metadata_date: datetime
+    repository: str
+    url: str
+    tags: tuple[ObjectTagRecord, ...] | None
+    wikidata: str | None
+    is_timeline_work: bool
+    gallery_number: str | None
+
+    @classmethod
+    def from_response(cls, obj: responses.ObjectResponse) -> "ObjectRecord":
+        values = dict(obj.__dict__)
+        values["constituents"] = _map_items(
+            values["constituents"], ObjectConstituentRecord.from_model
+        )
+        values["dimensions_parsed"] = _map_items(
+            values["dimensions_parsed"], ObjectDimensionsRecord.from_model
+        )
+        values["measurements"] = _map_items(
+            values["measurements"], ObjectMeasurementsElementRecord.from_model
+        )
+        values["tags"] = _map_items(values["tags"], ObjectTagRecord.from_model)
+        return cls._make(map(values.__getitem__, cls._fields))
+
+    def to_response(self) -> responses.ObjectResponse:
+        values = self._asdict()
+        values["constituents"] = _map_items(
+            self.constituents, ObjectConstituentRecord.to_model
+        )
+        values["dimensions_parsed"] = _map_items(
+            self.dimensions_parsed, ObjectDimensionsRecord.to_model
+        )
+        values["measurements"] = _map_items(
+            self.measurements, ObjectMeasurementsElementRecord.to_model
+        )
+        values["tags"] = _map_items(self.tags, ObjectTagRecord.to_model)
+        return construct(responses.ObjectResponse, values)
+
+
+__all__ = ("ObjectRecord",)
@@ -0,0 +1,20 @@
+from typing import NamedTuple
+
+from metmuseum.types import models
+from metmuseum.types.records.construct import construct
+
+
+class ObjectTagRecord(NamedTuple):
+    term: str
+    aat: str | None
+    wikidata: str | None
+
+    @classmethod
+    def from_model(cls, tag: models.ObjectTag) -> "ObjectTagRecord":
+        return cls._make(map(tag.__dict__.__getitem__, cls._fields))
+
+    def to_model(self) -> models.ObjectTag:
+        return construct(models.ObjectTag, self._asdict())
+
+
+__all__ = ("ObjectTagRecord",)
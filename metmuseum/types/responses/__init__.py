@@ -1,6 +1,17 @@
+from metmuseum.types.responses.compact_objects_response import CompactObjectsResponse
+from metmuseum.types.responses.compact_search_response import CompactSearchResponse
 from metmuseum.types.responses.departments_response import DepartmentsResponse
+from metmuseum.types.responses.object_projection import get_object_projection
 from metmuseum.types.responses.object_response import ObjectResponse
 from metmuseum.types.responses.objects_response import ObjectsResponse
 from metmuseum.types.responses.search_response import SearchResponse
 
-__all__ = "DepartmentsResponse", "ObjectResponse", "ObjectsResponse", "SearchResponse"
+__all__ = (
+    "CompactObjectsResponse",
+    "CompactSearchResponse",
+    "DepartmentsResponse",
+    "ObjectResponse",
+    "ObjectsResponse",
+    "SearchResponse",
+    "get_object_projection",
+)
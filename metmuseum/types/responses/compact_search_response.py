@@ -0,0 +1,14 @@
+from typing import Annotated
+
+from annotated_types import Ge
+from pydantic import BaseModel, Field
+
+from metmuseum.types import models
+
+
+class CompactSearchResponse(BaseModel):
+    total: Annotated[int, Ge(0)] = Field(alias="total")
+    ids: models.ObjectIds | None = Field(alias="objectIDs")
+
+
+__all__ = ("CompactSearchResponse",)
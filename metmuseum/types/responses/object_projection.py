@@ -0,0 +1,60 @@
+from copy import copy
+from functools import lru_cache
+from typing import Any, Iterable
+
+from pydantic import BaseModel, create_model, field_validator
+
+from metmuseum.types.responses.object_response import ObjectResponse
+
+_PREFIX = "ObjectProjection__"
+
+
+@lru_cache(maxsize=128)
+def _create_object_projection(fields: tuple[str, ...]) -> type[BaseModel]:
+    validators: dict[str, Any] = {}
+    decorators = ObjectResponse.__pydantic_decorators__.field_validators
+    for name, decorator in decorators.items():
+        validator_fields = [field for field in decorator.info.fields if field in fields]
+        if validator_fields:
+            validators[name] = field_validator(
+                *validator_fields, mode=decorator.info.mode
+            )(decorator.func.__func__)
+
+    return create_model(  # type: ignore[call-overload, no-any-return]
+        f"{_PREFIX}{'__'.join(fields)}",
+        __module__=__name__,
+        __validators__=validators,
+        **{
+            field: (info.annotation, copy(info))
+            for field, info in ObjectResponse.model_fields.items()
+            if field in fields
+        },
+    )
+
+
+def get_object_projection(fields: Iterable[str]) -> type[BaseModel]:
+    # id is always kept, so a projected object can still be told apart
+    requested = {"id", *fields}
+    unknown = requested - ObjectResponse.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown ObjectResponse fields: {', '.join(sorted(unknown))}.")
+
+    # fields are ordered as in ObjectResponse, so every order of the same fields
+    # shares one cached model
+    return _create_object_projection(
+        tuple(field for field in ObjectResponse.model_fields if field in requested)
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # projection models are created at runtime, resolving them by name makes
+    # them and their instances picklable, e.g. to decode in another process
+    if name.startswith(_PREFIX):
+        try:
+            return get_object_projection(name.removeprefix(_PREFIX).split("__"))
+        except ValueError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ("get_object_projection",)
@@ -0,0 +1,4 @@
+from metmuseum.types.results.object_result import ObjectResult
+from metmuseum.types.results.search_page import SearchPage
+
+__all__ = ("ObjectResult", "SearchPage")
@@ -0,0 +1,22 @@
+from typing import Generic, NamedTuple, TypeVar
+
+from pydantic import BaseModel
+
+from metmuseum.types import records
+
+ObjectT = TypeVar("ObjectT", bound=BaseModel | records.ObjectRecord)
+
+
+class ObjectResult(NamedTuple, Generic[ObjectT]):
+    id: int
+    response: ObjectT | None = None
+    # API errors, open circuits, payloads that do not decode and transport
+    # errors such as timeouts
+    exception: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+
+__all__ = ("ObjectResult",)
@@ -0,0 +1,22 @@
+from typing import Generic, NamedTuple, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from metmuseum.types.results.object_result import ObjectResult
+
+ObjectT = TypeVar("ObjectT", bound=BaseModel)
+
+
+class SearchPage(NamedTuple, Generic[ObjectT]):
+    number: int
+    ids: Sequence[int]
+    results: tuple[ObjectResult[ObjectT], ...]
+
+    @property
+    def objects(self) -> tuple[ObjectT, ...]:
+        return tuple(
+            result.response for result in self.results if result.response is not None
+        )
+
+
+__all__ = ("SearchPage",)
@@ -0,0 +1,5 @@
+from metmuseum.utils.bounded_map import bounded_map
+from metmuseum.utils.single_flight import SingleFlight
+from metmuseum.utils.string_table import StringTable
+
+__all__ = "bounded_map", "SingleFlight", "StringTable"
@@ -0,0 +1,83 @@
+import asyncio
+from collections import deque
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    TypeVar,
+)
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+async def _aiter(items: Iterable[ItemT]) -> AsyncIterator[ItemT]:
+    for item in items:
+        yield item
+
+
+async def bounded_map(
+    func: Callable[[ItemT], Awaitable[ResultT]],
+    items: Iterable[ItemT] | AsyncIterable[ItemT],
+    concurrency: int,
+    ordered: bool = False,
+) -> AsyncIterator[ResultT]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be greater than zero.")
+
+    # async sources, such as streamed ids, are consumed as results are needed
+    items_iter = aiter(items) if isinstance(items, AsyncIterable) else _aiter(items)
+    pending: deque[asyncio.Task[ResultT]] = deque()
+    ready: list[asyncio.Task[ResultT]] = []
+    exhausted = False
+
+    async def schedule_next() -> None:
+        nonlocal exhausted
+        if exhausted:
+            return
+        try:
+            item = await anext(items_iter)
+        except StopAsyncIteration:
+            exhausted = True
+            return
+        pending.append(asyncio.ensure_future(func(item)))
+
+    try:
+        for _ in range(concurrency):
+            await schedule_next()
+
+        if ordered:
+            while pending:
+                result = await pending[0]
+                pending.popleft()
+                await schedule_next()
+                yield result
+        else:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    pending.remove(task)
+                    await schedule_next()
+                ready.extend(done)
+                while ready:
+                    yield ready.pop().result()
+    finally:
+        # finished tasks that were not yielded because an earlier one raised
+        # are still retrieved, so asyncio does not report their exceptions
+        for task in ready:
+            if not task.cancelled():
+                task.exception()
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        aclose = getattr(items_iter, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+__all__ = ("bounded_map",)
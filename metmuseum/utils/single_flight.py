@@ -0,0 +1,35 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ResultT = TypeVar("ResultT")
+
+
+class SingleFlight(Generic[KeyT, ResultT]):
+    __slots__ = ("__calls",)
+
+    def __init__(self):
+        self.__calls: dict[KeyT, asyncio.Future[ResultT]] = dict()
+
+    def __len__(self) -> int:
+        return len(self.__calls)
+
+    def __forget(self, key: KeyT, call: asyncio.Future[ResultT]) -> None:
+        if self.__calls.get(key) is call:
+            del self.__calls[key]
+        # the result may have no waiters left if all of them were cancelled
+        if not call.cancelled():
+            call.exception()
+
+    async def do(self, key: KeyT, func: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        call = self.__calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self.__calls[key] = call
+            call.add_done_callback(lambda done: self.__forget(key, done))
+
+        # a cancelled caller must not cancel the call shared with the others
+        return await asyncio.shield(call)
+
+
+__all__ = ("SingleFlight",)
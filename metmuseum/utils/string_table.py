@@ -0,0 +1,22 @@
+class StringTable:
+    # unlike sys.intern, the table can be dropped together with the cache it
+    # deduplicates, so its strings do not outlive the objects that use them
+    __slots__ = ("__strings",)
+
+    def __init__(self):
+        self.__strings: dict[str, str] = dict()
+
+    def __len__(self) -> int:
+        return len(self.__strings)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.__strings
+
+    def intern(self, value: str) -> str:
+        return self.__strings.setdefault(value, value)
+
+    def clear(self) -> None:
+        self.__strings.clear()
+
+
+__all__ = ("StringTable",)
@@ -1,4 +1,5 @@
 from .fake_gateway import FakeGateway
 from .fake_response import FakeResponse
+from .fake_router_gateway import FakeRouterGateway
 
-__all__ = "FakeGateway", "FakeResponse"
+__all__ = "FakeGateway", "FakeResponse", "FakeRouterGateway"
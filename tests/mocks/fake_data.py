@@ -0,0 +1,121 @@
+import json
+from http import HTTPStatus
+from typing import Any
+
+from tests.mocks.fake_response import FakeResponse
+
+OBJECT_EXAMPLE: dict[str, Any] = {
+    "objectID": 45734,
+    "isHighlight": False,
+    "accessionNumber": "36.100.45",
+    "accessionYear": "1936",
+    "isPublicDomain": True,
+    "primaryImage": "https://images.metmuseum.org/CRDImages/as/original/DP251139.jpg",
+    "primaryImageSmall": (
+        "https://images.metmuseum.org/CRDImages/as/web-large/DP251139.jpg"
+    ),
+    "additionalImages": [
+        "https://images.metmuseum.org/CRDImages/as/original/DP251138.jpg",
+        "https://images.metmuseum.org/CRDImages/as/original/DP251120.jpg",
+    ],
+    "constituents": [
+        {
+            "constituentID": 11986,
+            "role": "Artist",
+            "name": "Kiyohara Yukinobu",
+            "constituentULAN_URL": "http://vocab.getty.edu/page/ulan/500034433",
+            "constituentWikidata_URL": "https://www.wikidata.org/wiki/Q11560527",
+            "gender": "Female",
+        }
+    ],
+    "department": "Asian Art",
+    "objectName": "Hanging scroll",
+    "title": "Quail and Millet",
+    "culture": "Japan",
+    "period": "Edo period (1615–1868)",
+    "dynasty": "",
+    "reign": "",
+    "portfolio": "",
+    "artistRole": "Artist",
+    "artistPrefix": "",
+    "artistDisplayName": "Kiyohara Yukinobu",
+    "artistDisplayBio": "Japanese, 1643–1682",
+    "artistSuffix": "",
+    "artistAlphaSort": "Kiyohara Yukinobu",
+    "artistNationality": "Japanese",
+    "artistBeginDate": "1643",
+    "artistEndDate": "1682",
+    "artistGender": "Female",
+    "artistWikidata_URL": "https://www.wikidata.org/wiki/Q11560527",
+    "artistULAN_URL": "http://vocab.getty.edu/page/ulan/500034433",
+    "objectDate": "late 17th century",
+    "objectBeginDate": 1667,
+    "objectEndDate": 1682,
+    "medium": "Hanging scroll; ink and color on silk",
+    "dimensions": "46 5/8 x 18 3/4 in. (118.4 x 47.6 cm)",
+    "measurements": [
+        {
+            "elementName": "Overall",
+            "elementDescription": None,
+            "elementMeasurements": {"Height": 118.4, "Width": 47.6},
+        }
+    ],
+    "creditLine": "The Howard Mansfield Collection, Purchase, Rogers Fund, 1936",
+    "geographyType": "",
+    "city": "",
+    "state": "",
+    "county": "",
+    "country": "",
+    "region": "",
+    "subregion": "",
+    "locale": "",
+    "locus": "",
+    "excavation": "",
+    "river": "",
+    "classification": "Paintings",
+    "rightsAndReproduction": "",
+    "linkResource": "",
+    "metadataDate": "2020-09-14T12:26:37.48Z",
+    "repository": "Metropolitan Museum of Art, New York, NY",
+    "objectURL": "https://www.metmuseum.org/art/collection/search/45734",
+    "tags": [
+        {
+            "term": "Birds",
+            "AAT_URL": "http://vocab.getty.edu/page/aat/300266506",
+            "Wikidata_URL": "https://www.wikidata.org/wiki/Q5113",
+        }
+    ],
+    "objectWikidata_URL": "https://www.wikidata.org/wiki/Q29910832",
+    "isTimelineWork": False,
+    "GalleryNumber": "",
+}
+
+
+def make_object_data(object_id: int, **overrides: Any) -> bytes:
+    return json.dumps(OBJECT_EXAMPLE | {"objectID": object_id} | overrides).encode()
+
+
+def make_object_response(object_id: int, **overrides: Any) -> FakeResponse:
+    return FakeResponse(
+        url=f"https://fake.url/objects/{object_id}",
+        status_code=HTTPStatus.OK,
+        headers={"Content-Type": "application/json"},
+        data=make_object_data(object_id, **overrides),
+    )
+
+
+def make_error_response(url: str, status_code: HTTPStatus) -> FakeResponse:
+    return FakeResponse(
+        url=url,
+        status_code=status_code,
+        headers={"Content-Type": "application/json"},
+        data=json.dumps("error").encode(),
+    )
+
+
+__all__ = (
+    "OBJECT_EXAMPLE",
+    "make_object_data",
+    "make_object_response",
+    "make_error_response",
+)
@@ -1,7 +1,8 @@
 from http import HTTPStatus
-from typing import Mapping
+from typing import AsyncIterator, Mapping
 
 from metmuseum.responses import Response
+from metmuseum.types.exceptions import ResponseTooLargeException
 
 
 class FakeResponse(Response):
@@ -29,8 +30,14 @@ class FakeResponse(Response):
     def headers(self) -> Mapping[str, str]:
         return self.__headers
 
-    async def read(self) -> bytes:
+    async def read(self, max_size: int | None = None) -> bytes:
+        if max_size is not None and len(self.__data) > max_size:
+            raise ResponseTooLargeException(self.url, max_size)
         return self.__data
 
+    async def iter_chunks(self, size: int = 65536) -> AsyncIterator[bytes]:
+        for offset in range(0, len(self.__data), size):
+            yield self.__data[offset : offset + size]
+
 
 __all__ = ("FakeResponse",)
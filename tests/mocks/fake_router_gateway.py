@@ -0,0 +1,49 @@
+import asyncio
+from contextlib import asynccontextmanager
+from http import HTTPMethod
+from typing import AsyncIterator, Mapping, Sequence
+
+from metmuseum.gateways import HttpGateway
+from metmuseum.responses import Response
+
+RouteT = Response | Exception | Sequence[Response | Exception]
+
+
+class FakeRouterGateway(HttpGateway):
+    def __init__(self, routes: Mapping[str, RouteT], delay: float = 0.0):
+        self.__routes = {
+            url: list(route) if isinstance(route, Sequence) else [route]
+            for url, route in routes.items()
+        }
+        self.__delay = delay
+        self.requests: list[tuple[HTTPMethod, str, Mapping[str, str] | None]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @asynccontextmanager
+    async def make_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        query: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> AsyncIterator[Response]:
+        self.requests.append((method, url, query))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.__delay:
+                await asyncio.sleep(self.__delay)
+
+            route = self.__routes[url]
+            # the last response of a route is repeated forever
+            response = route.pop(0) if len(route) > 1 else route[0]
+            if isinstance(response, Exception):
+                raise response
+            yield response
+        finally:
+            self.in_flight -= 1
+
+
+__all__ = ("FakeRouterGateway",)
@@ -5,6 +5,7 @@ from os import getenv
 import pytest
 
 from metmuseum.gateways import AiohttpGateway
+from metmuseum.types.exceptions import ResponseTooLargeException
 
 
 @pytest.fixture
@@ -118,3 +119,47 @@ async def test_httpbin_status_code(httpbin_url: str, aiohttp_gateway: AiohttpGat
         httpbin_url + "/status/500",
     ) as response:
         assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+async def test_httpbin_pooled_session(httpbin_url: str):
+    async with AiohttpGateway(limit=10, limit_per_host=5) as aiohttp_gateway:
+        assert aiohttp_gateway.is_started
+
+        async with aiohttp_gateway.get_session() as first_session:
+            pass
+
+        for _ in range(3):
+            async with aiohttp_gateway.make_request(
+                HTTPMethod.GET, httpbin_url + "/get"
+            ) as response:
+                assert response.status_code == HTTPStatus.OK
+
+        async with aiohttp_gateway.get_session() as second_session:
+            assert first_session is second_session
+
+    assert not aiohttp_gateway.is_started
+    assert first_session.closed
+
+
+@pytest.mark.parametrize("path", ("/bytes/2048", "/stream-bytes/2048"))
+async def test_httpbin_bounded_read(
+    httpbin_url: str, aiohttp_gateway: AiohttpGateway, path: str
+):
+    async with aiohttp_gateway.make_request(
+        HTTPMethod.GET, httpbin_url + path
+    ) as response:
+        with pytest.raises(ResponseTooLargeException):
+            await response.read(max_size=1024)
+
+    async with aiohttp_gateway.make_request(
+        HTTPMethod.GET, httpbin_url + path
+    ) as response:
+        assert len(await response.read(max_size=2048)) == 2048
+
+
+async def test_httpbin_spool(httpbin_url: str, aiohttp_gateway: AiohttpGateway):
+    async with aiohttp_gateway.make_request(
+        HTTPMethod.GET, httpbin_url + "/stream-bytes/4096"
+    ) as response:
+        with await response.spool(max_memory_size=1024, chunk_size=512) as file:
+            assert len(file.read()) == 4096
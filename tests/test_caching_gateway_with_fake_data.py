@@ -0,0 +1,165 @@
+import asyncio
+from http import HTTPMethod, HTTPStatus
+
+import pytest
+
+from metmuseum.gateways import CachingGateway
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import exceptions
+from tests.mocks import FakeResponse, FakeRouterGateway
+from tests.mocks.fake_data import (
+    make_error_response,
+    make_object_data,
+    make_object_response,
+)
+
+SEARCH_URL = "https://fake.url/search"
+
+
+@pytest.fixture
+def fake_router_gateway() -> FakeRouterGateway:
+    routes = {
+        f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+        for object_id in range(1, 6)
+    }
+    routes["https://fake.url/objects/404"] = make_error_response(
+        "https://fake.url/objects/404", HTTPStatus.NOT_FOUND
+    )
+    routes[SEARCH_URL] = FakeResponse(
+        url=SEARCH_URL,
+        status_code=HTTPStatus.OK,
+        headers={},
+        data=b'{"total": 1, "objectIDs": [1]}',
+    )
+    return FakeRouterGateway(routes)
+
+
+async def test_cache_hits(fake_router_gateway: FakeRouterGateway):
+    gateway = CachingGateway(fake_router_gateway)
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    first = await metmuseum.get_object(1)
+    second = await metmuseum.get_object(1)
+
+    assert first == second
+    assert len(fake_router_gateway.requests) == 1
+    assert gateway.hits == 1
+    assert gateway.misses == 1
+    assert len(gateway) == 1
+    assert gateway.nbytes > 0
+
+
+async def test_cache_normalizes_query(fake_router_gateway: FakeRouterGateway):
+    gateway = CachingGateway(fake_router_gateway)
+
+    for query in ({"q": "cat", "title": "true"}, {"title": "true", "q": "cat"}):
+        async with gateway.make_request(HTTPMethod.GET, SEARCH_URL, query) as response:
+            assert response.status_code == HTTPStatus.OK
+
+    async with gateway.make_request(HTTPMethod.GET, SEARCH_URL, {"q": "dog"}):
+        pass
+
+    assert len(fake_router_gateway.requests) == 2
+
+
+async def test_cache_skips_errors(fake_router_gateway: FakeRouterGateway):
+    gateway = CachingGateway(fake_router_gateway)
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    for _ in range(2):
+        with pytest.raises(exceptions.ClientException):
+            await metmuseum.get_object(404)
+
+    assert len(fake_router_gateway.requests) == 2
+    assert len(gateway) == 0
+
+
+async def test_cache_ttl_per_endpoint(fake_router_gateway: FakeRouterGateway):
+    gateway = CachingGateway(
+        fake_router_gateway, ttl=None, ttls={r"^/search$": 0.01, r"/objects/2$": 0}
+    )
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    assert gateway.get_ttl("https://fake.url/objects/1") is None
+    assert gateway.get_ttl(SEARCH_URL) == 0.01
+
+    await metmuseum.search("cat")
+    await metmuseum.search("cat")
+    await asyncio.sleep(0.02)
+    await metmuseum.search("cat")
+    await metmuseum.get_object(2)
+    await metmuseum.get_object(2)
+
+    assert len(fake_router_gateway.requests) == 4
+
+
+async def test_cache_lru_eviction(fake_router_gateway: FakeRouterGateway):
+    gateway = CachingGateway(fake_router_gateway, max_entries=2)
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    for object_id in (1, 2, 1, 3, 1, 2):
+        await metmuseum.get_object(object_id)
+
+    # 2 was the least recently used entry when 3 was added
+    assert [url for _, url, _ in fake_router_gateway.requests] == [
+        "https://fake.url/objects/1",
+        "https://fake.url/objects/2",
+        "https://fake.url/objects/3",
+        "https://fake.url/objects/2",
+    ]
+    assert len(gateway) == 2
+
+
+async def test_cache_max_bytes(fake_router_gateway: FakeRouterGateway):
+    gateway = CachingGateway(fake_router_gateway, max_bytes=5000)
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    for object_id in range(1, 6):
+        await metmuseum.get_object(object_id)
+
+    assert 0 < gateway.nbytes <= 5000
+    assert len(gateway) < 5
+
+
+async def test_cache_invalidation(fake_router_gateway: FakeRouterGateway):
+    gateway = CachingGateway(fake_router_gateway)
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    await metmuseum.get_object(1)
+    await metmuseum.get_object(2)
+    assert gateway.invalidate("https://fake.url/objects/1") == 1
+    await metmuseum.get_object(1)
+    gateway.clear()
+    await metmuseum.get_object(2)
+
+    assert len(fake_router_gateway.requests) == 4
+    assert len(gateway) == 1
+
+
+async def test_cache_streams_bodies_larger_than_max_entry_size():
+    url = "https://fake.url/objects/1"
+    sized_url = "https://fake.url/objects/2"
+    data = make_object_data(1)
+    fake_gateway = FakeRouterGateway(
+        {
+            url: FakeResponse(url=url, status_code=HTTPStatus.OK, headers={}, data=data),
+            sized_url: FakeResponse(
+                url=sized_url,
+                status_code=HTTPStatus.OK,
+                headers={"Content-Length": str(len(data))},
+                data=data,
+            ),
+        }
+    )
+    gateway = CachingGateway(fake_gateway, max_entry_size=100)
+
+    for _ in range(2):
+        async with gateway.make_request(HTTPMethod.GET, url) as response:
+            assert b"".join([chunk async for chunk in response.iter_chunks(64)]) == data
+        async with gateway.make_request(HTTPMethod.GET, sized_url) as response:
+            assert await response.read() == data
+
+    assert len(fake_gateway.requests) == 4
+    assert len(gateway) == 0
+    with pytest.raises(ValueError):
+        CachingGateway(fake_gateway, max_entry_size=0)
@@ -0,0 +1,202 @@
+import asyncio
+from http import HTTPMethod, HTTPStatus
+
+import pytest
+from aiohttp import ClientConnectionError
+
+from metmuseum.gateways import (
+    CircuitBreaker,
+    CircuitBreakerGateway,
+    CircuitState,
+    RetryingGateway,
+    RetryPolicy,
+)
+from metmuseum.gateways.circuit_breaker_gateway import get_endpoint
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import exceptions, responses
+from tests.mocks import FakeRouterGateway
+from tests.mocks.fake_data import make_error_response, make_object_response
+
+OBJECT_URL = "https://fake.url/objects/1"
+SEARCH_URL = "https://fake.url/search"
+
+
+def test_endpoints_group_object_ids():
+    assert get_endpoint("https://fake.url/objects/1") == "fake.url/objects/{id}"
+    assert get_endpoint("https://fake.url/objects/2?x=1") == "fake.url/objects/{id}"
+    assert get_endpoint("https://fake.url/objects") == "fake.url/objects"
+    assert get_endpoint("https://fake.url/v1/search") == "fake.url/v1/search"
+    assert get_endpoint("https://images.fake.url/original/DP1.jpg") == "images.fake.url"
+
+
+async def test_idle_circuits_are_evicted():
+    urls = [f"https://fake.url/page-{number}" for number in range(4)]
+    fake_gateway = FakeRouterGateway(
+        {url: make_error_response(url, HTTPStatus.NOT_FOUND) for url in urls[:3]}
+        | {urls[3]: make_error_response(urls[3], HTTPStatus.BAD_GATEWAY)}
+    )
+    gateway = CircuitBreakerGateway(fake_gateway, max_endpoints=2)
+
+    for url in reversed(urls):
+        async with gateway.make_request(HTTPMethod.GET, url):
+            pass
+
+    # the circuit with a failure is kept, the idle ones make room for new endpoints
+    assert sorted(gateway.breakers) == ["fake.url/page-0", "fake.url/page-3"]
+    assert gateway.breakers["fake.url/page-3"].failures == 1
+
+
+async def test_circuit_opens_after_failures_and_fails_fast():
+    fake_gateway = FakeRouterGateway(
+        {
+            OBJECT_URL: make_error_response(OBJECT_URL, HTTPStatus.SERVICE_UNAVAILABLE),
+            "https://fake.url/objects/2": ClientConnectionError(),
+            SEARCH_URL: make_error_response(SEARCH_URL, HTTPStatus.BAD_REQUEST),
+        }
+    )
+    gateway = CircuitBreakerGateway(fake_gateway, failure_threshold=3)
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    with pytest.raises(exceptions.ServerException):
+        await metmuseum.get_object(1)
+    with pytest.raises(ClientConnectionError):
+        await metmuseum.get_object(2)
+    with pytest.raises(exceptions.ServerException):
+        await metmuseum.get_object(1)
+
+    with pytest.raises(exceptions.CircuitOpenException) as exc_info:
+        await metmuseum.get_object(3)
+
+    assert exc_info.value.endpoint == "fake.url/objects/{id}"
+    assert 0 < exc_info.value.retry_after <= 30
+    assert gateway.get_state(OBJECT_URL) is CircuitState.OPEN
+    assert len(fake_gateway.requests) == 3
+
+    # client errors do not count and other endpoints have their own circuit
+    for _ in range(5):
+        with pytest.raises(exceptions.ClientException):
+            await metmuseum.search("quail")
+    assert gateway.get_state(SEARCH_URL) is CircuitState.CLOSED
+
+
+async def test_get_objects_reports_open_circuits_per_object():
+    fake_gateway = FakeRouterGateway(
+        {
+            f"https://fake.url/objects/{object_id}": make_error_response(
+                f"https://fake.url/objects/{object_id}", HTTPStatus.BAD_GATEWAY
+            )
+            for object_id in range(1, 3)
+        }
+    )
+    gateway = CircuitBreakerGateway(fake_gateway, failure_threshold=2)
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    object_results = [
+        result
+        async for result in metmuseum.get_objects(
+            range(1, 6), concurrency=1, ordered=True
+        )
+    ]
+
+    assert [result.id for result in object_results] == [1, 2, 3, 4, 5]
+    assert all(
+        isinstance(result.exception, exceptions.ServerException)
+        for result in object_results[:2]
+    )
+    assert all(
+        isinstance(result.exception, exceptions.CircuitOpenException)
+        for result in object_results[2:]
+    )
+    assert len(fake_gateway.requests) == 2
+
+
+async def test_circuit_recovers_through_half_open():
+    fake_gateway = FakeRouterGateway(
+        {
+            OBJECT_URL: [
+                make_error_response(OBJECT_URL, HTTPStatus.BAD_GATEWAY),
+                make_error_response(OBJECT_URL, HTTPStatus.BAD_GATEWAY),
+                make_object_response(1),
+            ]
+        },
+        delay=0.01,
+    )
+    gateway = CircuitBreakerGateway(
+        fake_gateway, failure_threshold=1, recovery_timeout=0.05
+    )
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    with pytest.raises(exceptions.ServerException):
+        await metmuseum.get_object(1)
+    await asyncio.sleep(0.06)
+
+    # a failed trial request opens the circuit again
+    assert gateway.get_state(OBJECT_URL) is CircuitState.HALF_OPEN
+    with pytest.raises(exceptions.ServerException):
+        await metmuseum.get_object(1)
+    assert gateway.get_state(OBJECT_URL) is CircuitState.OPEN
+    await asyncio.sleep(0.06)
+
+    # only one trial request is sent, the others fail fast until it succeeds
+    object_results = await asyncio.gather(
+        metmuseum.get_object(1), metmuseum.get_object(1), return_exceptions=True
+    )
+
+    assert isinstance(object_results[0], responses.ObjectResponse)
+    assert isinstance(object_results[1], exceptions.CircuitOpenException)
+    assert gateway.get_state(OBJECT_URL) is CircuitState.CLOSED
+    assert isinstance(await metmuseum.get_object(1), responses.ObjectResponse)
+    assert len(fake_gateway.requests) == 4
+
+
+async def test_cancelled_trial_does_not_close_the_circuit():
+    fake_gateway = FakeRouterGateway(
+        {OBJECT_URL: make_error_response(OBJECT_URL, HTTPStatus.BAD_GATEWAY)},
+        delay=0.05,
+    )
+    gateway = CircuitBreakerGateway(
+        fake_gateway, failure_threshold=1, recovery_timeout=0
+    )
+
+    async with gateway.make_request(HTTPMethod.GET, OBJECT_URL):
+        pass
+    assert gateway.get_state(OBJECT_URL) is CircuitState.HALF_OPEN
+
+    async def make_request() -> None:
+        async with gateway.make_request(HTTPMethod.GET, OBJECT_URL):
+            pass
+
+    task = asyncio.create_task(make_request())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # the trial slot is free again
+    assert gateway.get_state(OBJECT_URL) is CircuitState.HALF_OPEN
+    assert gateway.breakers["fake.url/objects/{id}"].acquire() is CircuitState.HALF_OPEN
+
+
+async def test_open_circuit_is_not_retried():
+    fake_gateway = FakeRouterGateway(
+        {OBJECT_URL: make_error_response(OBJECT_URL, HTTPStatus.SERVICE_UNAVAILABLE)}
+    )
+    gateway = RetryingGateway(
+        CircuitBreakerGateway(fake_gateway, failure_threshold=2),
+        RetryPolicy(max_attempts=5, base_delay=0.001),
+    )
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    with pytest.raises(exceptions.CircuitOpenException):
+        await metmuseum.get_object(1)
+
+    assert len(fake_gateway.requests) == 2
+
+
+def test_circuit_breaker_validates_arguments():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreakerGateway(FakeRouterGateway({}), recovery_timeout=-1)
+    with pytest.raises(ValueError):
+        CircuitBreakerGateway(FakeRouterGateway({}), max_endpoints=0)
@@ -0,0 +1,185 @@
+from datetime import date, datetime, timedelta, timezone
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.mirror import CollectionMirror, MirrorReport, SqliteMirrorState
+from metmuseum.stores import SqliteObjectStore
+from metmuseum.types import responses
+from tests.mocks import FakeResponse, FakeRouterGateway
+from tests.mocks.fake_data import (
+    make_error_response,
+    make_object_data,
+    make_object_response,
+)
+
+YESTERDAY = datetime.now(timezone.utc).date() - timedelta(days=1)
+
+
+def make_objects_response(ids: list[int]) -> FakeResponse:
+    return FakeResponse(
+        url="https://fake.url/objects",
+        status_code=HTTPStatus.OK,
+        headers={},
+        data=f'{{"total": {len(ids)}, "objectIDs": {ids}}}'.encode(),
+    )
+
+
+@pytest.fixture
+async def object_store(tmp_path: Path):
+    async with SqliteObjectStore(tmp_path / "objects.sqlite3") as store:
+        yield store
+
+
+@pytest.fixture
+async def mirror_state(tmp_path: Path):
+    async with SqliteMirrorState(tmp_path / "mirror.sqlite3") as state:
+        yield state
+
+
+def make_mirror(
+    gateway: FakeRouterGateway,
+    object_store: SqliteObjectStore,
+    mirror_state: SqliteMirrorState,
+    **kwargs,
+) -> CollectionMirror:
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+    return CollectionMirror(metmuseum, object_store, mirror_state, **kwargs)
+
+
+async def test_first_sync_fetches_everything(
+    object_store: SqliteObjectStore, mirror_state: SqliteMirrorState
+):
+    routes = {
+        f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+        for object_id in (1, 2, 3)
+    }
+    routes["https://fake.url/objects"] = make_objects_response([1, 2, 3])
+    gateway = FakeRouterGateway(routes)
+    reports: list[MirrorReport] = []
+    mirror = make_mirror(
+        gateway, object_store, mirror_state, batch_size=2, on_progress=reports.append
+    )
+
+    report = await mirror.sync()
+
+    assert report.since is None
+    assert report.checkpoint == YESTERDAY
+    assert (report.total, report.fetched, report.removed, report.failed) == (3, 3, 0, 0)
+    assert report.is_complete
+    assert report.lag == timedelta(days=1)
+    assert [r.processed for r in reports] == [2, 3]
+    assert await object_store.count() == 3
+    assert await mirror_state.get_checkpoint() == YESTERDAY
+    assert await mirror_state.get_run() is None
+    # the first sync lists the whole collection
+    assert gateway.requests[0][2] is None
+
+
+async def test_sync_since_checkpoint_removes_deleted_objects(
+    object_store: SqliteObjectStore, mirror_state: SqliteMirrorState
+):
+    await object_store.put(
+        responses.ObjectResponse.model_validate_json(make_object_data(2))
+    )
+    await mirror_state.finish_run(date(2024, 1, 1))
+    routes = {
+        "https://fake.url/objects": make_objects_response([1, 2]),
+        "https://fake.url/objects/1": make_object_response(1),
+        "https://fake.url/objects/2": make_error_response(
+            "https://fake.url/objects/2", HTTPStatus.NOT_FOUND
+        ),
+    }
+    gateway = FakeRouterGateway(routes)
+
+    report = await make_mirror(gateway, object_store, mirror_state).sync()
+
+    assert report.since == date(2024, 1, 1)
+    assert (report.fetched, report.removed, report.failed) == (1, 1, 0)
+    assert await object_store.get(1) is not None
+    assert await object_store.get(2) is None
+    assert gateway.requests[0][2] == {"metadataDate": "2024-01-01"}
+
+
+async def test_failed_objects_stay_pending_and_resume(
+    object_store: SqliteObjectStore, mirror_state: SqliteMirrorState
+):
+    routes = {
+        "https://fake.url/objects": make_objects_response([1, 2]),
+        "https://fake.url/objects/1": make_object_response(1),
+        "https://fake.url/objects/2": [
+            make_error_response("https://fake.url/objects/2", HTTPStatus.BAD_GATEWAY),
+            make_object_response(2),
+        ],
+    }
+    gateway = FakeRouterGateway(routes)
+    mirror = make_mirror(gateway, object_store, mirror_state)
+
+    report = await mirror.sync()
+
+    assert (report.fetched, report.failed, report.pending) == (1, 1, 1)
+    assert not report.is_complete
+    assert report.checkpoint is None
+    assert list(await mirror_state.get_pending_ids()) == [2]
+
+    report = await mirror.sync()
+
+    assert report.resumed
+    assert (report.total, report.fetched, report.failed) == (1, 1, 0)
+    assert report.checkpoint == YESTERDAY
+    assert await object_store.count() == 2
+    # the resumed run does not list the collection again
+    assert [url for _, url, _ in gateway.requests].count("https://fake.url/objects") == 1
+
+
+async def test_permanent_failures_do_not_hold_the_checkpoint_back(
+    object_store: SqliteObjectStore, mirror_state: SqliteMirrorState
+):
+    routes = {
+        "https://fake.url/objects": [
+            make_objects_response([1, 2, 3]),
+            make_objects_response([1]),
+        ],
+        "https://fake.url/objects/1": make_object_response(1),
+        "https://fake.url/objects/2": make_error_response(
+            "https://fake.url/objects/2", HTTPStatus.INTERNAL_SERVER_ERROR
+        ),
+        "https://fake.url/objects/3": FakeResponse(
+            url="https://fake.url/objects/3",
+            status_code=HTTPStatus.OK,
+            headers={},
+            data=b"{}",
+        ),
+    }
+    gateway = FakeRouterGateway(routes)
+    mirror = make_mirror(gateway, object_store, mirror_state)
+
+    # an object that does not decode fails on its own
+    report = await mirror.sync()
+    assert (report.fetched, report.failed, report.checkpoint) == (1, 2, None)
+
+    # the resumed run finishes and carries the failures into the next one
+    report = await mirror.sync()
+    assert report.resumed
+    assert (report.total, report.failed, report.checkpoint) == (2, 2, YESTERDAY)
+    assert await mirror_state.get_run() is None
+    assert list(await mirror_state.get_pending_ids()) == [2, 3]
+
+    report = await mirror.sync()
+    assert not report.resumed
+    assert (report.total, report.fetched, report.failed) == (3, 1, 2)
+    assert [url for _, url, _ in gateway.requests].count("https://fake.url/objects") == 2
+
+
+async def test_mirror_state_persists_run(tmp_path: Path):
+    path = tmp_path / "mirror.sqlite3"
+    async with SqliteMirrorState(path) as state:
+        await state.begin_run(YESTERDAY, date(2024, 1, 1), [3, 1, 2])
+        await state.complete([1])
+
+    async with SqliteMirrorState(path) as state:
+        assert await state.get_run() == (YESTERDAY, date(2024, 1, 1))
+        assert list(await state.get_pending_ids()) == [2, 3]
+        assert await state.get_checkpoint() is None
@@ -0,0 +1,194 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from metmuseum.decoders import (
+    InterningDecoder,
+    ProcessPoolDecoder,
+    PydanticDecoder,
+    TrustedDecoder,
+)
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import models, responses
+from metmuseum.utils import StringTable
+from tests.mocks import FakeGateway
+from tests.mocks.fake_data import make_object_data, make_object_response
+
+PAYLOADS: tuple[tuple[type[BaseModel], bytes], ...] = (
+    (responses.ObjectResponse, make_object_data(45734)),
+    (
+        responses.ObjectResponse,
+        make_object_data(
+            1,
+            constituents=None,
+            tags=None,
+            measurements=None,
+            title="",
+            artistBeginDate=1643,
+            dimensionsParsed=[
+                {"element": "Overall", "dimensionType": "Height", "dimension": 1.5}
+            ],
+        ),
+    ),
+    (responses.ObjectsResponse, b'{"total": 3, "objectIDs": [1, 2, 3]}'),
+    (responses.CompactObjectsResponse, b'{"total": 3, "objectIDs": [1, 2, 3]}'),
+    (responses.SearchResponse, b'{"total": 0, "objectIDs": null}'),
+    (
+        responses.DepartmentsResponse,
+        b'{"departments": [{"departmentId": 1, "displayName": "Arms and Armor"}]}',
+    ),
+)
+
+
+@pytest.mark.parametrize("type_, data", PAYLOADS)
+async def test_trusted_decoder_matches_pydantic(type_: type[BaseModel], data: bytes):
+    validated = await PydanticDecoder().decode(data, type_)
+    trusted = await TrustedDecoder().decode(data, type_)
+
+    assert type(trusted) is type_
+    assert trusted == validated
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+async def test_trusted_decoder_normalizes_values():
+    trusted = await TrustedDecoder().decode(
+        make_object_data(1, title="", objectBeginDate=1667), responses.ObjectResponse
+    )
+
+    assert trusted.title is None
+    assert trusted.begin_date == "1667"
+    assert trusted.dimensions_parsed == ()
+    assert isinstance(trusted.constituents, tuple)
+    assert isinstance(trusted.constituents[0], models.ObjectConstituent)
+
+
+async def test_trusted_decoder_with_missing_field():
+    with pytest.raises(ValueError):
+        await TrustedDecoder().decode(b'{"total": 1}', responses.ObjectsResponse)
+
+
+async def test_facade_with_trusted_decoder():
+    metmuseum = MetMuseum(
+        gateway=FakeGateway(make_object_response(45734)),
+        base_url="https://fake.url",
+        decoder=TrustedDecoder(),
+    )
+
+    object_response = await metmuseum.get_object(45734)
+
+    assert isinstance(object_response, responses.ObjectResponse)
+    assert object_response.id == 45734
+
+
+async def test_facade_with_default_decoder():
+    metmuseum = MetMuseum(
+        gateway=FakeGateway(make_object_response(45734)), base_url="https://fake.url"
+    )
+
+    assert isinstance(metmuseum.decoder, PydanticDecoder)
+    assert (await metmuseum.get_object(45734)).id == 45734
+
+
+@pytest.fixture
+async def process_pool_decoder():
+    async with ProcessPoolDecoder(max_workers=2, batch_size=4, min_size=0) as decoder:
+        yield decoder
+
+
+@pytest.mark.parametrize("type_, data", PAYLOADS)
+async def test_process_pool_decoder_matches_pydantic(
+    process_pool_decoder: ProcessPoolDecoder, type_: type[BaseModel], data: bytes
+):
+    expected = await PydanticDecoder().decode(data, type_)
+
+    assert await process_pool_decoder.decode(data, type_) == expected
+
+
+async def test_process_pool_decoder_batches_payloads(
+    process_pool_decoder: ProcessPoolDecoder,
+):
+    projection = responses.get_object_projection(("title",))
+
+    objs = await asyncio.gather(
+        *(
+            process_pool_decoder.decode(make_object_data(object_id), projection)
+            for object_id in range(1, 11)
+        )
+    )
+
+    assert [obj.id for obj in objs] == list(range(1, 11))
+    assert all(type(obj) is projection for obj in objs)
+    # two full batches and the remainder flushed after batch_delay
+    assert process_pool_decoder.batches == 3
+
+
+async def test_process_pool_decoder_raises_validation_error(
+    process_pool_decoder: ProcessPoolDecoder,
+):
+    with pytest.raises(ValidationError):
+        await process_pool_decoder.decode(b'{"total": 1}', responses.ObjectsResponse)
+
+
+async def test_process_pool_decoder_with_min_size():
+    async with ProcessPoolDecoder(min_size=1024) as decoder:
+        metmuseum = MetMuseum(
+            gateway=FakeGateway(make_object_response(45734)),
+            base_url="https://fake.url",
+            decoder=decoder,
+        )
+        objects_response = await decoder.decode(
+            b'{"total": 3, "objectIDs": [1, 2, 3]}', responses.ObjectsResponse
+        )
+
+        assert (await metmuseum.get_object(45734)).id == 45734
+        assert objects_response.ids == (1, 2, 3)
+        assert decoder.batches == 1
+
+
+@pytest.mark.parametrize("type_, data", PAYLOADS)
+@pytest.mark.parametrize("decoder", (PydanticDecoder(), TrustedDecoder()))
+async def test_interning_decoder_matches_wrapped_decoder(
+    decoder, type_: type[BaseModel], data: bytes
+):
+    expected = await decoder.decode(data, type_)
+
+    assert await InterningDecoder(decoder).decode(data, type_) == expected
+
+
+@pytest.mark.parametrize("decoder", (PydanticDecoder(), TrustedDecoder()))
+async def test_interning_decoder_shares_strings(decoder):
+    interning_decoder = InterningDecoder(decoder)
+
+    first, second = [
+        await interning_decoder.decode(
+            make_object_data(object_id), responses.ObjectResponse
+        )
+        for object_id in (1, 2)
+    ]
+
+    assert first.culture is second.culture
+    assert first.medium is second.medium
+    assert first.credit_line is second.credit_line
+    assert first.tags is not None and second.tags is not None
+    assert first.tags[0].term is second.tags[0].term
+    assert first.constituents is not None and second.constituents is not None
+    assert first.constituents[0].role is second.constituents[0].role
+    assert first.culture in interning_decoder.table
+    # unique values are not interned
+    assert first.accession_number not in interning_decoder.table
+
+
+async def test_interning_decoder_with_custom_fields():
+    table = StringTable()
+    decoder = InterningDecoder(table=table, fields={models.ObjectTag: ("term",)})
+
+    obj = await decoder.decode(make_object_data(45734), responses.ObjectResponse)
+
+    assert obj.tags is not None
+    assert len(table) == len({tag.term for tag in obj.tags})
+    assert all(tag.term in table for tag in obj.tags)
+    assert obj.department not in table
+    table.clear()
+    assert len(table) == 0
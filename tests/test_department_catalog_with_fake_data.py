@@ -0,0 +1,133 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+
+from metmuseum.metmuseum import MetMuseum
+from tests.mocks import FakeRouterGateway
+from tests.mocks.fake_response import FakeResponse
+
+DEPARTMENTS_URL = "https://fake.url/departments"
+
+
+def make_departments_response(*names: str) -> FakeResponse:
+    return FakeResponse(
+        url=DEPARTMENTS_URL,
+        status_code=HTTPStatus.OK,
+        headers={"Content-Type": "application/json"},
+        data=json.dumps(
+            {
+                "departments": [
+                    {"departmentId": department_id, "displayName": name}
+                    for department_id, name in enumerate(names, start=1)
+                ]
+            }
+        ).encode(),
+    )
+
+
+@pytest.fixture
+def gateway() -> FakeRouterGateway:
+    return FakeRouterGateway(
+        {
+            DEPARTMENTS_URL: [
+                make_departments_response("American Decorative Arts", "Asian Art"),
+                make_departments_response("American Decorative Arts", "Arts of Asia"),
+            ]
+        },
+        delay=0.01,
+    )
+
+
+async def test_lookups_share_one_request(gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+    catalog = metmuseum.departments
+
+    departments = await asyncio.gather(
+        catalog.get(2), catalog.get_by_name("ASIAN ART"), catalog.get_id("asian art")
+    )
+
+    assert departments[0] is not None and departments[0].display_name == "Asian Art"
+    assert departments[1] is departments[0]
+    assert departments[2] == 2
+    assert await catalog.get(42) is None
+    assert await catalog.get_by_name("Arms and Armor") is None
+    assert [
+        department.id for department in (await catalog.get_departments()).departments
+    ] == [1, 2]
+    assert catalog.loads == 1
+    assert len(gateway.requests) == 1
+
+
+async def test_refresh_after_ttl(gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(
+        gateway=gateway, base_url="https://fake.url", departments_ttl=0.05
+    )
+    catalog = metmuseum.departments
+
+    assert await catalog.get_id("Asian Art") == 2
+    assert catalog.is_fresh
+
+    await asyncio.sleep(0.06)
+
+    assert not catalog.is_fresh
+    assert await catalog.get_id("Asian Art") is None
+    assert await catalog.get_id("Arts of Asia") == 2
+    assert catalog.loads == 2
+
+
+async def test_invalidate(gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+    catalog = metmuseum.departments
+
+    assert await catalog.get_id("Asian Art") == 2
+
+    catalog.invalidate()
+
+    assert not catalog.is_fresh
+    assert await catalog.get_id("Arts of Asia") == 2
+    assert len(gateway.requests) == 2
+
+
+async def test_invalidate_during_load(gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+    catalog = metmuseum.departments
+
+    stale = asyncio.create_task(catalog.get_departments())
+    await asyncio.sleep(0)
+    catalog.invalidate()
+
+    # a caller after invalidate() does not join the load that started before it
+    assert await catalog.get_id("Arts of Asia") == 2
+    assert (await stale).departments[1].display_name == "Asian Art"
+    assert await catalog.get_id("Arts of Asia") == 2
+    assert catalog.loads == 1
+    assert len(gateway.requests) == 2
+
+
+async def test_lookup_overlapping_invalidate(gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+    catalog = metmuseum.departments
+
+    # the lookup is answered by the load it waited for, even though it is dropped
+    lookup = asyncio.create_task(catalog.get_by_name("Asian Art"))
+    await asyncio.sleep(0)
+    catalog.invalidate()
+
+    department = await lookup
+    assert department is not None and department.id == 2
+    assert not catalog.is_fresh
+    assert await catalog.get_id("Arts of Asia") == 2
+
+
+async def test_without_ttl_departments_are_loaded_once(gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(
+        gateway=gateway, base_url="https://fake.url", departments_ttl=None
+    )
+
+    for _ in range(3):
+        assert await metmuseum.departments.get_id("Asian Art") == 2
+
+    assert metmuseum.departments.ttl is None
+    assert len(gateway.requests) == 1
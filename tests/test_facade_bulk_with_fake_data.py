@@ -0,0 +1,122 @@
+import asyncio
+import gc
+from http import HTTPStatus
+
+import pytest
+from aiohttp import ClientConnectionError
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import exceptions, responses
+from metmuseum.utils import bounded_map
+from tests.mocks import FakeRouterGateway
+from tests.mocks.fake_data import make_error_response, make_object_response
+
+
+@pytest.fixture
+def fake_router_gateway() -> FakeRouterGateway:
+    routes = {
+        f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+        for object_id in range(1, 21)
+    }
+    routes["https://fake.url/objects/13"] = make_error_response(
+        "https://fake.url/objects/13", HTTPStatus.NOT_FOUND
+    )
+    routes["https://fake.url/objects/17"] = make_error_response(
+        "https://fake.url/objects/17", HTTPStatus.BAD_GATEWAY
+    )
+    return FakeRouterGateway(routes, delay=0.001)
+
+
+async def test_get_objects_in_input_order(fake_router_gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=fake_router_gateway, base_url="https://fake.url")
+    ids = tuple(range(1, 21))
+
+    results = [r async for r in metmuseum.get_objects(ids, concurrency=4, ordered=True)]
+
+    assert [r.id for r in results] == list(ids)
+    assert fake_router_gateway.max_in_flight == 4
+
+    for result in results:
+        if result.id == 13:
+            assert not result.ok
+            assert isinstance(result.exception, exceptions.ClientException)
+            assert result.exception.status_code == HTTPStatus.NOT_FOUND
+        elif result.id == 17:
+            assert isinstance(result.exception, exceptions.ServerException)
+        else:
+            assert result.ok
+            assert isinstance(result.response, responses.ObjectResponse)
+            assert result.response.id == result.id
+
+
+async def test_get_objects_in_completion_order(fake_router_gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=fake_router_gateway, base_url="https://fake.url")
+
+    results = [r async for r in metmuseum.get_objects(range(1, 21), concurrency=3)]
+
+    assert sorted(r.id for r in results) == list(range(1, 21))
+    assert sum(not r.ok for r in results) == 2
+    assert fake_router_gateway.max_in_flight == 3
+
+
+async def test_get_objects_reports_transport_errors_per_object():
+    routes = {
+        f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+        for object_id in range(1, 5)
+    }
+    routes["https://fake.url/objects/2"] = ClientConnectionError()
+    routes["https://fake.url/objects/3"] = TimeoutError()
+    metmuseum = MetMuseum(gateway=FakeRouterGateway(routes), base_url="https://fake.url")
+
+    results = [r async for r in metmuseum.get_objects(range(1, 5), ordered=True)]
+
+    assert [r.id for r in results] == [1, 2, 3, 4]
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert isinstance(results[1].exception, ClientConnectionError)
+    assert isinstance(results[2].exception, TimeoutError)
+
+
+async def test_get_objects_stops_on_close(fake_router_gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=fake_router_gateway, base_url="https://fake.url")
+
+    results = metmuseum.get_objects(range(1, 21), concurrency=2, ordered=True)
+    async for result in results:
+        assert result.id == 1
+        break
+    await results.aclose()
+
+    assert len(fake_router_gateway.requests) <= 3
+    assert fake_router_gateway.in_flight == 0
+
+
+async def test_get_objects_with_invalid_concurrency(
+    fake_router_gateway: FakeRouterGateway,
+):
+    metmuseum = MetMuseum(gateway=fake_router_gateway, base_url="https://fake.url")
+
+    with pytest.raises(ValueError):
+        async for _ in metmuseum.get_objects((1, 2), concurrency=0):
+            pass
+
+
+async def test_bounded_map_retrieves_exceptions_of_finished_tasks():
+    async def fail(item: int) -> int:
+        raise ConnectionError(item)
+
+    unhandled: list[dict] = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda loop, context: unhandled.append(context)
+    )
+
+    raised = False
+    try:
+        # every task fails in the same wait, only one exception can propagate
+        async for _ in bounded_map(fail, range(4), concurrency=4):
+            pass
+    except ConnectionError:
+        # the traceback is not kept, it would keep the finished tasks alive
+        raised = True
+    gc.collect()
+
+    assert raised
+    assert unhandled == []
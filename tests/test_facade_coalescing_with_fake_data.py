@@ -0,0 +1,89 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import exceptions
+from tests.mocks import FakeRouterGateway
+from tests.mocks.fake_data import make_error_response, make_object_response
+
+
+@pytest.fixture
+def fake_router_gateway() -> FakeRouterGateway:
+    return FakeRouterGateway(
+        {
+            "https://fake.url/objects/1": make_object_response(1),
+            "https://fake.url/objects/2": make_object_response(2),
+            "https://fake.url/objects/3": make_error_response(
+                "https://fake.url/objects/3", HTTPStatus.NOT_FOUND
+            ),
+        },
+        delay=0.01,
+    )
+
+
+async def test_concurrent_requests_are_coalesced(
+    fake_router_gateway: FakeRouterGateway,
+):
+    metmuseum = MetMuseum(
+        gateway=fake_router_gateway,
+        base_url="https://fake.url",
+        coalesce_requests=True,
+    )
+
+    results = await asyncio.gather(
+        *(metmuseum.get_object(object_id) for object_id in (1, 1, 2, 1, 2))
+    )
+
+    assert len(fake_router_gateway.requests) == 2
+    assert results[0] is results[1] is results[3]
+    assert results[2] is results[4]
+
+    # finished requests are not reused
+    await metmuseum.get_object(1)
+    assert len(fake_router_gateway.requests) == 3
+
+
+async def test_coalesced_errors_are_shared(fake_router_gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(
+        gateway=fake_router_gateway,
+        base_url="https://fake.url",
+        coalesce_requests=True,
+    )
+
+    results = await asyncio.gather(
+        metmuseum.get_object(3), metmuseum.get_object(3), return_exceptions=True
+    )
+
+    assert len(fake_router_gateway.requests) == 1
+    assert all(isinstance(r, exceptions.ClientException) for r in results)
+
+
+async def test_cancelled_caller_does_not_cancel_others(
+    fake_router_gateway: FakeRouterGateway,
+):
+    metmuseum = MetMuseum(
+        gateway=fake_router_gateway,
+        base_url="https://fake.url",
+        coalesce_requests=True,
+    )
+
+    first = asyncio.create_task(metmuseum.get_object(1))
+    second = asyncio.create_task(metmuseum.get_object(1))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second).id == 1
+    assert first.cancelled()
+    assert len(fake_router_gateway.requests) == 1
+
+
+async def test_requests_are_not_coalesced_by_default(
+    fake_router_gateway: FakeRouterGateway,
+):
+    metmuseum = MetMuseum(gateway=fake_router_gateway, base_url="https://fake.url")
+
+    await asyncio.gather(metmuseum.get_object(1), metmuseum.get_object(1))
+
+    assert len(fake_router_gateway.requests) == 2
@@ -0,0 +1,133 @@
+import json
+from http import HTTPStatus
+
+import pytest
+
+from metmuseum.decoders import ObjectIdsStreamDecoder
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import exceptions
+from tests.mocks import FakeGateway, FakeResponse, FakeRouterGateway
+from tests.mocks.fake_data import make_error_response, make_object_response
+
+IDS = list(range(1, 3000, 3))
+
+
+@pytest.fixture
+def fake_gateway_with_objects_example() -> FakeGateway:
+    fake_response = FakeResponse(
+        url="https://fake.url/objects",
+        status_code=HTTPStatus.OK,
+        headers={},
+        data=json.dumps({"total": len(IDS), "objectIDs": IDS}, indent=4).encode(),
+    )
+    return FakeGateway(fake_response)
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        json.dumps({"total": len(IDS), "objectIDs": IDS}).encode(),
+        json.dumps({"objectIDs": IDS, "total": len(IDS)}, indent=2).encode(),
+        b'{"total": 0, "objectIDs": []}',
+        b'{"total": 0, "objectIDs" : null}',
+    ),
+)
+@pytest.mark.parametrize("chunk_size", (1, 2, 5, 64, 1 << 20))
+def test_stream_decoder(data: bytes, chunk_size: int):
+    decoder = ObjectIdsStreamDecoder()
+
+    ids: list[int] = []
+    for offset in range(0, len(data), chunk_size):
+        ids.extend(decoder.feed(data[offset : offset + chunk_size]))
+    decoder.close()
+
+    assert decoder.is_done
+    assert ids == (json.loads(data)["objectIDs"] or [])
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        b'{"total": 1, "objectIDs": [1, 0]}',
+        b'{"total": 1, "objectIDs": [1, "2"]}',
+        b'{"total": 1, "objectIDs": [1.5]}',
+        b'{"total": 1, "objectIDs": {}}',
+    ),
+)
+def test_stream_decoder_with_invalid_data(data: bytes):
+    with pytest.raises(ValueError):
+        ObjectIdsStreamDecoder().feed(data)
+
+
+def test_stream_decoder_with_truncated_data():
+    decoder = ObjectIdsStreamDecoder()
+    decoder.feed(b'{"total": 3, "objectIDs": [1, 2')
+
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+async def test_iter_object_ids(fake_gateway_with_objects_example: FakeGateway):
+    metmuseum = MetMuseum(
+        gateway=fake_gateway_with_objects_example, base_url="https://fake.url"
+    )
+
+    ids = [
+        object_id
+        async for object_id in metmuseum.iter_object_ids(
+            department_ids=(1, 2), chunk_size=128
+        )
+    ]
+
+    assert ids == IDS
+    assert fake_gateway_with_objects_example.url == "https://fake.url/objects"
+    assert fake_gateway_with_objects_example.query == {"departmentIds": "1|2"}
+
+
+async def test_iter_object_id_chunks(fake_gateway_with_objects_example: FakeGateway):
+    metmuseum = MetMuseum(
+        gateway=fake_gateway_with_objects_example, base_url="https://fake.url"
+    )
+
+    chunks = [ids async for ids in metmuseum.iter_object_id_chunks(chunk_size=1024)]
+
+    assert len(chunks) > 1
+    assert [object_id for ids in chunks for object_id in ids] == IDS
+
+
+async def test_iter_object_ids_with_error():
+    metmuseum = MetMuseum(
+        gateway=FakeGateway(
+            make_error_response("https://fake.url/objects", HTTPStatus.BAD_GATEWAY)
+        ),
+        base_url="https://fake.url",
+    )
+
+    with pytest.raises(exceptions.ServerException):
+        async for _ in metmuseum.iter_object_ids():
+            pass
+
+
+async def test_get_objects_from_streamed_ids():
+    ids = [1, 2, 3, 4]
+    routes = {
+        f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+        for object_id in ids
+    }
+    routes["https://fake.url/objects"] = FakeResponse(
+        url="https://fake.url/objects",
+        status_code=HTTPStatus.OK,
+        headers={},
+        data=json.dumps({"total": len(ids), "objectIDs": ids}).encode(),
+    )
+    metmuseum = MetMuseum(gateway=FakeRouterGateway(routes), base_url="https://fake.url")
+
+    results = [
+        result
+        async for result in metmuseum.get_objects(
+            metmuseum.iter_object_ids(chunk_size=8), concurrency=2, ordered=True
+        )
+    ]
+
+    assert [result.id for result in results] == ids
+    assert all(result.ok for result in results)
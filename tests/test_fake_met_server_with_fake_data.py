@@ -0,0 +1,122 @@
+import asyncio
+from datetime import date
+from http import HTTPMethod, HTTPStatus
+
+import pytest
+
+from metmuseum import AiohttpGateway, MetMuseum
+from metmuseum.testing import FakeMetServer, constant_latency
+from metmuseum.types import exceptions
+from tests.mocks.fake_data import OBJECT_EXAMPLE
+
+OBJECTS = (
+    OBJECT_EXAMPLE | {"objectID": 1},
+    OBJECT_EXAMPLE
+    | {
+        "objectID": 2,
+        "title": "Wheat Field with Cypresses",
+        "department": "European Paintings",
+        "metadataDate": "2024-05-01T00:00:00Z",
+    },
+)
+
+DEPARTMENTS = (
+    {"departmentId": 6, "displayName": "Asian Art"},
+    {"departmentId": 11, "displayName": "European Paintings"},
+)
+
+
+@pytest.fixture
+async def gateway():
+    async with AiohttpGateway() as gateway:
+        yield gateway
+
+
+async def test_serves_fixture_data(gateway: AiohttpGateway):
+    async with FakeMetServer(objects=OBJECTS, departments=DEPARTMENTS) as server:
+        metmuseum = MetMuseum(gateway=gateway, base_url=server.url)
+
+        object_response = await metmuseum.get_object(2)
+        assert object_response.title == "Wheat Field with Cypresses"
+
+        objects_response = await metmuseum.list_objects()
+        assert objects_response.ids == (1, 2)
+
+        objects_response = await metmuseum.list_objects(metadata_date=date(2024, 1, 1))
+        assert objects_response.ids == (2,)
+
+        objects_response = await metmuseum.list_objects(department_ids=(6,))
+        assert objects_response.ids == (1,)
+
+        departments_response = await metmuseum.list_departments()
+        assert [d.id for d in departments_response.departments] == [6, 11]
+
+        search_response = await metmuseum.search("wheat", title=True)
+        assert search_response.ids == (2,)
+
+        search_response = await metmuseum.search("nothing")
+        assert (search_response.total, search_response.ids) == (0, None)
+
+        with pytest.raises(exceptions.ClientException) as exc_info:
+            await metmuseum.get_object(3)
+        assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
+
+        assert server.requests == 8
+
+
+async def test_injects_errors(gateway: AiohttpGateway):
+    async with FakeMetServer(objects=OBJECTS, error_rate=1.0, seed=1) as server:
+        metmuseum = MetMuseum(gateway=gateway, base_url=server.url)
+
+        with pytest.raises(exceptions.ServerException):
+            await metmuseum.get_object(1)
+
+        assert server.failed == 1
+
+
+async def test_error_rate_is_repeatable_with_seed(gateway: AiohttpGateway):
+    async def run() -> list[bool]:
+        async with FakeMetServer(objects=OBJECTS, error_rate=0.5, seed=42) as server:
+            metmuseum = MetMuseum(gateway=gateway, base_url=server.url)
+            results = metmuseum.get_objects([1] * 20, ordered=True)
+            return [result.ok async for result in results]
+
+    first = await run()
+
+    assert not all(first) and any(first)
+    assert await run() == first
+
+
+async def test_throttles_over_rate_limit(gateway: AiohttpGateway):
+    server = FakeMetServer(objects=OBJECTS, rate_limit=1, burst=2, retry_after=3)
+    async with server:
+        statuses = []
+        for _ in range(3):
+            async with gateway.make_request(
+                method=HTTPMethod.GET, url=f"{server.url}/objects/1"
+            ) as response:
+                statuses.append(response.status_code)
+
+        assert statuses == [HTTPStatus.OK, HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS]
+        assert response.headers["Retry-After"] == "3"
+        assert server.throttled == 1
+
+
+async def test_injects_latency(gateway: AiohttpGateway):
+    async with FakeMetServer(objects=OBJECTS, latency=constant_latency(0.05)) as server:
+        metmuseum = MetMuseum(gateway=gateway, base_url=server.url)
+
+        started_at = asyncio.get_running_loop().time()
+        results = [result async for result in metmuseum.get_objects([1, 2, 1, 2])]
+
+        assert all(result.ok for result in results)
+        assert asyncio.get_running_loop().time() - started_at >= 0.05
+        assert server.max_in_flight == 4
+
+
+def test_validates_arguments():
+    with pytest.raises(ValueError):
+        FakeMetServer(error_rate=2)
+
+    with pytest.raises(RuntimeError):
+        _ = FakeMetServer().url
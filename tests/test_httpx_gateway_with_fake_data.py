@@ -0,0 +1,121 @@
+import asyncio
+import socket
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+import pytest
+
+from metmuseum.gateways import CircuitBreakerGateway, CircuitState, RetryPolicy
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.testing import FakeMetServer
+from metmuseum.types import exceptions
+from tests.mocks.fake_data import OBJECT_EXAMPLE
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from metmuseum.gateways.httpx_gateway import HttpxGateway  # noqa: E402
+
+OBJECTS = [OBJECT_EXAMPLE | {"objectID": object_id} for object_id in (1, 2, 3)]
+
+
+async def test_get_object_over_http1():
+    async with (
+        FakeMetServer(objects=OBJECTS) as server,
+        HttpxGateway(http2=False) as gateway,
+    ):
+        metmuseum = MetMuseum(gateway=gateway, base_url=server.url)
+
+        object_response = await metmuseum.get_object(2)
+        objects_response = await metmuseum.list_objects(department_ids=(6,))
+        with pytest.raises(exceptions.ClientException):
+            await metmuseum.get_object(404)
+
+    assert object_response.id == 2
+    assert objects_response.total == 0
+    assert not gateway.is_started
+
+
+async def test_bounded_read_and_unstarted_gateway():
+    async with FakeMetServer(objects=OBJECTS) as server:
+        gateway = HttpxGateway(http2=False)
+
+        async with gateway.make_request(
+            method=HTTPMethod.GET, url=f"{server.url}/objects/1"
+        ) as response:
+            assert response.status_code == HTTPStatus.OK
+            with pytest.raises(exceptions.ResponseTooLargeException):
+                await response.read(max_size=10)
+
+        assert not gateway.is_started
+
+
+async def test_requests_are_multiplexed_over_h2c():
+    hypercorn_asyncio = pytest.importorskip("hypercorn.asyncio")
+    hypercorn_config = pytest.importorskip("hypercorn.config")
+    connections: set[Any] = set()
+
+    async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        connections.add(scope["client"])
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        body = scope["http_version"].encode()
+        await send({"type": "http.response.body", "body": body})
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = hypercorn_config.Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.accesslog = config.errorlog = None
+    shutdown = asyncio.Event()
+    serving = asyncio.create_task(
+        hypercorn_asyncio.serve(app, config, shutdown_trigger=shutdown.wait)
+    )
+    await asyncio.sleep(0.2)
+
+    async def get(gateway: HttpxGateway) -> bytes:
+        async with gateway.make_request(
+            method=HTTPMethod.GET, url=f"http://127.0.0.1:{port}/"
+        ) as response:
+            return await response.read()
+
+    try:
+        async with HttpxGateway(http1=False, max_connections=1) as gateway:
+            started_at = asyncio.get_running_loop().time()
+            bodies = await asyncio.gather(*(get(gateway) for _ in range(20)))
+            elapsed = asyncio.get_running_loop().time() - started_at
+    finally:
+        shutdown.set()
+        await serving
+
+    assert set(bodies) == {b"2"}
+    assert len(connections) == 1
+    # 20 requests of 50ms over one connection complete concurrently
+    assert elapsed < 0.5
+
+
+def test_httpx_transport_errors_are_retried_by_default():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable_exception(httpx.ConnectError("refused"))
+    assert policy.is_retryable_exception(httpx.ReadTimeout("timed out"))
+    assert not policy.is_retryable_exception(httpx.UnsupportedProtocol("ftp"))
+
+
+async def test_httpx_transport_errors_open_the_circuit():
+    # nothing listens on the port of a closed socket
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        url = f"http://127.0.0.1:{sock.getsockname()[1]}/objects/1"
+
+    async with HttpxGateway(http2=False) as httpx_gateway:
+        gateway = CircuitBreakerGateway(httpx_gateway, failure_threshold=2)
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                async with gateway.make_request(method=HTTPMethod.GET, url=url):
+                    pass
+
+        assert gateway.get_state(url) is CircuitState.OPEN
@@ -0,0 +1,133 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from metmuseum.indexes import LocalSearchIndex
+from metmuseum.stores import SqliteObjectStore
+from metmuseum.types import models, responses
+from tests.mocks.fake_data import make_object_data
+
+
+def make_object(object_id: int, **overrides: Any) -> responses.ObjectResponse:
+    return responses.ObjectResponse.model_validate_json(
+        make_object_data(object_id, **overrides)
+    )
+
+
+@pytest.fixture
+def local_search_index() -> LocalSearchIndex:
+    index = LocalSearchIndex(
+        departments=(
+            models.DepartmentElement(departmentId=6, displayName="Asian Art"),
+            models.DepartmentElement(departmentId=11, displayName="European Paintings"),
+        )
+    )
+    index.add_many(
+        (
+            # Quail and Millet, Kiyohara Yukinobu, Japan, 1667-1682, not on view
+            make_object(1),
+            make_object(
+                2,
+                title="Wheat Field with Cypresses",
+                isHighlight=True,
+                department="European Paintings",
+                artistDisplayName="Vincent van Gogh",
+                artistAlphaSort="Gogh, Vincent van",
+                culture="",
+                medium="Oil on canvas",
+                country="France",
+                objectBeginDate=1889,
+                objectEndDate=1889,
+                GalleryNumber="822",
+                tags=[{"term": "Landscapes", "AAT_URL": "", "Wikidata_URL": ""}],
+                constituents=None,
+            ),
+            make_object(
+                3,
+                title="Birds on a branch",
+                culture="China",
+                medium="Ink on silk",
+                primaryImage="",
+                primaryImageSmall="",
+                additionalImages=[],
+                objectBeginDate="",
+                objectEndDate="",
+                classification="",
+                tags=None,
+            ),
+        )
+    )
+    return index
+
+
+@pytest.mark.parametrize(
+    "query, kwargs, expected",
+    [
+        ("quail", {}, (1,)),
+        ("BIRDS", {}, (1, 3)),
+        ("birds", {"title": True}, (3,)),
+        ("birds", {"tags": True}, (1,)),
+        ("gogh", {"artist_or_culture": True}, (2,)),
+        ("japan", {"artist_or_culture": True}, (1,)),
+        ("wheat field", {}, (2,)),
+        ("wheat quail", {}, None),
+        ("*", {}, (1, 2, 3)),
+        ("*", {"is_highlight": True}, (2,)),
+        ("*", {"is_highlight": False}, (1, 3)),
+        ("*", {"is_on_view": True}, (2,)),
+        ("*", {"has_images": False}, (3,)),
+        ("*", {"department_id": 6}, (1, 3)),
+        ("*", {"department_id": 42}, None),
+        ("*", {"medium": ("Canvas", "Paintings")}, (1, 2)),
+        ("*", {"medium": ("ink on silk",)}, (1, 3)),
+        ("*", {"geo_location": ("France",)}, (2,)),
+        ("*", {"date_begin": 1600, "date_end": 1700}, (1,)),
+        ("*", {"date_begin": 1600, "date_end": 1900}, (1, 2)),
+    ],
+)
+def test_search(
+    local_search_index: LocalSearchIndex,
+    query: str,
+    kwargs: dict[str, Any],
+    expected: tuple[int, ...] | None,
+):
+    search_response = local_search_index.search(query, **kwargs)
+
+    assert isinstance(search_response, responses.SearchResponse)
+    assert search_response.ids == expected
+    assert search_response.total == len(expected or ())
+
+
+def test_add_replaces_and_remove_drops_object(local_search_index: LocalSearchIndex):
+    local_search_index.add(make_object(1, title="Autumn Moon"))
+
+    assert local_search_index.search("quail").ids is None
+    assert local_search_index.search("moon").ids == (1,)
+    assert len(local_search_index) == 3
+
+    assert local_search_index.remove(1)
+    assert not local_search_index.remove(1)
+    assert 1 not in local_search_index
+    assert local_search_index.search("moon").ids is None
+    assert local_search_index.search("*", department_id=6).ids == (3,)
+
+
+def test_search_validates_arguments(local_search_index: LocalSearchIndex):
+    with pytest.raises(ValueError):
+        local_search_index.search("*", date_begin=1600)
+
+    with pytest.raises(ValueError):
+        LocalSearchIndex().search("*", department_id=6)
+
+
+async def test_index_from_store(tmp_path: Path):
+    async with SqliteObjectStore(tmp_path / "objects.sqlite3") as store:
+        await store.put_many(make_object(object_id) for object_id in range(1, 6))
+        index = LocalSearchIndex()
+
+        async for obj in store.iter_objects(batch_size=2):
+            index.add(obj)
+
+    assert len(index) == 5
+    assert index.search("quail").ids == (1, 2, 3, 4, 5)
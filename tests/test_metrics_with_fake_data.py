@@ -0,0 +1,87 @@
+import math
+
+import pytest
+
+from metmuseum import AiohttpGateway, MetMuseum
+from metmuseum.metrics import Histogram, MetricsCollector
+from metmuseum.testing import FakeMetServer
+from tests.mocks import FakeGateway
+from tests.mocks.fake_data import OBJECT_EXAMPLE, make_object_response
+
+
+def test_histogram_summary():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.observe(value)
+
+    summary = histogram.summary()
+
+    assert (summary.count, summary.total, summary.mean) == (100, 5050, 50.5)
+    assert (summary.min, summary.max) == (1, 100)
+    assert (summary.p50, summary.p90, summary.p99) == (51, 91, 100)
+    assert histogram.percentile(0) == 1
+
+
+def test_histogram_keeps_bounded_samples():
+    histogram = Histogram(max_samples=10)
+    for value in range(1000):
+        histogram.observe(value)
+
+    summary = histogram.summary()
+
+    assert summary.count == 1000
+    assert summary.mean == 499.5
+    assert 0 <= summary.p50 < 1000
+
+
+def test_empty_histogram():
+    summary = Histogram().summary()
+
+    assert summary.count == 0
+    assert math.isnan(summary.p99)
+    with pytest.raises(ValueError):
+        Histogram().percentile(101)
+
+
+# a bounded read streams the body instead of calling ClientResponse.read()
+@pytest.mark.parametrize("max_response_size", (None, 1 << 20))
+async def test_collects_request_timings(max_response_size: int | None):
+    metrics = MetricsCollector()
+    objects = [OBJECT_EXAMPLE | {"objectID": object_id} for object_id in (1, 2, 3)]
+
+    async with (
+        FakeMetServer(objects=objects) as server,
+        AiohttpGateway(limit=1, metrics=metrics) as gateway,
+    ):
+        metmuseum = MetMuseum(
+            gateway=gateway,
+            base_url=server.url,
+            metrics=metrics,
+            max_response_size=max_response_size,
+        )
+        for object_id in (1, 2, 3):
+            await metmuseum.get_object(object_id)
+
+    summary = metrics.summary()
+
+    for name in ("http.ttfb", "http.body", "http.total", "decode"):
+        assert summary[name].count == 3
+        assert summary[name].min >= 0
+    # one connection is opened and then reused by the next requests
+    assert summary["http.connect"].count == 1
+    assert summary["http.connection_reused"].total == 2
+    assert summary["http.bytes_received"].min > 1000
+    assert summary["http.bytes_sent"].total == 0
+
+
+async def test_facade_records_decode_time():
+    metrics = MetricsCollector()
+    metmuseum = MetMuseum(
+        gateway=FakeGateway(make_object_response(45734)), metrics=metrics
+    )
+
+    await metmuseum.get_object(45734)
+
+    assert set(metrics.histograms) == {"decode"}
+    metrics.clear()
+    assert not metrics.histograms
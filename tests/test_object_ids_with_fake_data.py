@@ -0,0 +1,85 @@
+from http import HTTPStatus
+
+import pytest
+from pydantic import ValidationError
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import models, responses
+from tests.mocks import FakeGateway, FakeResponse
+
+
+@pytest.fixture
+def fake_gateway_with_ids_example() -> FakeGateway:
+    fake_response = FakeResponse(
+        url="https://fake.url/objects",
+        status_code=HTTPStatus.OK,
+        headers={},
+        data=b'{"total": 5, "objectIDs": [1, 5, 10, 4294967295, 7]}',
+    )
+    return FakeGateway(fake_response)
+
+
+def test_object_ids_sequence():
+    ids = models.ObjectIds([3, 1, 2, 100])
+
+    assert len(ids) == 4
+    assert list(ids) == [3, 1, 2, 100]
+    assert ids[0] == 3
+    assert ids[-1] == 100
+    assert ids[1:3] == models.ObjectIds([1, 2])
+    assert isinstance(ids[1:3], models.ObjectIds)
+    assert 100 in ids
+    assert 4 not in ids
+    assert ids == (3, 1, 2, 100)
+    assert ids == [3, 1, 2, 100]
+    assert ids != (3, 1, 2)
+    assert ids.nbytes == 16
+    assert ids.buffer.tolist() == [3, 1, 2, 100]
+    assert ids.buffer.readonly
+
+
+@pytest.mark.parametrize("invalid_ids", ([0], [-1], [1.5], ["1"], [2**32]))
+def test_object_ids_validation(invalid_ids: list):
+    with pytest.raises(ValueError):
+        models.ObjectIds(invalid_ids)
+
+
+async def test_objects_compact(fake_gateway_with_ids_example: FakeGateway):
+    metmuseum = MetMuseum(
+        gateway=fake_gateway_with_ids_example, base_url="https://fake.url"
+    )
+    objects_response = await metmuseum.list_objects(compact=True)
+
+    assert isinstance(objects_response, responses.CompactObjectsResponse)
+    assert isinstance(objects_response.ids, models.ObjectIds)
+    assert objects_response.ids == (1, 5, 10, 4294967295, 7)
+    assert objects_response.model_dump(by_alias=True) == {
+        "total": 5,
+        "objectIDs": [1, 5, 10, 4294967295, 7],
+    }
+
+
+async def test_search_compact(fake_gateway_with_ids_example: FakeGateway):
+    metmuseum = MetMuseum(
+        gateway=fake_gateway_with_ids_example, base_url="https://fake.url"
+    )
+    search_response = await metmuseum.search("cat", compact=True)
+
+    assert isinstance(search_response, responses.CompactSearchResponse)
+    assert search_response.ids == (1, 5, 10, 4294967295, 7)
+
+
+def test_compact_responses_validation():
+    empty_search = responses.CompactSearchResponse.model_validate_json(
+        b'{"total": 0, "objectIDs": null}'
+    )
+    assert empty_search.ids is None
+
+    with pytest.raises(ValidationError):
+        responses.CompactObjectsResponse.model_validate_json(
+            b'{"total": 2, "objectIDs": [1, 0]}'
+        )
+    with pytest.raises(ValidationError):
+        responses.CompactObjectsResponse.model_validate_json(
+            b'{"total": 1, "objectIDs": "1"}'
+        )
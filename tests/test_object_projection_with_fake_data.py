@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.stores import SqliteObjectStore
+from metmuseum.types import responses
+from tests.mocks import FakeGateway, FakeRouterGateway
+from tests.mocks.fake_data import make_object_data, make_object_response
+
+FIELDS = ("title", "primary_image_small", "department", "dynasty")
+
+
+def test_projection_validates_only_requested_fields():
+    projection = responses.get_object_projection(FIELDS)
+
+    obj = projection.model_validate_json(make_object_data(1, medium=42))
+
+    assert list(projection.model_fields) == [
+        "id",
+        "primary_image_small",
+        "department",
+        "title",
+        "dynasty",
+    ]
+    assert obj.model_dump() == {
+        "id": 1,
+        "primary_image_small": (
+            "https://images.metmuseum.org/CRDImages/as/web-large/DP251139.jpg"
+        ),
+        "department": "Asian Art",
+        "title": "Quail and Millet",
+        # the before validators of the projected fields still run
+        "dynasty": None,
+    }
+
+
+def test_projection_is_cached_per_field_set():
+    projection = responses.get_object_projection(FIELDS)
+
+    assert responses.get_object_projection(reversed(FIELDS)) is projection
+    assert responses.get_object_projection(("title",)) is not projection
+
+
+def test_projection_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="objectID"):
+        responses.get_object_projection(("objectID",))
+
+
+async def test_get_object_with_fields():
+    metmuseum = MetMuseum(gateway=FakeGateway(make_object_response(45734)))
+
+    obj = await metmuseum.get_object(45734, fields=("title",))
+
+    assert obj.model_dump() == {"id": 45734, "title": "Quail and Millet"}
+
+
+async def test_get_objects_with_fields():
+    gateway = FakeRouterGateway(
+        {
+            f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+            for object_id in (1, 2)
+        }
+    )
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    results = [
+        result
+        async for result in metmuseum.get_objects(
+            (1, 2), ordered=True, fields=iter(("title",))
+        )
+    ]
+
+    assert [result.response.model_dump() for result in results] == [
+        {"id": 1, "title": "Quail and Millet"},
+        {"id": 2, "title": "Quail and Millet"},
+    ]
+
+
+async def test_projected_object_uses_store_read_only(tmp_path: Path):
+    gateway = FakeRouterGateway(
+        {
+            f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+            for object_id in (1, 2)
+        }
+    )
+    async with SqliteObjectStore(tmp_path / "objects.sqlite3") as store:
+        metmuseum = MetMuseum(
+            gateway=gateway, base_url="https://fake.url", object_store=store
+        )
+        await store.put(
+            responses.ObjectResponse.model_validate_json(
+                make_object_data(1, title="Stored")
+            )
+        )
+
+        stored = await metmuseum.get_object(1, fields=("title",))
+        fetched = await metmuseum.get_object(2, fields=("title",))
+
+        assert stored.model_dump() == {"id": 1, "title": "Stored"}
+        assert fetched.model_dump() == {"id": 2, "title": "Quail and Millet"}
+        assert await store.count() == 1
+        assert [url for _, url, _ in gateway.requests] == ["https://fake.url/objects/2"]
@@ -0,0 +1,94 @@
+import pickle
+from http import HTTPStatus
+
+import pytest
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import records, responses
+from tests.mocks import FakeGateway, FakeRouterGateway
+from tests.mocks.fake_data import (
+    make_error_response,
+    make_object_data,
+    make_object_response,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        make_object_data(45734),
+        make_object_data(
+            1,
+            constituents=None,
+            tags=None,
+            measurements=None,
+            dimensionsParsed=[
+                {"element": "Overall", "dimensionType": "Height", "dimension": 1.5}
+            ],
+        ),
+    ),
+)
+def test_record_round_trip(data: bytes):
+    obj = responses.ObjectResponse.model_validate_json(data)
+
+    record = records.ObjectRecord.from_response(obj)
+    restored = record.to_response()
+
+    assert record._fields == tuple(responses.ObjectResponse.model_fields)
+    assert restored == obj
+    assert restored.model_dump_json() == obj.model_dump_json()
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_record_converts_nested_models():
+    obj = responses.ObjectResponse.model_validate_json(make_object_data(45734))
+
+    record = records.ObjectRecord.from_response(obj)
+
+    assert record.id == 45734
+    assert record.department == "Asian Art"
+    assert record.tags is not None and record.constituents is not None
+    assert record.measurements is not None
+    assert type(record.tags[0]) is records.ObjectTagRecord
+    assert type(record.constituents[0]) is records.ObjectConstituentRecord
+    assert type(record.measurements[0]) is records.ObjectMeasurementsElementRecord
+    assert type(record.measurements[0].measurements) is records.ObjectMeasurementsRecord
+    assert record.tags[0].term == obj.tags[0].term  # type: ignore[index]
+    assert hash(record) == hash(records.ObjectRecord.from_response(obj))
+
+
+async def test_get_objects_as_records():
+    gateway = FakeRouterGateway(
+        {
+            f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+            for object_id in (1, 2)
+        }
+        | {
+            "https://fake.url/objects/3": make_error_response(
+                "https://fake.url/objects/3", HTTPStatus.NOT_FOUND
+            )
+        }
+    )
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    results = [
+        result
+        async for result in metmuseum.get_objects(
+            (1, 2, 3), ordered=True, as_records=True
+        )
+    ]
+
+    assert [result.id for result in results] == [1, 2, 3]
+    assert [type(result.response) for result in results[:2]] == [
+        records.ObjectRecord,
+        records.ObjectRecord,
+    ]
+    assert results[0].response is not None and results[0].response.id == 1
+    assert results[2].response is None and results[2].exception is not None
+
+
+def test_get_objects_rejects_fields_with_records():
+    metmuseum = MetMuseum(gateway=FakeGateway(make_object_response(1)))
+
+    with pytest.raises(ValueError, match="as_records"):
+        metmuseum.get_objects((1,), fields=("title",), as_records=True)
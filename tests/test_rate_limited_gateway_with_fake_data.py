@@ -0,0 +1,105 @@
+import asyncio
+from http import HTTPMethod, HTTPStatus
+from time import monotonic
+
+import pytest
+
+from metmuseum.gateways import RateLimitedGateway, RateLimiter
+from tests.mocks import FakeGateway, FakeResponse
+
+
+@pytest.fixture
+def fake_gateway() -> FakeGateway:
+    fake_response = FakeResponse(
+        url="https://fake.url/objects/1",
+        status_code=HTTPStatus.OK,
+        headers={},
+        data=b"{}",
+    )
+    return FakeGateway(fake_response)
+
+
+async def test_rate_limiter_allows_burst():
+    limiter = RateLimiter(rate=10, burst=5)
+
+    waits = [await limiter.acquire() for _ in range(5)]
+
+    assert waits == [0.0] * 5
+    assert limiter.acquired == 5
+    assert limiter.delayed == 0
+    assert limiter.total_wait_time == 0.0
+
+
+async def test_rate_limiter_spaces_concurrent_callers():
+    limiter = RateLimiter(rate=100, burst=2)
+
+    started_at = monotonic()
+    waits = await asyncio.gather(*(limiter.acquire() for _ in range(12)))
+    elapsed = monotonic() - started_at
+
+    # 2 tokens are available at once, the other 10 arrive at 100 per second
+    assert elapsed >= 0.09
+    assert limiter.acquired == 12
+    assert limiter.delayed == 10
+    assert sorted(waits) == waits
+    assert limiter.total_wait_time == pytest.approx(sum(waits))
+
+
+async def test_rate_limiter_refunds_cancelled_callers():
+    limiter = RateLimiter(rate=1, burst=1)
+    await limiter.acquire()
+
+    task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.acquired == 1
+    assert limiter.delayed == 0
+
+
+async def test_rate_limiter_keeps_spacing_when_a_queued_caller_is_cancelled():
+    limiter = RateLimiter(rate=20, burst=1)
+    await limiter.acquire()
+    started_at = monotonic()
+    released_at: dict[str, float] = {}
+
+    async def acquire(name: str) -> None:
+        await limiter.acquire()
+        released_at[name] = monotonic() - started_at
+
+    b = asyncio.create_task(acquire("b"))
+    c = asyncio.create_task(acquire("c"))
+    await asyncio.sleep(0.01)
+    b.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await b
+    d = asyncio.create_task(acquire("d"))
+    await asyncio.gather(c, d)
+
+    # c keeps its slot at 0.1s and d is queued 0.05s after it
+    assert released_at["d"] - released_at["c"] >= 0.04
+
+
+async def test_rate_limiter_with_invalid_params():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+
+
+async def test_rate_limited_gateway(fake_gateway: FakeGateway):
+    limiter = RateLimiter(rate=1000, burst=1)
+    gateway = RateLimitedGateway(fake_gateway, limiter)
+
+    for _ in range(3):
+        async with gateway.make_request(
+            HTTPMethod.GET, "https://fake.url/objects/1", query={"a": "b"}
+        ) as response:
+            assert response.status_code == HTTPStatus.OK
+
+    assert fake_gateway.url == "https://fake.url/objects/1"
+    assert fake_gateway.query == {"a": "b"}
+    assert limiter.acquired == 3
+    assert gateway.limiter is limiter
@@ -0,0 +1,149 @@
+from http import HTTPStatus
+
+import pytest
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.responses import BufferedResponse
+from metmuseum.types import exceptions
+from tests.mocks import FakeGateway, FakeResponse
+from tests.mocks.fake_data import make_error_response, make_object_response
+
+IMAGE_URL = "https://images.fake.url/original/DP251139.jpg"
+IMAGE_DATA = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def fake_gateway_with_image() -> FakeGateway:
+    fake_response = FakeResponse(
+        url=IMAGE_URL,
+        status_code=HTTPStatus.OK,
+        headers={"Content-Type": "image/jpeg"},
+        data=IMAGE_DATA,
+    )
+    return FakeGateway(fake_response)
+
+
+async def test_bounded_read():
+    response = BufferedResponse(
+        url=IMAGE_URL, status_code=HTTPStatus.OK, headers={}, data=IMAGE_DATA
+    )
+
+    assert await response.read(max_size=len(IMAGE_DATA)) == IMAGE_DATA
+    with pytest.raises(exceptions.ResponseTooLargeException) as exception:
+        await response.read(max_size=len(IMAGE_DATA) - 1)
+
+    assert exception.value.url == IMAGE_URL
+    assert exception.value.max_size == len(IMAGE_DATA) - 1
+
+
+async def test_iter_chunks():
+    response = BufferedResponse(
+        url=IMAGE_URL, status_code=HTTPStatus.OK, headers={}, data=IMAGE_DATA
+    )
+
+    chunks = [chunk async for chunk in response.iter_chunks(1000)]
+
+    assert all(len(chunk) == 1000 for chunk in chunks[:-1])
+    assert b"".join(chunks) == IMAGE_DATA
+
+
+@pytest.mark.parametrize("max_memory_size", (1024, len(IMAGE_DATA) * 2))
+async def test_spool(max_memory_size: int):
+    response = BufferedResponse(
+        url=IMAGE_URL, status_code=HTTPStatus.OK, headers={}, data=IMAGE_DATA
+    )
+
+    with await response.spool(max_memory_size=max_memory_size, chunk_size=100) as file:
+        assert file.read() == IMAGE_DATA
+        assert file._rolled == (len(IMAGE_DATA) > max_memory_size)  # type: ignore
+
+
+async def test_spool_with_max_size():
+    response = BufferedResponse(
+        url=IMAGE_URL, status_code=HTTPStatus.OK, headers={}, data=IMAGE_DATA
+    )
+
+    with pytest.raises(exceptions.ResponseTooLargeException):
+        await response.spool(max_size=100)
+
+
+async def test_download(fake_gateway_with_image: FakeGateway):
+    metmuseum = MetMuseum(gateway=fake_gateway_with_image)
+
+    with await metmuseum.download(IMAGE_URL, max_memory_size=1024) as file:
+        assert file.read() == IMAGE_DATA
+
+    assert fake_gateway_with_image.url == IMAGE_URL
+
+
+async def test_download_with_error():
+    metmuseum = MetMuseum(
+        gateway=FakeGateway(make_error_response(IMAGE_URL, HTTPStatus.NOT_FOUND))
+    )
+
+    with pytest.raises(exceptions.ClientException):
+        await metmuseum.download(IMAGE_URL)
+
+
+async def test_facade_max_response_size():
+    fake_gateway = FakeGateway(make_object_response(1))
+    metmuseum = MetMuseum(
+        gateway=fake_gateway, base_url="https://fake.url", max_response_size=100
+    )
+
+    with pytest.raises(exceptions.ResponseTooLargeException):
+        await metmuseum.get_object(1)
+
+    metmuseum.max_response_size = 1024 * 1024
+    assert (await metmuseum.get_object(1)).id == 1
+
+
+async def test_facade_truncates_large_error_bodies():
+    url = "https://fake.url/objects/1"
+    fake_gateway = FakeGateway(
+        FakeResponse(
+            url=url,
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            headers={},
+            data=b"x" * 1000,
+        )
+    )
+    metmuseum = MetMuseum(
+        gateway=fake_gateway, base_url="https://fake.url", max_response_size=100
+    )
+
+    with pytest.raises(exceptions.ServerException) as exc_info:
+        await metmuseum.get_object(1)
+
+    assert exc_info.value.data == b"x" * 100
+
+
+@pytest.mark.parametrize(
+    ("content_type", "data"),
+    (
+        ("application/json", b'"' + b"x" * 100 + b'"'),
+        ("text/plain; charset=utf-8", "é".encode() * 60),
+    ),
+)
+async def test_facade_truncated_error_body_keeps_the_api_exception(
+    content_type: str, data: bytes
+):
+    url = "https://fake.url/objects/1"
+    fake_gateway = FakeGateway(
+        FakeResponse(
+            url=url,
+            status_code=HTTPStatus.NOT_FOUND,
+            headers={"Content-Type": content_type},
+            data=data,
+        )
+    )
+    metmuseum = MetMuseum(
+        gateway=fake_gateway, base_url="https://fake.url", max_response_size=51
+    )
+
+    with pytest.raises(exceptions.ClientException) as exc_info:
+        await metmuseum.get_object(1)
+
+    assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
+    assert exc_info.value.data == data[:51]
+    assert exc_info.value.detail.startswith("Not Found: ")
@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http import HTTPMethod, HTTPStatus
+from typing import AsyncIterator
+
+import pytest
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+from metmuseum.gateways import RetryingGateway, RetryPolicy
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.types import exceptions, responses
+from tests.mocks import FakeResponse, FakeRouterGateway
+from tests.mocks.fake_data import make_error_response, make_object_response
+
+OBJECT_URL = "https://fake.url/objects/1"
+
+
+@pytest.fixture
+def retry_policy() -> RetryPolicy:
+    return RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01)
+
+
+async def test_retry_on_server_errors(retry_policy: RetryPolicy):
+    fake_gateway = FakeRouterGateway(
+        {
+            OBJECT_URL: [
+                make_error_response(OBJECT_URL, HTTPStatus.BAD_GATEWAY),
+                make_error_response(OBJECT_URL, HTTPStatus.SERVICE_UNAVAILABLE),
+                make_object_response(1),
+            ]
+        }
+    )
+    metmuseum = MetMuseum(
+        gateway=RetryingGateway(fake_gateway, retry_policy), base_url="https://fake.url"
+    )
+
+    object_response = await metmuseum.get_object(1)
+
+    assert isinstance(object_response, responses.ObjectResponse)
+    assert len(fake_gateway.requests) == 3
+
+
+async def test_retry_on_connection_errors(retry_policy: RetryPolicy):
+    fake_gateway = FakeRouterGateway(
+        {OBJECT_URL: [ClientConnectionError(), make_object_response(1)]}
+    )
+    gateway = RetryingGateway(fake_gateway, retry_policy)
+
+    async with gateway.make_request(HTTPMethod.GET, OBJECT_URL) as response:
+        assert response.status_code == HTTPStatus.OK
+
+    assert len(fake_gateway.requests) == 2
+
+
+class CutOffResponse(FakeResponse):
+    async def iter_chunks(self, size: int = 65536) -> AsyncIterator[bytes]:
+        yield b'{"objectID": 1'
+        raise ClientPayloadError("Response payload is not completed")
+
+
+async def test_retry_on_cut_off_bodies(retry_policy: RetryPolicy):
+    cut_off = CutOffResponse(
+        url=OBJECT_URL, status_code=HTTPStatus.OK, headers={}, data=b""
+    )
+    fake_gateway = FakeRouterGateway({OBJECT_URL: [cut_off, make_object_response(1)]})
+    metmuseum = MetMuseum(
+        gateway=RetryingGateway(fake_gateway, retry_policy), base_url="https://fake.url"
+    )
+
+    assert (await metmuseum.get_object(1)).id == 1
+    assert len(fake_gateway.requests) == 2
+
+    # a body larger than max_buffer_size is streamed, so its errors are raised
+    fake_gateway = FakeRouterGateway({OBJECT_URL: [cut_off, make_object_response(1)]})
+    gateway = RetryingGateway(fake_gateway, retry_policy, max_buffer_size=4)
+    with pytest.raises(ClientPayloadError):
+        async with gateway.make_request(HTTPMethod.GET, OBJECT_URL) as response:
+            await response.read()
+    assert len(fake_gateway.requests) == 1
+
+
+async def test_retry_gives_up_after_max_attempts(retry_policy: RetryPolicy):
+    fake_gateway = FakeRouterGateway(
+        {OBJECT_URL: make_error_response(OBJECT_URL, HTTPStatus.SERVICE_UNAVAILABLE)}
+    )
+    metmuseum = MetMuseum(
+        gateway=RetryingGateway(fake_gateway, retry_policy), base_url="https://fake.url"
+    )
+
+    with pytest.raises(exceptions.ServerException) as exception:
+        await metmuseum.get_object(1)
+
+    assert exception.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert len(fake_gateway.requests) == 3
+
+
+async def test_retry_gives_up_on_connection_errors(retry_policy: RetryPolicy):
+    fake_gateway = FakeRouterGateway({OBJECT_URL: ClientConnectionError()})
+    gateway = RetryingGateway(fake_gateway, retry_policy)
+
+    with pytest.raises(ClientConnectionError):
+        async with gateway.make_request(HTTPMethod.GET, OBJECT_URL):
+            pass
+
+    assert len(fake_gateway.requests) == 3
+
+
+async def test_no_retry_on_client_errors(retry_policy: RetryPolicy):
+    fake_gateway = FakeRouterGateway(
+        {OBJECT_URL: make_error_response(OBJECT_URL, HTTPStatus.NOT_FOUND)}
+    )
+    metmuseum = MetMuseum(
+        gateway=RetryingGateway(fake_gateway, retry_policy), base_url="https://fake.url"
+    )
+
+    with pytest.raises(exceptions.ClientException):
+        await metmuseum.get_object(1)
+
+    assert len(fake_gateway.requests) == 1
+
+
+async def test_retry_after_header(retry_policy: RetryPolicy):
+    throttled_response = FakeResponse(
+        url=OBJECT_URL,
+        status_code=HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"Retry-After": "0"},
+        data=b"",
+    )
+    fake_gateway = FakeRouterGateway(
+        {OBJECT_URL: [throttled_response, make_object_response(1)]}
+    )
+    gateway = RetryingGateway(fake_gateway, retry_policy)
+
+    async with gateway.make_request(HTTPMethod.GET, OBJECT_URL) as response:
+        assert response.status_code == HTTPStatus.OK
+
+    assert len(fake_gateway.requests) == 2
+
+
+def test_retry_policy_delays():
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+
+    assert [policy.get_delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert policy.get_delay(1, {"Retry-After": "3"}) == 3
+    assert policy.get_delay(2, {"Retry-After": "invalid"}) == 2
+
+    policy = RetryPolicy(base_delay=1, max_delay=60, jitter=False)
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = policy.get_delay(1, {"Retry-After": format_datetime(retry_at)})
+    assert 28 <= delay <= 30
+
+
+def test_retry_after_is_capped_by_max_delay():
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+    retry_at = datetime.now(timezone.utc) + timedelta(days=1)
+
+    assert policy.get_delay(1, {"Retry-After": "86400"}) == 5
+    assert policy.get_delay(1, {"Retry-After": format_datetime(retry_at)}) == 5
+
+
+def test_retry_policy_full_jitter():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+
+    for attempt in range(1, 10):
+        assert 0 <= policy.get_delay(attempt) <= 4
+
+
+def test_retry_policy_with_invalid_params():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(base_delay=-1)
+    with pytest.raises(ValueError):
+        RetryingGateway(FakeRouterGateway({}), max_buffer_size=-1)
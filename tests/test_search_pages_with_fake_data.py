@@ -0,0 +1,137 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.search_pages import SearchPages
+from metmuseum.types import responses
+from tests.mocks import FakeRouterGateway
+from tests.mocks.fake_data import make_object_response
+from tests.mocks.fake_response import FakeResponse
+
+SEARCH_URL = "https://fake.url/search"
+
+
+def make_search_response(ids: list[int] | None) -> FakeResponse:
+    return FakeResponse(
+        url=SEARCH_URL,
+        status_code=HTTPStatus.OK,
+        headers={"Content-Type": "application/json"},
+        data=json.dumps({"total": len(ids or ()), "objectIDs": ids}).encode(),
+    )
+
+
+@pytest.fixture
+def gateway() -> FakeRouterGateway:
+    return FakeRouterGateway(
+        {SEARCH_URL: make_search_response(list(range(1, 8)))}
+        | {
+            f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+            for object_id in range(1, 8)
+        },
+        delay=0.01,
+    )
+
+
+def requested_ids(gateway: FakeRouterGateway) -> list[int]:
+    return sorted(
+        int(url.rsplit("/", 1)[1]) for _, url, _ in gateway.requests if url != SEARCH_URL
+    )
+
+
+async def test_pages_are_hydrated_in_order(gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    async with await metmuseum.search_objects("quail", page_size=3) as pages:
+        assert (pages.total, len(pages)) == (7, 3)
+        assert gateway.requests[0][2] == {"q": "quail"}
+
+        collected = [page async for page in pages]
+
+    assert [page.number for page in collected] == [0, 1, 2]
+    assert [list(page.ids) for page in collected] == [[1, 2, 3], [4, 5, 6], [7]]
+    assert [obj.id for page in collected for obj in page.objects] == list(range(1, 8))
+    assert all(
+        isinstance(obj, responses.ObjectResponse)
+        for page in collected
+        for obj in page.objects
+    )
+
+
+async def test_next_pages_are_prefetched(gateway: FakeRouterGateway):
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    async with await metmuseum.search_objects("quail", page_size=2, prefetch=2) as pages:
+        first_page = await pages.get_page(0)
+        await asyncio.sleep(0.05)
+
+        # pages 1 and 2 were loaded while page 0 was being consumed
+        assert [obj.id for obj in first_page.objects] == [1, 2]
+        assert requested_ids(gateway) == [1, 2, 3, 4, 5, 6]
+
+        assert [obj.id for obj in (await pages.get_page(2)).objects] == [5, 6]
+        await asyncio.sleep(0.05)
+
+        assert requested_ids(gateway) == list(range(1, 8))
+        with pytest.raises(IndexError):
+            await pages.get_page(4)
+
+
+async def test_search_objects_with_fields_and_no_results():
+    gateway = FakeRouterGateway(
+        {SEARCH_URL: make_search_response(None)}
+        | {"https://fake.url/objects/1": make_object_response(1)}
+    )
+    metmuseum = MetMuseum(gateway=gateway, base_url="https://fake.url")
+
+    pages = await metmuseum.search_objects("nothing", fields=iter(("title",)))
+
+    assert (pages.total, len(pages)) == (0, 0)
+    assert [page async for page in pages] == []
+
+
+async def test_failed_page_is_loaded_again():
+    calls = 0
+
+    async def hydrate(ids):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ConnectionError("boom")
+        return ()
+
+    pages: SearchPages = SearchPages([1, 2, 3], hydrate, page_size=3, prefetch=0)
+
+    with pytest.raises(ConnectionError):
+        await pages.get_page(0)
+    assert (await pages.get_page(0)).results == ()
+    assert calls == 2
+
+
+def test_search_pages_validate_arguments():
+    async def hydrate(ids):
+        return ()
+
+    with pytest.raises(ValueError):
+        SearchPages([1], hydrate, page_size=0)
+    with pytest.raises(ValueError):
+        SearchPages([1], hydrate, prefetch=-1)
+
+
+async def test_evicting_a_page_does_not_cancel_its_other_callers():
+    async def hydrate(ids):
+        await asyncio.sleep(0.02)
+        return ()
+
+    pages: SearchPages = SearchPages(list(range(10)), hydrate, page_size=2, prefetch=0)
+
+    # page 0 is evicted by the request for page 3 while the first caller waits
+    first = asyncio.create_task(pages.get_page(0))
+    await asyncio.sleep(0.005)
+    third = await pages.get_page(3)
+
+    assert (await first).number == 0
+    assert third.number == 3
+    await pages.close()
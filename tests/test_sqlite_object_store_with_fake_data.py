@@ -0,0 +1,114 @@
+from datetime import date, datetime, timezone
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from metmuseum.metmuseum import MetMuseum
+from metmuseum.stores import SqliteObjectStore
+from metmuseum.types import responses
+from tests.mocks import FakeResponse, FakeRouterGateway
+from tests.mocks.fake_data import make_object_data, make_object_response
+
+
+@pytest.fixture
+async def sqlite_object_store(tmp_path: Path):
+    async with SqliteObjectStore(tmp_path / "objects.sqlite3") as store:
+        yield store
+
+
+@pytest.fixture
+def fake_router_gateway() -> FakeRouterGateway:
+    routes = {
+        f"https://fake.url/objects/{object_id}": make_object_response(object_id)
+        for object_id in range(1, 4)
+    }
+    routes["https://fake.url/objects"] = FakeResponse(
+        url="https://fake.url/objects",
+        status_code=HTTPStatus.OK,
+        headers={},
+        data=b'{"total": 2, "objectIDs": [2, 3]}',
+    )
+    return FakeRouterGateway(routes)
+
+
+async def test_store_round_trip(sqlite_object_store: SqliteObjectStore):
+    obj = responses.ObjectResponse.model_validate_json(make_object_data(1))
+
+    await sqlite_object_store.put(obj)
+
+    assert await sqlite_object_store.get(1) == obj
+    assert await sqlite_object_store.get(2) is None
+    assert await sqlite_object_store.get_metadata_date(1) == datetime(
+        2020, 9, 14, 12, 26, 37, 480000, tzinfo=timezone.utc
+    )
+    assert await sqlite_object_store.count() == 1
+
+
+async def test_store_survives_reopening(tmp_path: Path):
+    path = tmp_path / "objects.sqlite3"
+    objs = [
+        responses.ObjectResponse.model_validate_json(make_object_data(object_id))
+        for object_id in range(1, 4)
+    ]
+
+    async with SqliteObjectStore(path) as store:
+        await store.put_many(objs)
+
+    async with SqliteObjectStore(path) as store:
+        assert await store.count() == 3
+        assert await store.get(2) == objs[1]
+        assert await store.delete((1, 2, 100)) == 2
+        assert await store.count() == 1
+
+
+async def test_get_object_reads_through_store(
+    sqlite_object_store: SqliteObjectStore, fake_router_gateway: FakeRouterGateway
+):
+    metmuseum = MetMuseum(
+        gateway=fake_router_gateway,
+        base_url="https://fake.url",
+        object_store=sqlite_object_store,
+    )
+
+    first = await metmuseum.get_object(1)
+    second = await metmuseum.get_object(1)
+
+    assert first == second
+    assert len(fake_router_gateway.requests) == 1
+    assert await sqlite_object_store.get(1) == first
+
+
+async def test_invalidate_changed_objects(
+    sqlite_object_store: SqliteObjectStore, fake_router_gateway: FakeRouterGateway
+):
+    metmuseum = MetMuseum(
+        gateway=fake_router_gateway,
+        base_url="https://fake.url",
+        object_store=sqlite_object_store,
+    )
+    for object_id in range(1, 4):
+        await metmuseum.get_object(object_id)
+
+    assert await metmuseum.invalidate_changed_objects(date(2024, 1, 1)) == 2
+    for object_id in range(1, 4):
+        await metmuseum.get_object(object_id)
+
+    assert [url for _, url, _ in fake_router_gateway.requests] == [
+        "https://fake.url/objects/1",
+        "https://fake.url/objects/2",
+        "https://fake.url/objects/3",
+        "https://fake.url/objects",
+        "https://fake.url/objects/2",
+        "https://fake.url/objects/3",
+    ]
+    assert fake_router_gateway.requests[3][2] == {"metadataDate": "2024-01-01"}
+
+
+async def test_invalidate_changed_objects_without_store(
+    fake_router_gateway: FakeRouterGateway,
+):
+    metmuseum = MetMuseum(gateway=fake_router_gateway, base_url="https://fake.url")
+
+    with pytest.raises(ValueError):
+        await metmuseum.invalidate_changed_objects(date(2024, 1, 1))
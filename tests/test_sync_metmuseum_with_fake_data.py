@@ -0,0 +1,131 @@
+import asyncio
+import os
+import signal
+import threading
+from typing import Iterator
+
+import pytest
+
+from metmuseum import SyncMetMuseum
+from metmuseum.testing import FakeMetServer, constant_latency
+from metmuseum.types import exceptions, records, responses
+from tests.mocks import FakeGateway
+from tests.mocks.fake_data import OBJECT_EXAMPLE, make_object_response
+
+OBJECTS = [OBJECT_EXAMPLE | {"objectID": object_id} for object_id in range(1, 11)]
+
+
+@pytest.fixture
+def client() -> Iterator[SyncMetMuseum]:
+    with SyncMetMuseum() as client:
+        server = FakeMetServer(objects=OBJECTS, latency=constant_latency(0.01))
+        # the server runs on the client's own loop thread
+        client.run(server.start())
+        client.metmuseum.base_url = server.url
+        yield client
+        client.run(server.close())
+
+
+def test_get_object(client: SyncMetMuseum):
+    object_response = client.get_object(1)
+
+    assert isinstance(object_response, responses.ObjectResponse)
+    assert object_response.id == 1
+    assert client.get_object(2, fields=("title",)).model_dump() == {
+        "id": 2,
+        "title": "Quail and Millet",
+    }
+
+    with pytest.raises(exceptions.ClientException):
+        client.get_object(404)
+
+
+def test_get_objects_returns_list_in_input_order(client: SyncMetMuseum):
+    object_results = client.get_objects([3, 1, 404, 2], concurrency=4)
+
+    assert [result.id for result in object_results] == [3, 1, 404, 2]
+    assert [result.ok for result in object_results] == [True, True, False, True]
+
+
+def test_get_objects_as_records(client: SyncMetMuseum):
+    object_results = client.get_objects([2, 1], as_records=True)
+
+    assert [type(result.response) for result in object_results] == [
+        records.ObjectRecord,
+        records.ObjectRecord,
+    ]
+    with pytest.raises(ValueError, match="as_records"):
+        client.get_objects([1], fields=("title",), as_records=True)
+
+
+def test_calls_share_one_loop_and_session(client: SyncMetMuseum):
+    loop_threads = {
+        client.run(_current_thread_name()),
+        client.run(_current_thread_name()),
+    }
+
+    client.list_objects()
+    client.list_objects(compact=True)
+
+    assert loop_threads == {"metmuseum-loop"}
+    assert client.metmuseum.gateway.is_started
+
+
+def test_calls_from_many_threads(client: SyncMetMuseum):
+    object_ids: list[int] = []
+
+    def worker(object_id: int) -> None:
+        object_ids.append(client.get_object(object_id).id)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(object_ids) == list(range(1, 11))
+
+
+def test_close_stops_the_loop():
+    client = SyncMetMuseum(gateway=FakeGateway(make_object_response(45734)))
+
+    assert client.get_object(45734).id == 45734
+    assert client.is_started
+
+    client.close()
+    client.close()
+
+    assert not client.is_started
+    assert not any(thread.name == "metmuseum-loop" for thread in threading.enumerate())
+
+
+def test_timeout():
+    with SyncMetMuseum(timeout=0.01) as client:
+        with pytest.raises(TimeoutError):
+            client.run(asyncio.sleep(1))
+
+
+async def _current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_child_raises_instead_of_blocking():
+    with SyncMetMuseum(gateway=FakeGateway(make_object_response(45734))) as client:
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                # a blocked call kills the child instead of hanging the test
+                signal.alarm(10)
+                try:
+                    client.get_object(45734)
+                except RuntimeError:
+                    client.close()
+                    exit_code = 0
+            finally:
+                os._exit(exit_code)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert client.get_object(45734).id == 45734